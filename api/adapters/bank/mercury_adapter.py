@@ -180,5 +180,4 @@ class MercuryAdapter(ResponseMixin):
             raise RuntimeError(error_message) from e
 
     def reset_mercury_cache(self):
-        self.cache_manager.delete(self.account_cache_key)
-        self.cache_manager.delete(self.recipient_cache_key)
\ No newline at end of file
+        self.cache_manager.delete_many([self.account_cache_key, self.recipient_cache_key])
\ No newline at end of file
@@ -221,6 +221,7 @@ class TokenAdapter(ResponseMixin):
     def _parse_logs(self, network, logs, decimals, counterparty):
         """Parse transfer logs into deposit records."""
         deposits = []
+        deposit_dates = self._get_dates_from_blocks(network, {log["blockNumber"] for log in logs})
 
         for log in logs:
             try:
@@ -230,7 +231,7 @@ class TokenAdapter(ResponseMixin):
                     "bank": "token",
                     "tx_hash": f"0x{log["transactionHash"].hex()}",
                     "deposit_amt": deposit_amt,
-                    "deposit_dt": self._get_date_from_block(network, log["blockNumber"]),
+                    "deposit_dt": deposit_dates[log["blockNumber"]],
                     'counterparty' : counterparty
                 })
             except Exception as e:
@@ -283,16 +284,19 @@ class TokenAdapter(ResponseMixin):
             log_error(self.logger, error_message)
             raise RuntimeError(error_message)
 
-    def _get_date_from_block(self, network, block_number):
-        """Retrieve the date from a block number."""
-        w3 = self.context.web3_manager.get_web3_instance(network)
-
+    def _get_dates_from_blocks(self, network, block_numbers):
+        """Retrieve the dates of several blocks in one JSON-RPC batch."""
         try:
-            block = w3.eth.get_block(block_number)
-            return datetime.datetime.fromtimestamp(block["timestamp"])
+            with self.context.web3_manager.batch(network) as batch:
+                blocks = {block_number: batch.get_block(block_number) for block_number in block_numbers}
+
+            return {
+                block_number: datetime.datetime.fromtimestamp(block.get()["timestamp"])
+                for block_number, block in blocks.items()
+            }
 
         except Exception as e:
-            error_message = f"Failed to get date from block"
+            error_message = f"Failed to get dates from blocks"
             log_error(self.logger, error_message)
             raise RuntimeError(error_message)
 
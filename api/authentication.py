@@ -31,22 +31,18 @@ class AWSSecretsAPIKeyAuthentication(BaseAuthentication):
 
         api_key = api_key.replace("Api-Key ", "", 1)
 
-        secrets_manager = SecretsManager()
-        valid_keys = secrets_manager.get_all_partner_keys()  # Expecting valid_keys to be a dictionary
-        master_key = secrets_manager.get_master_key()
+        # Hashed O(1) lookup; the index is rebuilt whenever the partner keys refresh
+        resolved = SecretsManager().resolve_api_key(api_key)
 
-        if master_key:
-            if api_key == master_key:
-                return (None, {'api_key': api_key, 'is_master_key': True})
+        if resolved is None:
+            log_error(logger, "Invalid API key provided.")
+            raise AuthenticationFailed('Invalid API key')
 
-        # Check if the provided API key matches any of the loaded keys
-        if api_key in valid_keys.values():
-            log_info(logger, "Successfully authenticated using API key.")
-            return (None, {'api_key': api_key, 'is_master_key': False})
+        party_code, is_master_key = resolved
+        log_info(logger, "Successfully authenticated using API key.")
 
-        # Log and raise an error if the API key doesn't match
-        log_error(logger, "Invalid API key provided: %s")
-        raise AuthenticationFailed('Invalid API key')
+        # DRF memoizes this on request.auth, so permission checks never authenticate again
+        return (None, {'api_key': api_key, 'is_master_key': is_master_key, 'party_code': party_code})
 
     def authenticate_header(self, request):
         """
@@ -47,8 +47,7 @@ class BaseAdvanceAPI(ResponseMixin):
 
     def add_advances(self, contract_type, contract_idx, advances):
         try:
-            self.cache_manager.delete(self.cache_manager.get_transaction_cache_key(contract_type, contract_idx))
-            self.cache_manager.delete(self.cache_manager.get_settlement_cache_key(contract_type, contract_idx))
+            self.cache_manager.invalidate_contract(contract_type, contract_idx)
 
             processed_count = 0
             for advance in advances:
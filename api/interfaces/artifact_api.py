@@ -1,7 +1,6 @@
 import logging
 import requests
 import boto3
-import time
 from datetime import datetime
 
 from rest_framework import status
@@ -29,40 +28,28 @@ class ArtifactAPI(ResponseMixin):
     def get_artifacts(self, contract_type, contract_idx, api_key=None, parties=[]):
         """Retrieve all artifacts for a contract."""
         try:
-            cache_key = self.cache_manager.get_artifact_cache_key(contract_type, contract_idx)
-            cached_artifacts = self.cache_manager.get(cache_key)
             success_message = f"Successfully retrieved artifacts for {contract_type}:{contract_idx}"
 
             contract_api = self.context.api_manager.get_contract_api(contract_type)
             contract = contract_api.get_contract(contract_type, contract_idx).get("data")
 
-            if cached_artifacts is not None:
-                log_info(self.logger, f"Loaded artifacts for {contract_type}:{contract_idx} from cache")
-                decrypted_artifacts = [
-                    self._decrypt_artifact(artifact, api_key, parties)
-                    for artifact in cached_artifacts
-                ]
-                return self._format_success(decrypted_artifacts, success_message, status.HTTP_200_OK)
-
-            network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-
-            raw_artifacts = web3_contract.functions.getArtifacts(contract['contract_idx']).call()
-
-            # parse the response from chain and add an encrypted presigned url
-            parsed_artifacts = [
-                self._build_artifact_dict(artifact, idx, contract_type, contract)
-                for idx, artifact in enumerate(raw_artifacts)
-            ]
-
             # The cache should expire at the same time a presigned url expires
             # Also only load encrypted artifacts into cache
-            self.cache_manager.set(cache_key, parsed_artifacts, timeout=self.expiration)
+            network = self.domain_manager.get_contract_network()
+            min_block = self.context.web3_manager.get_floor_block(network)
+            raw_artifacts = self.context.mirror_manager.read_items("artifact", contract_type, contract_idx, min_block)
+
+            if raw_artifacts is not None:
+                parsed_artifacts = self._parse_artifacts(contract_type, contract, raw_artifacts)
+            else:
+                parsed_artifacts = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_artifact_cache_key(contract_type, contract_idx),
+                    lambda: self._read_artifacts(contract_type, contract, network),
+                    timeout=self.expiration,
+                    min_block=min_block
+                )
 
-            decrypted_artifacts = [
-                self._decrypt_artifact(artifact, api_key, parties)
-                for artifact in parsed_artifacts
-            ]
+            decrypted_artifacts = self._decrypt_artifacts(parsed_artifacts, api_key, parties)
 
             return self._format_success(decrypted_artifacts, success_message, status.HTTP_200_OK)
 
@@ -73,6 +60,21 @@ class ArtifactAPI(ResponseMixin):
             error_message = f"Exception retrieving artifacts for {contract_type}:{contract_idx}: {str(e)}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _read_artifacts(self, contract_type, contract, network):
+        """Read a contract's artifacts from chain, each with an encrypted presigned url; returns (artifacts, read_block)."""
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        raw_artifacts = web3_contract.functions.getArtifacts(contract['contract_idx']).call(block_identifier=read_block)
+        return self._parse_artifacts(contract_type, contract, raw_artifacts), read_block
+
+    def _parse_artifacts(self, contract_type, contract, raw_artifacts):
+        """Build artifact dictionaries, each with a freshly signed and encrypted presigned url."""
+        encryptor = get_encryptor()
+        return [
+            self._build_artifact_dict(artifact, idx, contract_type, contract, encryptor)
+            for idx, artifact in enumerate(raw_artifacts)
+        ]
+
     def add_artifacts(self, contract_type, contract_idx, artifact_urls):
         """Add artifacts for a contract from URLs."""
         try:
@@ -91,12 +93,6 @@ class ArtifactAPI(ResponseMixin):
 
             data = {"count": processed_count}
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
-
-            cache_key = self.cache_manager.get_artifact_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-
             success_message = f"Added artifacts for {contract_type}:{contract_idx}"
             return self._format_success(data, success_message, status.HTTP_201_CREATED)
 
@@ -128,9 +124,6 @@ class ArtifactAPI(ResponseMixin):
             if tx_receipt["status"] != 1:
                 raise RuntimeError("Blockchain transaction to delete artifacts failed.")
 
-            cache_key = self.cache_manager.get_artifact_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-
             success_message = f"Artifacts delete for {contract_type}:{contract_idx}"
             return self._format_success({"count": processed_count}, success_message, status.HTTP_204_NO_CONTENT)
 
@@ -157,23 +150,30 @@ class ArtifactAPI(ResponseMixin):
             error_message = f"Failed to generate presigned URL: {str(e)}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def _decrypt_artifact(self, artifact, api_key, parties):
-
+    def _decrypt_artifacts(self, artifacts, api_key, parties):
+        """Resolve the decryptor once and decrypt every presigned url in one pass."""
         try:
             decryptor = get_decryptor(api_key, parties)
-            decrypted_presigned_url = decryptor.decrypt(artifact["presigned_url"])
+            decrypted_urls = decryptor.decrypt_many(
+                [artifact["presigned_url"] for artifact in artifacts],
+                workers=self.config_manager.get_decrypt_workers(),
+                parallel_threshold=self.config_manager.get_decrypt_parallel_threshold()
+            )
 
-            decrypted_artifact = artifact.copy()
-            decrypted_artifact["presigned_url"] = decrypted_presigned_url
+            decrypted_artifacts = []
+            for artifact, decrypted_presigned_url in zip(artifacts, decrypted_urls):
+                decrypted_artifact = artifact.copy()
+                decrypted_artifact["presigned_url"] = decrypted_presigned_url
+                decrypted_artifacts.append(decrypted_artifact)
 
-            return decrypted_artifact
+            return decrypted_artifacts
 
         except Exception as e:
-            error_message = f"Error decrypting artifact for {artifact["contract_type"]}:{artifact["contract_idx"]}: {e}"
+            error_message = f"Error decrypting artifacts: {e}"
             log_error(self.logger, error_message)
             raise RuntimeError(error_message) from e
 
-    def _build_artifact_dict(self, artifact, idx, contract_type, contract):
+    def _build_artifact_dict(self, artifact, idx, contract_type, contract, encryptor):
         """Build a dictionary representation of an artifact."""
         try:
             presigned_url_response = self.generate_presigned_url(
@@ -183,7 +183,6 @@ class ArtifactAPI(ResponseMixin):
             )
 
             presigned_url = presigned_url_response.get("data", {}).get("url", None)
-            encryptor = get_encryptor()
             encrypted_presigned_url = encryptor.encrypt(presigned_url)
 
             return {
@@ -1,6 +1,5 @@
 import logging
 import json
-import time
 from decimal import Decimal
 
 from rest_framework import status
@@ -14,6 +13,10 @@ from api.utilities.auxiliary import save_natural_language
 from api.utilities.logging import  log_error, log_info, log_warning
 
 class BaseContractAPI(ResponseMixin):
+
+    # Highest contract count seen per contract type in this process; counts only ever grow
+    _known_contract_counts = {}
+
     def __init__(self, context: AppContext):
         self.context = context
         self.config_manager = context.config_manager
@@ -26,85 +29,219 @@ class BaseContractAPI(ResponseMixin):
     def get_contract_count(self, contract_type):
         """Retrieve the total number of contracts from cache or Web3."""
         try:
-            cache_key = self.cache_manager.get_contract_count_cache_key(contract_type)
-            count = self.cache_manager.get(cache_key)
-
-            if count is not None:
-                log_info(self.logger, f"Loaded contract count for {contract_type} from cache: {count}")
-                return self._format_success({"count": count}, f"Retrieved count of contracts for {contract_type} (cached)", status.HTTP_200_OK)
-
-            # Fetch from blockchain if not in cache
             network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            count = web3_contract.functions.getContractCount().call()
+            min_block = self.context.web3_manager.get_floor_block(network)
+            count = self.context.mirror_manager.read_contract_count(contract_type, min_block)
 
-            self.cache_manager.set(cache_key, count, timeout=None)
-            log_info(self.logger, f"Cached contract count for {contract_type}: {count}")
+            if count is None:
+                count = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_contract_count_cache_key(contract_type),
+                    lambda: self._read_contract_count(contract_type, network),
+                    min_block=min_block
+                )
+            self._observe_contract_count(contract_type, count)
 
             return self._format_success({"count": count}, f"Retrieved count of contracts for {contract_type}", status.HTTP_200_OK)
 
         except Exception as e:
             return self._format_error(f"Error retrieving contract count: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def list_contracts(self, contract_type, api_key):
-        contracts = []
-        
+    def _read_contract_count(self, contract_type, network):
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        return web3_contract.functions.getContractCount().call(block_identifier=read_block), read_block
+
+    def is_known_contract_idx(self, contract_type, contract_idx):
+        """True if contract_idx is below a contract count this process has already seen."""
+        return contract_idx < self._known_contract_counts.get(contract_type, 0)
+
+    def _observe_contract_count(self, contract_type, count):
+        if count > self._known_contract_counts.get(contract_type, 0):
+            self._known_contract_counts[contract_type] = count
+
+    def list_contracts(self, contract_type, api_key, contract_idxs=None):
+        """List every contract of a type, paging through getContractSummaries rather than reading each contract.
+
+        With contract_idxs, only those contracts are listed, and only their transact_logic is decrypted.
+        """
         try:
-            cache_key = self.cache_manager.get_contract_list_cache_key(contract_type)
-            cached_contract_list = self.cache_manager.get(cache_key)
+            summaries = self._get_contract_summaries(contract_type)
 
-            if cached_contract_list:
-                log_info(self.logger, f"Loaded contract list {contract_type} from cache")
-                return self._format_success(cached_contract_list, f"Retrieved {contract_type} list (cached)", status.HTTP_200_OK)
+            if contract_idxs is not None:
+                summaries = [summaries[contract_idx] for contract_idx in sorted(set(contract_idxs)) if contract_idx < len(summaries)]
 
-            count_response = self.get_contract_count(contract_type)
-            if count_response["status"] != status.HTTP_200_OK:
-                return self._format_error(f"Could not retrieve contract count for {contract_type}", status.HTTP_500_INTERNAL_SERVER_ERROR)
+            contracts = self._parse_contract_summaries(contract_type, summaries, api_key)
+            return self._format_success(contracts, f"Retrieved contract_list {contract_type}", status.HTTP_200_OK)
+
+        except Exception as e:
+            return self._format_error(f"Unexpected error retrieving list of {contract_type} contracts", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-            contract_count = count_response["data"]["count"]
+    def _get_contract_summaries(self, contract_type):
+        # Cache the summaries with transact_logic still encrypted; each caller decrypts with their own key.
+        # Concurrent misses share one rebuild
+        network = self.domain_manager.get_contract_network()
+        min_block = self.context.web3_manager.get_floor_block(network)
+        summaries = self.context.mirror_manager.read_contract_summaries(contract_type, min_block)
+
+        if summaries is None:
+            summaries = self.cache_manager.get_or_compute(
+                self.cache_manager.get_contract_list_cache_key(contract_type),
+                lambda: self._read_contract_summaries(contract_type, network),
+                min_block=min_block
+            )
 
-            for contract_idx in range(contract_count):
-                contract_response = self.get_contract(contract_type, contract_idx, api_key)
-                if contract_response["status"] == status.HTTP_200_OK:
+        if None in summaries:
+            summaries = self._refresh_stale_summaries(contract_type, summaries)
 
-                    contract = {
-                        "contract_type": contract_type,
-                        "contract_idx": contract_idx,
-                        "contract_name": contract_response["data"].get("contract_name"),
-                        "is_active": contract_response["data"].get("is_active", True),
-                        "transact_logic": contract_response["data"].get("transact_logic", {}),
-                    }
+        return summaries
 
-                    contracts.append(contract)
+    def _read_contract_summaries(self, contract_type, network):
+        """Read every contract summary from chain, a page at a time; returns (summaries, read_block)."""
+        count_response = self.get_contract_count(contract_type)
+        if count_response["status"] != status.HTTP_200_OK:
+            raise RuntimeError(f"Could not retrieve contract count for {contract_type}")
 
-            self.cache_manager.set(cache_key, contracts, timeout=None)
-            log_info(self.logger, f"Cached contract list for {contract_type}: {len(contracts)} items")
+        contract_count = count_response["data"]["count"]
+        page_size = self.config_manager.get_contract_summary_page_size()
 
-            return self._format_success(contracts, f"Retrieved contract_list {contract_type}", status.HTTP_200_OK)
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+
+        summaries = []
+        for start in range(0, contract_count, page_size):
+            end = min(start + page_size, contract_count)
+            summaries.extend(
+                (start + offset, *summary)
+                for offset, summary in enumerate(web3_contract.functions.getContractSummaries(start, end).call(block_identifier=read_block))
+            )
 
+        log_info(self.logger, f"Read contract list for {contract_type}: {len(summaries)} items")
+        return summaries, read_block
+
+    def _refresh_stale_summaries(self, contract_type, summaries):
+        """Re-read only the list entries a write marked stale, in one JSON-RPC batch, and patch them into the cached list."""
+        network = self.domain_manager.get_contract_network()
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        stale = [contract_idx for contract_idx, summary in enumerate(summaries) if summary is None]
+
+        with self.context.web3_manager.batch(network) as batch:
+            results = {
+                contract_idx: batch.call(web3_contract.functions.getContractSummaries(contract_idx, contract_idx + 1), read_block or "latest")
+                for contract_idx in stale
+            }
+
+        refreshed = {contract_idx: (contract_idx, *result.get()[0]) for contract_idx, result in results.items()}
+        summaries = [refreshed.get(contract_idx, summary) for contract_idx, summary in enumerate(summaries)]
+
+        self.cache_manager.fill_stale_summaries(contract_type, refreshed)
+        log_info(self.logger, f"Refreshed {len(stale)} stale entries of contract list {contract_type}")
+
+        return summaries
+
+    def _parse_contract_summaries(self, contract_type, summaries, api_key):
+        """Build list entries from (contract_idx, contract_name, is_active, transact_logic) summaries."""
+        transact_logic = get_decryptor(api_key, []).decrypt_many(
+            [summary[3] for summary in summaries],
+            workers=self.config_manager.get_decrypt_workers(),
+            parallel_threshold=self.config_manager.get_decrypt_parallel_threshold()
+        )
+
+        return [
+            {
+                "contract_type": contract_type,
+                "contract_idx": contract_idx,
+                "contract_name": contract_name,
+                "is_active": is_active,
+                "transact_logic": transact_logic[idx],
+            }
+            for idx, (contract_idx, contract_name, is_active, _) in enumerate(summaries)
+        ]
+
+    def prefetch_contract_summaries(self, contract_type):
+        """Fill the cached contract list behind list_contracts, without decrypting it.
+
+        Best effort, like prefetch; the next list call reads whatever is still missing.
+        """
+        try:
+            self._get_contract_summaries(contract_type)
         except Exception as e:
-            return self._format_error(f"Unexpected error retrieving list of {contract_type} contracts", status.HTTP_500_INTERNAL_SERVER_ERROR)
+            log_warning(self.logger, f"Prefetch of contract list {contract_type} failed: {str(e)}")
+
+    def prefetch(self, contract_type, contract_idx, families=("contract", "party", "transaction", "settlement")):
+        """Fill a contract's cold cache entries with one JSON-RPC batch instead of one eth_call per getter.
 
+        Best effort: whatever fails here is fetched again by the API that owns it.
+        """
+        self.prefetch_many(contract_type, [contract_idx], families)
+
+    def prefetch_many(self, contract_type, contract_idxs, families=("contract", "party", "transaction", "settlement")):
+        """Fill the cold cache entries of several contracts with one cache round trip and one JSON-RPC batch.
+
+        Best effort, like prefetch. Returns (filled, failed): the number of entries cached and the number of reads that failed.
+        """
+        getters = {
+            "contract": (self.cache_manager.get_contract_cache_key, "getContract"),
+            "party": (self.cache_manager.get_party_cache_key, "getParties"),
+            "transaction": (self.cache_manager.get_transaction_cache_key, "getTransactions"),
+            "settlement": (self.cache_manager.get_settlement_cache_key, "getSettlements"),
+        }
+
+        try:
+            network = self.domain_manager.get_contract_network()
+            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+            read_block = self.context.web3_manager.get_read_block(network)
+
+            self.cache_manager.prime_contract_generations([(contract_type, contract_idx) for contract_idx in contract_idxs])
+            cache_keys = {
+                (contract_idx, family): getters[family][0](contract_type, contract_idx)
+                for contract_idx in contract_idxs for family in families
+            }
+            cached = self.cache_manager.get_many(list(cache_keys.values()))
+            pending = {}
+
+            with self.context.web3_manager.batch(network) as batch:
+                for (contract_idx, family), cache_key in cache_keys.items():
+                    if cache_key not in cached:
+                        contract_function = getattr(web3_contract.functions, getters[family][1])(contract_idx)
+                        pending[(contract_idx, family)] = (cache_key, batch.call(contract_function, read_block or "latest"))
+
+            fetched = {}
+            failed = 0
+            for (contract_idx, family), (cache_key, result) in pending.items():
+                if result.error is not None:
+                    log_warning(self.logger, f"Prefetch of {family} for {contract_type}:{contract_idx} failed: {result.error}")
+                    failed += 1
+                    continue
+
+                value = result.get()
+                if family == "party":
+                    value = self.context.api_manager.get_party_api().parse_parties(contract_type, contract_idx, value)
+
+                fetched[cache_key] = value
+
+            self.cache_manager.set_many(fetched, timeout=None, block=read_block)
+            return len(fetched), failed
+
+        except Exception as e:
+            log_warning(self.logger, f"Prefetch failed for {contract_type}:{list(contract_idxs)}: {e}")
+            return 0, len(contract_idxs) * len(families)
 
     def get_contract(self, contract_type, contract_idx, api_key=None, parties=[]):
         """Retrieve a specific contract."""
         try:
-            cache_key = self.cache_manager.get_contract_cache_key(contract_type, contract_idx)
-            cached_contract = self.cache_manager.get(cache_key)
             decryptor = get_decryptor(api_key, parties)
 
-            if cached_contract:
-                log_info(self.logger, f"Loaded contract {contract_type}:{contract_idx} from cache")
-                parsed_contract = self._decrypt_fields(contract_idx, cached_contract, decryptor)
-                return self._format_success(parsed_contract, f"Retrieved {contract_type}:{contract_idx} (cached)", status.HTTP_200_OK)
-
-            log_info(self.logger, f"Retrieving contract {contract_type}:{contract_idx} for parties {parties}")
             network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            raw_contract = web3_contract.functions.getContract(contract_idx).call()
-
-            # Store contract data in Redis cache
-            self.cache_manager.set(cache_key, raw_contract, timeout=None)
+            min_block = self.context.web3_manager.get_floor_block(network)
+            raw_contract = self.context.mirror_manager.read_contract(contract_type, contract_idx, min_block)
+
+            if raw_contract is None:
+                raw_contract = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_contract_cache_key(contract_type, contract_idx),
+                    lambda: self._read_contract(contract_type, contract_idx, network),
+                    min_block=min_block
+                )
             parsed_contract = self._decrypt_fields(contract_idx, raw_contract, decryptor)
 
             return self._format_success(parsed_contract, f"Retrieved {contract_type}:{contract_idx}", status.HTTP_200_OK)
@@ -113,13 +250,15 @@ class BaseContractAPI(ResponseMixin):
         except Exception as e:
             return self._format_error(f"Unexpected error retrieving contract {contract_type}:{contract_idx}: {str(e)}", status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def add_contract(self, contract_type, contract_dict):
-        try:
-            response = self.get_contract_count(contract_type)
-            if response["status"] != status.HTTP_200_OK:
-                raise RuntimeError("Error retrieving count of contracts")
+    def _read_contract(self, contract_type, contract_idx, network):
+        log_info(self.logger, f"Retrieving contract {contract_type}:{contract_idx} from chain")
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        return web3_contract.functions.getContract(contract_idx).call(block_identifier=read_block), read_block
 
-            contract_idx = response["data"]["count"]
+    def add_contract(self, contract_type, contract_dict, async_mode=False):
+        """Add a contract. In async mode, return the job once broadcast and finish the bookkeeping on confirmation."""
+        try:
             log_info(self.logger, f"Building contract {contract_dict}")
 
             # is_active must be: 
@@ -130,21 +269,30 @@ class BaseContractAPI(ResponseMixin):
             contract = self._build_contract(contract_dict)
             log_info(self.logger, f"Built contract {contract}")
 
-            log_info(self.logger, f"Adding {contract_type}:{contract_idx} with data {contract}")
+            # The index is assigned on chain and read back from the ContractAdded log, so concurrent creates never collide
+            log_info(self.logger, f"Adding {contract_type} contract with data {contract}")
             network = self.domain_manager.get_contract_network()
             web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
 
             transaction = web3_contract.functions.addContract(contract).build_transaction()
-            network = self.domain_manager.get_contract_network()
-            tx_receipt = self.context.web3_manager.send_signed_transaction(transaction, self.wallet_addr, contract_type, contract_idx, network)
 
-            if tx_receipt["status"] == 1:
-                # Sleep to give time for transaction to complete
-                time.sleep(self.config_manager.get_network_sleep_time())
-                self.cache_manager.delete( self.cache_manager.get_contract_count_cache_key(contract_type))
-                self.cache_manager.delete(self.cache_manager.get_contract_list_cache_key(contract_type))
+            # Lets the cached contract list grow by one entry instead of being rebuilt
+            event_data = {"ContractAdded": (contract_dict["contract_name"], False, contract[self.TRANSACT_LOGIC_IDX])}
 
-                self._generate_natural_language(contract_type, contract_idx, contract_dict)
+            if async_mode:
+                job = self.context.job_manager.submit(
+                    "addContract", [transaction], self.wallet_addr, contract_type, None,
+                    on_confirmed=lambda tx_receipts: self._on_contract_added(contract_type, tx_receipts[0], contract_dict),
+                    event_data=event_data
+                )
+                return self._format_success(job, f"Contract {contract_type} submitted", status.HTTP_202_ACCEPTED)
+
+            tx_receipt = self.context.web3_manager.send_signed_transaction(
+                transaction, self.wallet_addr, contract_type, None, network, event_data=event_data
+            )
+
+            if tx_receipt["status"] == 1:
+                contract_idx = self._on_contract_added(contract_type, tx_receipt, contract_dict)
                 return self._format_success({"contract_idx": contract_idx}, f"Contract {contract_type}:{contract_idx} created", status.HTTP_201_CREATED)
             else:
                 raise RuntimeError("Error adding contract")
@@ -162,14 +310,18 @@ class BaseContractAPI(ResponseMixin):
             transaction = web3_contract.functions.updateContract(contract_idx, contract).build_transaction()
             network = self.domain_manager.get_contract_network()
 
-            tx_receipt = self.context.web3_manager.send_signed_transaction(transaction, self.wallet_addr, contract_type, contract_idx, network)
+            # Patch this contract's entry of the cached list rather than rebuilding the whole list
+            event_data = {"ContractUpdated": {
+                "contract_name": contract_dict["contract_name"],
+                "is_active": contract_dict["is_active"],
+                "transact_logic": contract[self.TRANSACT_LOGIC_IDX],
+            }}
+
+            tx_receipt = self.context.web3_manager.send_signed_transaction(
+                transaction, self.wallet_addr, contract_type, contract_idx, network, event_data=event_data
+            )
     
             if tx_receipt["status"] == 1:
-                # Sleep to give time for transaction to complete
-                time.sleep(self.config_manager.get_network_sleep_time())
-                self.cache_manager.delete(self.cache_manager.get_contract_cache_key(contract_type, contract_idx))
-                self.cache_manager.delete(self.cache_manager.get_contract_list_cache_key(contract_type))
-
                 self._generate_natural_language(contract_type, contract_idx, contract_dict)
                 return self._format_success({"contract_idx": contract_idx}, f"Contract {contract_type}:{contract_idx} updated", status.HTTP_200_OK)
             else:
@@ -195,11 +347,6 @@ class BaseContractAPI(ResponseMixin):
             tx_receipt = self.context.web3_manager.send_signed_transaction(transaction, self.wallet_addr, contract_type, contract_idx, network)
 
             if tx_receipt["status"] == 1:
-                # Sleep to give time for transaction to complete
-                time.sleep(self.config_manager.get_network_sleep_time())
-                self.cache_manager.delete(self.cache_manager.get_contract_cache_key(contract_type, contract_idx))
-                self.cache_manager.delete(self.cache_manager.get_contract_list_cache_key(contract_type))
-
                 return self._format_success( {"contract_idx":contract_idx}, f"Contract {contract_type}:{contract_idx} deleted", status.HTTP_204_NO_CONTENT)
             else:
                 raise RuntimeError(f"Transaction failed for {contract_type}:{contract_idx}.")
@@ -218,17 +365,13 @@ class BaseContractAPI(ResponseMixin):
             # Build transaction using activateContract
             transaction = web3_contract.functions.activateContract(contract_idx).build_transaction()
             tx_receipt = self.context.web3_manager.send_signed_transaction(
-                transaction, self.wallet_addr, contract_type, contract_idx, network
+                transaction, self.wallet_addr, contract_type, contract_idx, network,
+                event_data={"ContractActivated": {"is_active": True}}
             )
 
             if tx_receipt["status"] != 1:
                 raise RuntimeError(f"Transaction failed while activating contract {contract_type}:{contract_idx}")
 
-            # Sleep and invalidate cache
-            time.sleep(self.config_manager.get_network_sleep_time())
-            self.cache_manager.delete(self.cache_manager.get_contract_cache_key(contract_type, contract_idx))
-            self.cache_manager.delete(self.cache_manager.get_contract_list_cache_key(contract_type))
-
             return self._format_success(
                 {"contract_idx": contract_idx},
                 f"Contract {contract_type}:{contract_idx} activated",
@@ -241,6 +384,16 @@ class BaseContractAPI(ResponseMixin):
                 status.HTTP_500_INTERNAL_SERVER_ERROR
             )
 
+    def _on_contract_added(self, contract_type, tx_receipt, contract_dict):
+        """Bookkeeping for a confirmed addContract. Returns the new contract's index."""
+        contract_idx = self.context.web3_manager.get_added_contract_idx(tx_receipt)
+        if contract_idx is None:
+            raise RuntimeError("addContract receipt has no ContractAdded event")
+
+        self._observe_contract_count(contract_type, contract_idx + 1)
+        self._generate_natural_language(contract_type, contract_idx, contract_dict)
+        return contract_idx
+
     def _generate_natural_language(self, contract_type, contract_idx, contract_dict):
         # Update natural language for transaction logic
         contract_release = self.config_manager.get_contract_release(contract_type)
@@ -255,6 +408,9 @@ class BaseContractAPI(ResponseMixin):
 
 ### **Subclass for Purchase Contracts**
 class PurchaseContractAPI(BaseContractAPI):
+    # Position of the encrypted transact_logic in the contract tuple
+    TRANSACT_LOGIC_IDX = 5
+
     def _decrypt_fields(self, contract_idx, raw_contract, decryptor):
         """Decrypt sensitive fields of a contract."""
         try:
@@ -296,6 +452,8 @@ class PurchaseContractAPI(BaseContractAPI):
         ]
 
 class SaleContractAPI(BaseContractAPI):
+    TRANSACT_LOGIC_IDX = 7
+
     def _decrypt_fields(self, contract_idx, raw_contract, decryptor):
         """Decrypt sensitive fields of a contract."""
         try:
@@ -344,6 +502,8 @@ class SaleContractAPI(BaseContractAPI):
 
 ### **Subclass for Advance Contracts**
 class AdvanceContractAPI(BaseContractAPI):
+    TRANSACT_LOGIC_IDX = 9
+
     def _decrypt_fields(self, contract_idx, raw_contract, decryptor):
         """Decrypt sensitive fields of a contract."""
         try:
@@ -63,15 +63,15 @@ class BaseDepositAPI(ResponseMixin):
             error_message = f"Unexpected error retrieving deposits for contract {contract_idx}: {str(e)}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def add_deposit(self, contract_type, contract_idx, deposit):
-        """Post deposit to the blockchain."""
+    def add_deposit(self, contract_type, contract_idx, deposit, async_mode=False):
+        """Post deposit to the blockchain. In async mode, return the job once broadcast."""
         log_info(self.logger, f"Deposit to post: {deposit}")
 
         try:
-            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
+            if async_mode:
+                transaction = self._build_deposit(contract_type, contract_idx, deposit)
+                job = self.context.job_manager.submit("postSettlement", [transaction], self.wallet_addr, contract_type, contract_idx)
+                return self._format_success(job, "Submitted deposit", status.HTTP_202_ACCEPTED)
 
             self._process_deposit(contract_type, contract_idx, deposit)
             return self._format_success({"count": 1},"Added deposit",status.HTTP_201_CREATED)
@@ -84,6 +84,11 @@ class BaseDepositAPI(ResponseMixin):
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
 
+    def _process_deposit(self, contract_type, contract_idx, deposit):
+        """Build and send a single deposit."""
+        transaction = self._build_deposit(contract_type, contract_idx, deposit)
+        self._send_transaction(transaction, contract_type, contract_idx)
+
     def _convert_to_midnight_timestamp(self, deposit_dt):
         """Convert a datetime to a timestamp at midnight UTC."""
         try:
@@ -110,8 +115,8 @@ class BaseDepositAPI(ResponseMixin):
 
 ### **Subclass for Advance Contracts**
 class AdvanceDepositAPI(BaseDepositAPI):
-    def _process_deposit(self, contract_type, contract_idx, deposit):
-        """Process a single deposit."""
+    def _build_deposit(self, contract_type, contract_idx, deposit):
+        """Build the postSettlement transaction for a single deposit."""
         try:
             payment_amt = int(Decimal(deposit["deposit_amt"]) * 100)
             settlement_timestamp = self._convert_to_midnight_timestamp(deposit["deposit_dt"])
@@ -119,8 +124,7 @@ class AdvanceDepositAPI(BaseDepositAPI):
             dispute_reason = deposit.get("dispute_reason", "")
             tx_hash = deposit.get("tx_hash", "")
 
-            transaction = self._build_transaction(contract_type, contract_idx, settle_idx, settlement_timestamp, payment_amt, tx_hash, dispute_reason)
-            self._send_transaction(transaction, contract_type, contract_idx)
+            return self._build_transaction(contract_type, contract_idx, settle_idx, settlement_timestamp, payment_amt, tx_hash, dispute_reason)
 
         except Exception as e:
             error_message = f"Error processing deposit {deposit.get('tx_hash')} for {contract_type}:{contract_idx}: {str(e)}"
@@ -143,8 +147,8 @@ class AdvanceDepositAPI(BaseDepositAPI):
 
 ### **Subclass for Sale Contracts**
 class SaleDepositAPI(BaseDepositAPI):
-    def _process_deposit(self, contract_type, contract_idx, deposit):
-        """Process a single deposit."""
+    def _build_deposit(self, contract_type, contract_idx, deposit):
+        """Build the postSettlement transaction for a single deposit."""
         try:
             payment_amt = int(Decimal(deposit["deposit_amt"]) * 100)
             settlement_timestamp = self._convert_to_midnight_timestamp(deposit["deposit_dt"])
@@ -152,8 +156,7 @@ class SaleDepositAPI(BaseDepositAPI):
             dispute_reason = deposit.get("dispute_reason", "")
             tx_hash = deposit.get("tx_hash", "")
 
-            transaction = self._build_transaction(contract_type, contract_idx, settle_idx, settlement_timestamp, payment_amt, tx_hash)
-            self._send_transaction(transaction, contract_type, contract_idx)
+            return self._build_transaction(contract_type, contract_idx, settle_idx, settlement_timestamp, payment_amt, tx_hash)
 
         except Exception as e:
             error_message = f"Error processing deposit {deposit.get('tx_hash')} for {contract_type}:{contract_idx}: {str(e)}"
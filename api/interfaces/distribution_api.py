@@ -60,8 +60,7 @@ class BaseDistributionAPI(ResponseMixin):
     def add_distributions(self, contract_type, contract_idx, distributions):
         """Add distribution payments for a contract."""
         try:
-            self.cache_manager.delete(self.cache_manager.get_transaction_cache_key(contract_type, contract_idx))
-            self.cache_manager.delete(self.cache_manager.get_settlement_cache_key(contract_type, contract_idx))
+            self.cache_manager.invalidate_contract(contract_type, contract_idx)
 
             processed_count = 0
             for distribution in distributions:
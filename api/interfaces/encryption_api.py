@@ -1,14 +1,50 @@
 import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from cryptography.fernet import Fernet
 
 from api.interfaces.mixins import ResponseMixin
 from api.utilities.logging import  log_error, log_info, log_warning
 from api.managers.secrets_manager import SecretsManager
 
+# Fernet objects are immutable and thread-safe, so one per key is shared by the whole process
+_cipher_pool = {}
+_cipher_pool_lock = threading.Lock()
+
+def get_cipher(encryption_key: bytes) -> Fernet:
+    """Return the pooled Fernet cipher for a key, creating it on first use."""
+    cipher = _cipher_pool.get(encryption_key)
+
+    if cipher is None:
+        with _cipher_pool_lock:
+            cipher = _cipher_pool.get(encryption_key)
+            if cipher is None:
+                cipher = Fernet(encryption_key)
+                _cipher_pool[encryption_key] = cipher
+
+    return cipher
+
+# Bulk decryption pools, one per worker count; the cryptography backend releases the GIL during AES/HMAC
+_decrypt_executors = {}
+_decrypt_executors_lock = threading.Lock()
+
+def get_decrypt_executor(workers: int) -> ThreadPoolExecutor:
+    """Return the shared thread pool used for bulk decryption with the given worker count."""
+    executor = _decrypt_executors.get(workers)
+
+    if executor is None:
+        with _decrypt_executors_lock:
+            executor = _decrypt_executors.get(workers)
+            if executor is None:
+                executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="decrypt")
+                _decrypt_executors[workers] = executor
+
+    return executor
+
 class Encryptor(ResponseMixin):
     def __init__(self, encryption_key: bytes):
-        self.cipher = Fernet(encryption_key)
+        self.cipher = get_cipher(encryption_key)
         self.logger = logging.getLogger(__name__)
 
     def encrypt(self, data: dict) -> str:
@@ -16,6 +52,10 @@ class Encryptor(ResponseMixin):
         encrypted_text = self.cipher.encrypt(json_str.encode())
         return encrypted_text.decode()
 
+    def encrypt_many(self, objs: list) -> list:
+        """Encrypt a list of values, preserving order."""
+        return [self.encrypt(obj) for obj in objs]
+
 def get_aes_key_for_encryption():
     """Retrieve the AES key from the loaded secrets for encryption using SecretsManager."""
     secrets_manager = SecretsManager()
@@ -41,7 +81,7 @@ class Decryptor(ResponseMixin):
     def __init__(self, encryption_key: bytes = None):
         self.logger = logging.getLogger(__name__)
         if encryption_key:
-            self.cipher = Fernet(encryption_key)
+            self.cipher = get_cipher(encryption_key)
         else:
             self.cipher = None  # No decryption will be done if no key is provided
 
@@ -56,31 +96,48 @@ class Decryptor(ResponseMixin):
         else:
             return "encrypted data"  # Return 'encrypted data' if no key is available
 
+    def decrypt_many(self, tokens: list, workers: int = 1, parallel_threshold: int = None) -> list:
+        """Decrypt a list of tokens, preserving order. Failed tokens become 'encrypted data'.
+
+        Lists of at least parallel_threshold tokens are split into chunks and decrypted on a shared thread pool.
+        """
+        if not self.cipher:
+            return ["encrypted data"] * len(tokens)
+
+        if workers <= 1 or parallel_threshold is None or len(tokens) < parallel_threshold:
+            return [self.decrypt(token) for token in tokens]
+
+        # A few chunks per worker keeps the pool busy without paying per-token scheduling overhead
+        chunk_size = max(1, -(-len(tokens) // (workers * 4)))
+        chunks = [tokens[i:i + chunk_size] for i in range(0, len(tokens), chunk_size)]
+
+        decrypted = []
+        for chunk_result in get_decrypt_executor(workers).map(self._decrypt_chunk, chunks):
+            decrypted.extend(chunk_result)
+        return decrypted
+
+    def _decrypt_chunk(self, tokens: list) -> list:
+        return [self.decrypt(token) for token in tokens]
+
 def get_aes_key_for_decryption(api_key: str, parties: list):
     """Retrieve the AES key for decryption using SecretsManager."""
     secrets_manager = SecretsManager()
 
-    # Check for the MASTER_KEY
-    master_key = secrets_manager.get_master_key()
-    if master_key and api_key == master_key:
-        return secrets_manager.get_aes_key()
-        
-    # Retrieve all partner keys from SecretsManager
-    partner_keys = secrets_manager.get_all_partner_keys()
+    resolved = secrets_manager.resolve_api_key(api_key)
+    if resolved is None:
+        return None
 
-    # Match with party API keys
-    for party in parties:
-        party_code = party.get("party_code")
-        party_api_key = partner_keys.get(party_code)  # Ensure mapping exists
+    party_code, is_master_key = resolved
 
-        if party_api_key and party_api_key == api_key:
-            return secrets_manager.get_aes_key()  # Return AES key if match found
+    # The master key, or a partner key belonging to one of the contract parties, can decrypt
+    if is_master_key or party_code in {party.get("party_code") for party in parties}:
+        return secrets_manager.get_aes_key()
 
     # If no match is found, return None (this will signal to return 'encrypted data')
     return None
 
 def get_decryptor(api_key: str, parties: list):
-    """Create a Decryptor instance for decryption."""
+    """Create a Decryptor instance for decryption. Resolve it once per request and reuse it for every row."""
 
     # Get the AES key for decryption
     aes_key = get_aes_key_for_decryption(api_key, parties)
@@ -89,4 +146,4 @@ def get_decryptor(api_key: str, parties: list):
         decryption_key = aes_key.encode()  # Ensure the key is in bytes
         return Decryptor(decryption_key)
     else:
-        return Decryptor()  # No key provided, return 'encrypted data'
\ No newline at end of file
+        return Decryptor()  # No key provided, return 'encrypted data'
@@ -1,5 +1,4 @@
 import logging
-import time
 from datetime import datetime
 
 from rest_framework import status
@@ -24,24 +23,19 @@ class PartyAPI(ResponseMixin):
     def get_parties(self, contract_type, contract_idx):
         """Retrieve parties for a given contract."""
         try:
-            cache_key = self.cache_manager.get_party_cache_key(contract_type, contract_idx)
-            cached_parties = self.cache_manager.get(cache_key)
-            success_message = f"Successfully retrieved parties for {contract_type}:{contract_idx}"
-
-            if cached_parties is not None:
-                log_info(self.logger, f"Loaded parties for {contract_type}:{contract_idx} from cache")
-                return self._format_success(cached_parties, success_message, status.HTTP_200_OK)
- 
             network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            raw_parties = web3_contract.functions.getParties(contract_idx).call()
-
-            parties = [
-                self._build_party_dict(raw_party, idx, contract_type, contract_idx)
-                for idx, raw_party in enumerate(raw_parties)
-            ]
+            min_block = self.context.web3_manager.get_floor_block(network)
+            raw_parties = self.context.mirror_manager.read_items("party", contract_type, contract_idx, min_block)
+
+            if raw_parties is not None:
+                parties = self.parse_parties(contract_type, contract_idx, raw_parties)
+            else:
+                parties = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_party_cache_key(contract_type, contract_idx),
+                    lambda: self._read_parties(contract_type, contract_idx, network),
+                    min_block=min_block
+                )
 
-            self.cache_manager.set(cache_key, parties, timeout=None)
             return self._format_success(parties, f"Retrieved parties for {contract_type}:{contract_idx}", status.HTTP_200_OK)
 
         except ValidationError as e:
@@ -51,29 +45,23 @@ class PartyAPI(ResponseMixin):
             error_message = f"Error retrieving parties for {contract_type}:{contract_idx}: {str(e)}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _read_parties(self, contract_type, contract_idx, network):
+        """Read and parse a contract's parties from chain; returns (parties, read_block)."""
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        raw_parties = web3_contract.functions.getParties(contract_idx).call(block_identifier=read_block)
+        return self.parse_parties(contract_type, contract_idx, raw_parties), read_block
+
     def get_party_list(self, contracts, party_code):
         """Filter contracts where the given party_code is listed as a party."""
         try:
             filtered_contracts = []
-            network = self.domain_manager.get_contract_network()
+            contract_parties = self._get_parties_many(
+                [(contract.get("contract_type"), contract.get("contract_idx")) for contract in contracts]
+            )
 
             for contract in contracts:
-                contract_type = contract.get("contract_type")
-                contract_idx = contract.get("contract_idx")
-
-                cache_key_parties = self.cache_manager.get_party_cache_key(contract_type, contract_idx)
-                cached_parties = self.cache_manager.get(cache_key_parties)
-
-                if cached_parties is None:
-                    web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-                    raw_parties = web3_contract.functions.getParties(contract_idx).call()
-                    parties = [
-                        self._build_party_dict(raw_party, idx, contract_type, contract_idx)
-                        for idx, raw_party in enumerate(raw_parties)
-                    ]
-                    self.cache_manager.set(cache_key_parties, parties, timeout=None)
-                else:
-                    parties = cached_parties
+                parties = contract_parties[(contract.get("contract_type"), contract.get("contract_idx"))]
 
                 if any(p["party_code"].lower() == party_code.lower() for p in parties):
                     filtered_contracts.append(contract)
@@ -84,24 +72,105 @@ class PartyAPI(ResponseMixin):
             error_message = f"Error filtering contracts for {party_code}: {str(e)}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def add_parties(self, contract_type, contract_idx, parties):
-        """Add parties to a given contract."""
+    def get_party_contracts(self, party_code):
+        """Return (contract_type, contract_idx) of every contract listing party_code, from the party code index.
+
+        The index lives in the mirror when the party endpoint reads from it, otherwise in the cache, where party
+        events keep it current. A missing cache index is rebuilt with one scan of every contract's parties.
+        """
         try:
+            network = self.domain_manager.get_contract_network()
+            contract_keys = self.context.mirror_manager.read_party_contracts(
+                party_code, self.context.web3_manager.get_floor_block(network)
+            )
+
+            if contract_keys is None:
+                contract_keys = self.cache_manager.get_party_code_index(party_code)
+
+            if contract_keys is None:
+                contract_keys = sorted(self._build_party_code_index().get(party_code.lower(), []))
+
+            return self._format_success(contract_keys, f"Retrieved contracts for {party_code}", status.HTTP_200_OK)
+
+        except Exception as e:
+            error_message = f"Error retrieving contracts for {party_code}: {str(e)}"
+            return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _build_party_code_index(self):
+        """Read the parties of every contract and store the {party_code: {(contract_type, contract_idx)}} index."""
+        version = self.cache_manager.get_party_code_index_version()
+        contract_keys = []
+
+        for contract_type in self.domain_manager.get_contract_types():
+            count_response = self.context.api_manager.get_contract_api(contract_type).get_contract_count(contract_type)
+            if count_response["status"] != status.HTTP_200_OK:
+                raise RuntimeError(f"Could not retrieve contract count for {contract_type}")
+            contract_keys.extend((contract_type, contract_idx) for contract_idx in range(count_response["data"]["count"]))
+
+        index = {}
+        for contract_key, parties in self._get_parties_many(contract_keys).items():
+            for party in parties:
+                index.setdefault(party["party_code"].lower(), set()).add(contract_key)
+
+        stored = self.cache_manager.store_party_code_index(index, version)
+        log_info(self.logger, f"Built party code index over {len(contract_keys)} contracts ({len(index)} party codes, stored={stored})")
+        return index
+
+    def _get_parties_many(self, contract_keys):
+        """Return {(contract_type, contract_idx): parties}, with one cache round trip and one JSON-RPC batch for the misses."""
+        network = self.domain_manager.get_contract_network()
+
+        self.cache_manager.prime_contract_generations(contract_keys)
+        cache_keys = {
+            (contract_type, contract_idx): self.cache_manager.get_party_cache_key(contract_type, contract_idx)
+            for contract_type, contract_idx in contract_keys
+        }
+        cached_parties = self.cache_manager.get_many(list(cache_keys.values()))
+        missing = [contract_key for contract_key, cache_key in cache_keys.items() if cache_key not in cached_parties]
+
+        if missing:
+            read_block = self.context.web3_manager.get_read_block(network)
+
+            with self.context.web3_manager.batch(network) as batch:
+                results = {
+                    (contract_type, contract_idx): batch.call(
+                        self.context.web3_manager.get_web3_contract(contract_type, network).functions.getParties(contract_idx),
+                        read_block or "latest"
+                    )
+                    for contract_type, contract_idx in missing
+                }
+
+            fetched = {
+                cache_keys[(contract_type, contract_idx)]: self.parse_parties(contract_type, contract_idx, result.get())
+                for (contract_type, contract_idx), result in results.items()
+            }
+            self.cache_manager.set_many(fetched, timeout=None, block=read_block)
+            cached_parties.update(fetched)
+
+        return {contract_key: cached_parties[cache_key] for contract_key, cache_key in cache_keys.items()}
+
+    def add_parties(self, contract_type, contract_idx, parties, async_mode=False):
+        """Add parties to a given contract. In async mode, return the job once broadcast."""
+        try:
+            function_calls = []
+
             for party in parties:
                 party_addr = to_checksum_address(self.config_manager.get_party_address(party["party_code"]))
                 network = self.domain_manager.get_contract_network()
                 web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)             
                 log_info(self.logger, f"Adding party: {party["party_code"]} {party_addr} {party["party_type"]}")
-                function_call = web3_contract.functions.addParty(
+                function_calls.append(web3_contract.functions.addParty(
                     contract_idx, [party["party_code"], party_addr, party["party_type"], 0, ""]
-                )
-                self._send_transaction(function_call, contract_type, contract_idx, f"Failed to add party {party['party_code']}")
+                ))
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
+            if async_mode:
+                transactions = [function_call.build_transaction() for function_call in function_calls]
+                job = self.context.job_manager.submit("addParty", transactions, self.wallet_addr, contract_type, contract_idx)
+                success_message = f"Submitted {len(parties)} parties for {contract_type}:{contract_idx}"
+                return self._format_success(job, success_message, status.HTTP_202_ACCEPTED)
 
-            cache_key = self.cache_manager.get_party_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
+            for party, function_call in zip(parties, function_calls):
+                self._send_transaction(function_call, contract_type, contract_idx, f"Failed to add party {party['party_code']}")
 
             success_message = f"Successfully added {len(parties)} parties to {contract_type}:{contract_idx}"
             return self._format_success({"count" : len(parties)}, success_message, status.HTTP_201_CREATED)
@@ -126,12 +195,6 @@ class PartyAPI(ResponseMixin):
 
             self._send_transaction(function_call, contract_type, contract_idx,  f"Failed to approve party {party_idx} on {contract_type}:{contract_idx}")
 
-            # Wait for transaction and clear cache
-            time.sleep(self.config_manager.get_network_sleep_time())
-
-            party_cache_key = self.cache_manager.get_party_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(party_cache_key)
-
             return self._format_success(
                 {"contract_idx": contract_idx, "party_idx": party_idx},
                 f"Approved party {party_idx} on {contract_type}:{contract_idx}",
@@ -166,12 +229,6 @@ class PartyAPI(ResponseMixin):
             function_call = web3_contract.functions.deleteParties(contract_idx)
             self._send_transaction(function_call, contract_type, contract_idx, "Failed to delete parties.")
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
-
-            cache_key = self.cache_manager.get_party_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-
             success_message = f"All parties deleted for {contract_type}:{contract_idx}"
             return self._format_success({"contract_idx":contract_idx}, success_message, status.HTTP_204_NO_CONTENT)
 
@@ -196,6 +253,13 @@ class PartyAPI(ResponseMixin):
             error_message = f"Error in transaction: {str(e)}" 
             self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def parse_parties(self, contract_type, contract_idx, raw_parties):
+        """Build party dictionaries from the raw getParties result."""
+        return [
+            self._build_party_dict(raw_party, idx, contract_type, contract_idx)
+            for idx, raw_party in enumerate(raw_parties)
+        ]
+
     def _build_party_dict(self, raw_party, party_idx, contract_type, contract_idx):
         """Create a dictionary structure for a party."""
         try:
@@ -43,10 +43,7 @@ class BaseResidualAPI(ResponseMixin):
     def add_residuals(self, contract_type, contract_idx, residuals):
         """Add residual payments for a contract."""
         try:
-            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
+            self.cache_manager.invalidate_contract(contract_type, contract_idx)
 
             processed_count = 0
             for residual in residuals:
@@ -1,5 +1,4 @@
 import logging
-import time
 from decimal import Decimal
 
 from rest_framework import status
@@ -24,32 +23,24 @@ class BaseSettlementAPI(ResponseMixin):
     def get_settlements(self, contract_type, contract_idx, api_key=None, parties=[]):
         """Retrieve all settlements for a given contract while ensuring only encrypted values are cached."""
         try:
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            cached_settlements = self.cache_manager.get(cache_key)
             success_message = f"Successfully retrieved settlements for {contract_type}:{contract_idx}"
 
             contract_api = self.context.api_manager.get_contract_api(contract_type)
             contract = contract_api.get_contract(contract_type, contract_idx, api_key, parties).get("data")
 
-            if cached_settlements is not None:
-                log_info(self.logger, f"Loaded settlements for {contract_type}:{contract_idx} from cache")
-                parsed_settlements = [
-                    self._build_settlement_dict(settlement, idx, contract_type, contract, api_key, parties)
-                    for idx, settlement in enumerate(cached_settlements)
-                ]
-                log_info(self.logger, f"Returning parsed settlements {parsed_settlements}")
-                return self._format_success(parsed_settlements, success_message, status.HTTP_200_OK)
-
             network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            raw_settlements = web3_contract.functions.getSettlements(contract["contract_idx"]).call()
+            min_block = self.context.web3_manager.get_floor_block(network)
+            raw_settlements = self.context.mirror_manager.read_items("settlement", contract_type, contract_idx, min_block)
 
-            self.cache_manager.set(cache_key, raw_settlements, timeout=None)
+            if raw_settlements is None:
+                # Concurrent misses after an invalidation share one getSettlements call
+                raw_settlements = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_settlement_cache_key(contract_type, contract_idx),
+                    lambda: self._read_settlements(contract_type, contract["contract_idx"], network),
+                    min_block=min_block
+                )
 
-            parsed_settlements = [
-                self._build_settlement_dict(settlement, idx, contract_type, contract, api_key, parties)
-                for idx, settlement in enumerate(raw_settlements)
-            ]
+            parsed_settlements = self._parse_settlements(raw_settlements, contract_type, contract, api_key, parties)
 
             return self._format_success(parsed_settlements, success_message, status.HTTP_200_OK)
 
@@ -60,32 +51,98 @@ class BaseSettlementAPI(ResponseMixin):
             error_message = f"Error retrieving settlements for {contract_type}:{contract_idx}: {e}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
-    def add_settlements(self, contract_type, contract_idx, settlements):
-        """Add settlements to the blockchain for a given contract."""
+    def _read_settlements(self, contract_type, contract_idx, network):
+        """Read a contract's settlements from chain; returns (raw_settlements, read_block)."""
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        raw_settlements = web3_contract.functions.getSettlements(contract_idx).call(block_identifier=read_block)
+        return raw_settlements, read_block
+
+    def get_settlements_page(self, contract_type, contract_idx, offset, limit, api_key=None, parties=[]):
+        """Retrieve one page of settlements. Only the requested rows are read from chain and decrypted."""
+        try:
+            contract_api = self.context.api_manager.get_contract_api(contract_type)
+            contract = contract_api.get_contract(contract_type, contract_idx, api_key, parties).get("data")
+
+            # Page in SQL when this endpoint reads from the mirror; otherwise slice the full list when it is
+            # already cached, or read just the page with the range getter
+            network = self.domain_manager.get_contract_network()
+            min_block = self.context.web3_manager.get_floor_block(network)
+            mirror_page = self.context.mirror_manager.read_item_page(
+                "settlement", contract_type, contract["contract_idx"], offset, limit, min_block
+            )
+            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
+            cached_settlements = self.cache_manager.get_fresh(cache_key, min_block) if mirror_page is None else None
+
+            if mirror_page is not None:
+                settlement_count, raw_settlements = mirror_page
+            elif cached_settlements is not None:
+                settlement_count = len(cached_settlements)
+                raw_settlements = cached_settlements[offset:offset + limit]
+            else:
+                web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+                read_block = self.context.web3_manager.get_read_block(network)
+                settlement_count = web3_contract.functions.getSettlementCount(contract["contract_idx"]).call(block_identifier=read_block)
+                raw_settlements = web3_contract.functions.getSettlementsRange(contract["contract_idx"], offset, limit).call(block_identifier=read_block)
+
+            parsed_settlements = self._parse_settlements(raw_settlements, contract_type, contract, api_key, parties, offset=offset)
+
+            page = {"count": settlement_count, "offset": offset, "limit": limit, "results": parsed_settlements}
+            success_message = f"Successfully retrieved settlements {offset}-{offset + len(parsed_settlements)} for {contract_type}:{contract_idx}"
+            return self._format_success(page, success_message, status.HTTP_200_OK)
+
+        except ValidationError as e:
+            error_message = f"Validation error returning settlements for {contract_type}:{contract_idx}: {str(e)}"
+            return self._format_error(error_message, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            error_message = f"Error retrieving settlements for {contract_type}:{contract_idx}: {e}"
+            return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _parse_settlements(self, raw_settlements, contract_type, contract, api_key, parties, offset=0):
+        """Resolve the decryptor once and decrypt every settlement's extended data in one pass."""
+        decryptor = get_decryptor(api_key, parties)
+        extended_data = decryptor.decrypt_many(
+            [settlement[0] for settlement in raw_settlements],
+            workers=self.config_manager.get_decrypt_workers(),
+            parallel_threshold=self.config_manager.get_decrypt_parallel_threshold()
+        )
+
+        return [
+            self._build_settlement_dict(settlement, offset + idx, contract_type, contract, extended_data[idx])
+            for idx, settlement in enumerate(raw_settlements)
+        ]
+
+    def add_settlements(self, contract_type, contract_idx, settlements, async_mode=False):
+        """Add settlements to the blockchain for a given contract. In async mode, return the job once broadcast."""
         try:
             encryptor = get_encryptor()
-            processed_count = 0
+            rows = []
 
             for settlement in settlements:
                 log_info(self.logger,f"Sending {settlement} to chain with {contract_type}:{contract_idx}")
-                transaction = self._build_add_settlement(contract_type, contract_idx, settlement, encryptor)
-
-                network = self.domain_manager.get_contract_network()
-                tx_receipt = self.context.web3_manager.send_signed_transaction(transaction, self.wallet_addr, contract_type, contract_idx, network)
+                rows.append(self._build_settlement_row(settlement, encryptor))
 
-                if tx_receipt["status"] != 1:
-                    raise RuntimeError
+            # One addSettlements call per chunk, sized to fit the block gas limit
+            network = self.domain_manager.get_contract_network()
+            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+            transactions = self.context.web3_manager.build_batch_transactions(
+                web3_contract.functions.addSettlements, contract_idx, rows, self.wallet_addr, network
+            )
 
-                processed_count += 1
+            if async_mode:
+                job = self.context.job_manager.submit("addSettlements", transactions, self.wallet_addr, contract_type, contract_idx)
+                success_message = f"Submitted {len(rows)} settlements for {contract_type}:{contract_idx}"
+                return self._format_success(job, success_message, status.HTTP_202_ACCEPTED)
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
+            # Broadcast all chunks back-to-back and wait for the receipts together; the receipts' events invalidate the caches
+            tx_receipts = self.context.web3_manager.send_signed_transactions(transactions, self.wallet_addr, contract_type, contract_idx, network)
 
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
+            for tx_receipt in tx_receipts:
+                if tx_receipt["status"] != 1:
+                    raise RuntimeError
 
-            success_message = f"Successfully added {processed_count} settlements for {contract_type}:{contract_idx}"
-            return self._format_success({"count":processed_count}, success_message, status.HTTP_201_CREATED )
+            success_message = f"Successfully added {len(rows)} settlements for {contract_type}:{contract_idx}"
+            return self._format_success({"count":len(rows)}, success_message, status.HTTP_201_CREATED )
 
         except ValidationError as e:
             error_message = f"Validation error for {contract_type}:{contract_idx}: {str(e)}"
@@ -107,12 +164,6 @@ class BaseSettlementAPI(ResponseMixin):
             if tx_receipt["status"] != 1:
                 raise RuntimeError
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
-
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-
             success_message = f"All settlements deleted for {contract_type}:{contract_idx}"
             return self._format_success({"contract_idx" : contract_idx}, success_message, status.HTTP_204_NO_CONTENT)
 
@@ -126,12 +177,9 @@ class BaseSettlementAPI(ResponseMixin):
 
 ### **Subclass for Sale Contracts**
 class SaleSettlementAPI(BaseSettlementAPI):
-    def _build_settlement_dict(self, settle, idx, contract_type, contract, api_key, parties):
-        """Build a settlement dictionary from raw data."""
+    def _build_settlement_dict(self, settle, idx, contract_type, contract, decrypted_extended_data):
+        """Build a settlement dictionary from raw data and its already decrypted extended data."""
         try:
-            decryptor = get_decryptor(api_key, parties)
-            decrypted_extended_data = decryptor.decrypt(settle[0])
-
             return {
                 "extended_data": decrypted_extended_data,
                 "settle_due_dt": from_timestamp(settle[1]),
@@ -158,32 +206,25 @@ class SaleSettlementAPI(BaseSettlementAPI):
             log_error(self.logger, error_message)
             raise RuntimeError(error_message) from e
 
-    def _build_add_settlement(self, contract_type, contract_idx, settlement, encryptor):
-        """Build the transaction to add a settlement."""
+    def _build_settlement_row(self, settlement, encryptor):
+        """Build the addSettlements arguments for one settlement."""
         try:
             encrypted_data = encryptor.encrypt(settlement["extended_data"])
             due_dt = int(settlement["settle_due_dt"].timestamp())
             principal_amt = int(Decimal(settlement["principal_amt"]) * 100)
             settle_exp_amt = int(Decimal(settlement["settle_exp_amt"]) * 100) 
 
-            network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            return web3_contract.functions.addSettlement(
-                contract_idx, encrypted_data, due_dt, principal_amt, settle_exp_amt
-            ).build_transaction()
+            return (encrypted_data, due_dt, principal_amt, settle_exp_amt)
         except Exception as e:
-            error_message = f"Error building settlement transaction for {contract_type}:{contract_idx}: {e}"
+            error_message = f"Error building settlement row: {e}"
             log_error(self.logger, error_message)
             raise RuntimeError(error_message) from e
 
 ### **Subclass for Advance Contracts**
 class AdvanceSettlementAPI(BaseSettlementAPI):
-    def _build_settlement_dict(self, settle, idx, contract_type, contract, api_key, parties):
-        """Build a settlement dictionary from raw data."""
+    def _build_settlement_dict(self, settle, idx, contract_type, contract, decrypted_extended_data):
+        """Build a settlement dictionary from raw data and its already decrypted extended data."""
         try:
-            decryptor = get_decryptor(api_key, parties)
-            decrypted_extended_data = decryptor.decrypt(settle[0])
-
             return {
                 "extended_data": decrypted_extended_data,
                 "settle_due_dt": from_timestamp(settle[1]),
@@ -217,21 +258,17 @@ class AdvanceSettlementAPI(BaseSettlementAPI):
             log_error(self.logger, error_message)
             raise RuntimeError(error_message) from e
 
-    def _build_add_settlement(self, contract_type, contract_idx, settlement, encryptor):
-        """Build the transaction to add a settlement."""
+    def _build_settlement_row(self, settlement, encryptor):
+        """Build the addSettlements arguments for one settlement."""
         try:
             encrypted_data = encryptor.encrypt(settlement["extended_data"])
             due_dt = int(settlement["settle_due_dt"].timestamp())
             min_dt = int(settlement["transact_min_dt"].timestamp())
             max_dt = int(settlement["transact_max_dt"].timestamp())
 
-            network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            return web3_contract.functions.addSettlement(
-                contract_idx, encrypted_data, due_dt, min_dt, max_dt
-            ).build_transaction()
+            return (encrypted_data, due_dt, min_dt, max_dt)
         except Exception as e:
-            error_message = f"Error building settlement transaction for {contract_type}:{contract_idx}: {e}"
+            error_message = f"Error building settlement row: {e}"
             log_error(self.logger, error_message)
             raise RuntimeError(error_message) from e
 
@@ -1,6 +1,5 @@
 import logging
 import json
-import time
 
 from decimal import Decimal
 from datetime import datetime
@@ -30,35 +29,25 @@ class BaseTransactionAPI(ResponseMixin):
     def get_transactions(self, contract_type, contract_idx, api_key=None, parties=[], transact_min_dt=None, transact_max_dt=None):
         """Retrieve transactions while ensuring only encrypted values are cached."""
         try:
-            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
-            cached_transactions = self.cache_manager.get(cache_key)
-
             success_message = f"Successfully retrieved transactions for {contract_type}:{contract_idx}"
             decryptor = get_decryptor(api_key, parties)
 
             contract_api = self.context.api_manager.get_contract_api(contract_type)
             contract = contract_api.get_contract(contract_type, contract_idx, api_key, parties).get("data")
 
-            if cached_transactions is not None:
-                log_info(self.logger, f"Loaded transactions for {contract_type}:{contract_idx} from cache")
-                parsed_transactions = [
-                    self._decrypt_fields(contract_type, contract, idx, raw_transaction, decryptor)
-                    for idx, raw_transaction in enumerate(cached_transactions)
-                ]
-                return self._format_success(parsed_transactions, success_message, status.HTTP_200_OK)
-
-            log_info(self.logger, f"Retrieving transactions for {contract_type}:{contract_idx} from chain")
             network = self.domain_manager.get_contract_network()
-            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-            raw_transactions = web3_contract.functions.getTransactions(contract_idx).call()
-            log_info(self.logger, f"Retrieve {raw_transactions} from chain")
+            min_block = self.context.web3_manager.get_floor_block(network)
+            raw_transactions = self.context.mirror_manager.read_items("transaction", contract_type, contract_idx, min_block)
 
-            self.cache_manager.set(cache_key, raw_transactions, timeout=None)
+            if raw_transactions is None:
+                # Concurrent misses after an invalidation share one getTransactions call
+                raw_transactions = self.cache_manager.get_or_compute(
+                    self.cache_manager.get_transaction_cache_key(contract_type, contract_idx),
+                    lambda: self._read_transactions(contract_type, contract_idx, network),
+                    min_block=min_block
+                )
 
-            parsed_transactions = [
-                self._decrypt_fields(contract_type, contract, idx, raw_transaction, decryptor)
-                for idx, raw_transaction in enumerate(raw_transactions)
-            ]
+            parsed_transactions = self._parse_transactions(contract_type, contract, raw_transactions, decryptor)
 
             return self._format_success(parsed_transactions, success_message, status.HTTP_200_OK)
 
@@ -69,6 +58,76 @@ class BaseTransactionAPI(ResponseMixin):
             error_message = f"Error retrieving transactions for {contract_type}:{contract_idx}: {e}"
             return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
 
+    def _read_transactions(self, contract_type, contract_idx, network):
+        """Read a contract's transactions from chain; returns (raw_transactions, read_block)."""
+        log_info(self.logger, f"Retrieving transactions for {contract_type}:{contract_idx} from chain")
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        read_block = self.context.web3_manager.get_read_block(network)
+        raw_transactions = web3_contract.functions.getTransactions(contract_idx).call(block_identifier=read_block)
+        return raw_transactions, read_block
+
+    def get_transactions_page(self, contract_type, contract_idx, offset, limit, api_key=None, parties=[]):
+        """Retrieve one page of transactions. Only the requested rows are read from chain and decrypted."""
+        try:
+            contract_api = self.context.api_manager.get_contract_api(contract_type)
+            contract = contract_api.get_contract(contract_type, contract_idx, api_key, parties).get("data")
+
+            # Page in SQL when this endpoint reads from the mirror; otherwise slice the full history when it is
+            # already cached, or read just the page with the range getter
+            network = self.domain_manager.get_contract_network()
+            min_block = self.context.web3_manager.get_floor_block(network)
+            mirror_page = self.context.mirror_manager.read_item_page(
+                "transaction", contract_type, contract_idx, offset, limit, min_block
+            )
+            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
+            cached_transactions = self.cache_manager.get_fresh(cache_key, min_block) if mirror_page is None else None
+
+            if mirror_page is not None:
+                transaction_count, raw_transactions = mirror_page
+            elif cached_transactions is not None:
+                transaction_count = len(cached_transactions)
+                raw_transactions = cached_transactions[offset:offset + limit]
+            else:
+                web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+                read_block = self.context.web3_manager.get_read_block(network)
+                transaction_count = web3_contract.functions.getTransactionCount(contract_idx).call(block_identifier=read_block)
+                raw_transactions = web3_contract.functions.getTransactionsRange(contract_idx, offset, limit).call(block_identifier=read_block)
+
+            decryptor = get_decryptor(api_key, parties)
+            parsed_transactions = self._parse_transactions(contract_type, contract, raw_transactions, decryptor, offset=offset)
+
+            page = {"count": transaction_count, "offset": offset, "limit": limit, "results": parsed_transactions}
+            success_message = f"Successfully retrieved transactions {offset}-{offset + len(parsed_transactions)} for {contract_type}:{contract_idx}"
+            return self._format_success(page, success_message, status.HTTP_200_OK)
+
+        except ValidationError as e:
+            error_message = f"Validation error for {contract_type}:{contract_idx}: {str(e)}"
+            return self._format_error(error_message, status.HTTP_400_BAD_REQUEST)
+        except Exception as e:
+            error_message = f"Error retrieving transactions for {contract_type}:{contract_idx}: {e}"
+            return self._format_error(error_message, status.HTTP_500_INTERNAL_SERVER_ERROR)
+
+    def _parse_transactions(self, contract_type, contract, raw_transactions, decryptor, offset=0):
+        """Parse raw transactions, decrypting extended_data and transact_data for all rows in one bulk call."""
+        row_count = len(raw_transactions)
+        tokens = [raw_transaction[0] for raw_transaction in raw_transactions]
+        tokens += [raw_transaction[self.TRANSACT_DATA_IDX] for raw_transaction in raw_transactions]
+
+        decrypted = decryptor.decrypt_many(
+            tokens,
+            workers=self.config_manager.get_decrypt_workers(),
+            parallel_threshold=self.config_manager.get_decrypt_parallel_threshold()
+        )
+
+        parsed_transactions = []
+        for idx, raw_transaction in enumerate(raw_transactions):
+            parsed_transaction = self._parse_transaction(contract_type, contract, offset + idx, raw_transaction)
+            parsed_transaction["extended_data"] = decrypted[idx]
+            parsed_transaction["transact_data"] = decrypted[row_count + idx]
+            parsed_transactions.append(parsed_transaction)
+
+        return parsed_transactions
+
     def _filter_transaction(self, transaction, transact_min_dt=None, transact_max_dt=None):
         try:
             # Assuming the transaction contains a timestamp at index 1
@@ -92,37 +151,40 @@ class BaseTransactionAPI(ResponseMixin):
             log_error(self.logger, f"Error filtering transaction: {transaction}, error: {e}")
             return False
 
-    def add_transactions(self, contract_type, contract_idx, transact_logic, transactions):
-        """Add transactions to the blockchain for a given contract."""
+    def add_transactions(self, contract_type, contract_idx, transact_logic, transactions, async_mode=False):
+        """Add transactions to the blockchain for a given contract. In async mode, return the job once broadcast."""
         try:
 
+            network = self.domain_manager.get_contract_network()
+            web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+            rows = []
+
             for transaction_dict in transactions:
-                log_info(self.logger, f"Sending transaction to chain for {contract_type}:{contract_idx}")
+                log_info(self.logger, f"Building transaction for {contract_type}:{contract_idx}")
                 transact_amt = self._calculate_transaction_amount(transaction_dict, transact_logic)
                 log_info(self.logger, f"Calculated transaction amount {transact_amt} with logic {transact_logic}")
                 transaction = self._build_transaction(transaction_dict)
                 log_info(self.logger, f"Built transaction: {transaction}")
 
-                network = self.domain_manager.get_contract_network()
-                web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
-                
-                tx = web3_contract.functions.addTransaction(
-                    contract_idx,
+                rows.append((
                     transaction["extended_data"],
                     transaction["transact_dt"],
                     transact_amt,
                     transaction["transact_data"]
-                ).build_transaction()
+                ))
 
-                self._send_transaction(tx, contract_type, contract_idx, "addTransaction")
+            # One addTransactions call per chunk, sized to fit the block gas limit
+            txs = self.context.web3_manager.build_batch_transactions(
+                web3_contract.functions.addTransactions, contract_idx, rows, self.wallet_addr, network
+            )
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
+            if async_mode:
+                job = self.context.job_manager.submit("addTransactions", txs, self.wallet_addr, contract_type, contract_idx)
+                success_message = f"Submitted {len(rows)} transactions for {contract_type}:{contract_idx}"
+                return self._format_success(job, success_message, status.HTTP_202_ACCEPTED)
 
-            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
+            # Broadcast all chunks back-to-back and wait for the receipts together; the receipts' events invalidate the caches
+            self._send_transactions(txs, contract_type, contract_idx, "addTransactions")
 
             success_message = f"Successfully added transactions for {contract_type}:{contract_idx}"
             return self._format_success({"count": len(transactions)}, success_message, status.HTTP_201_CREATED)
@@ -143,14 +205,6 @@ class BaseTransactionAPI(ResponseMixin):
             tx = web3_contract.functions.deleteTransactions(contract_idx).build_transaction()
             self._send_transaction(tx, contract_type, contract_idx, "deleteTransactions")
 
-            # Sleep to give time for transaction to complete
-            time.sleep(self.config_manager.get_network_sleep_time())
-
-            cache_key = self.cache_manager.get_transaction_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-            cache_key = self.cache_manager.get_settlement_cache_key(contract_type, contract_idx)
-            self.cache_manager.delete(cache_key)
-
             success_message = f"Successfully deleted transactions for {contract_type}:{contract_idx}"
             return self._format_success({ "contract_idx":contract_idx}, success_message, status.HTTP_204_NO_CONTENT)
 
@@ -176,13 +230,18 @@ class BaseTransactionAPI(ResponseMixin):
 
     def _send_transaction(self, tx, contract_type, contract_idx, operation):
         """Send a signed transaction to the blockchain."""
+        self._send_transactions([tx], contract_type, contract_idx, operation)
+
+    def _send_transactions(self, txs, contract_type, contract_idx, operation):
+        """Send signed transactions to the blockchain as one pipelined batch."""
         try:
-            tx_receipt = self.context.web3_manager.send_signed_transaction(tx, self.wallet_addr, contract_type, contract_idx, "fizit")
+            tx_receipts = self.context.web3_manager.send_signed_transactions(txs, self.wallet_addr, contract_type, contract_idx, "fizit")
 
-            if tx_receipt["status"] != 1:
-                error_message = f"Blockchain {operation} failed for contract {contract_idx}" 
-                log_error(self.logger, error_message)
-                raise RuntimeError(error_message)
+            for tx_receipt in tx_receipts:
+                if tx_receipt["status"] != 1:
+                    error_message = f"Blockchain {operation} failed for contract {contract_idx}" 
+                    log_error(self.logger, error_message)
+                    raise RuntimeError(error_message)
 
         except Exception as e:
             error_message = f"Error sending transaction: {e}"
@@ -191,16 +250,8 @@ class BaseTransactionAPI(ResponseMixin):
 
 ### **Subclass for Purchase Contracts**
 class PurchaseTransactionAPI(BaseTransactionAPI):
-
-    def _decrypt_fields(self, contract_type, contract, transact_idx, raw_transaction, decryptor):
-        """Decrypt fields specific to purchase transactions."""
-        try:
-            parsed_transaction = self._parse_transaction(contract_type, contract, transact_idx, raw_transaction)
-            parsed_transaction["extended_data"] = decryptor.decrypt(raw_transaction[0])
-            parsed_transaction["transact_data"] = decryptor.decrypt(raw_transaction[5])
-            return parsed_transaction
-        except Exception as e:
-            raise RuntimeError(f"Decryption failed for purchase transaction {transact_idx}: {e}") from e
+    # Position of the encrypted transact_data in the raw transaction tuple
+    TRANSACT_DATA_IDX = 5
 
     def _parse_transaction(self, contract_type, contract, transact_idx, raw_transaction):
         """Parse a raw transaction from the blockchain into a dictionary."""
@@ -238,15 +289,7 @@ class PurchaseTransactionAPI(BaseTransactionAPI):
 
 ### **Subclass for Sale Contracts**
 class SaleTransactionAPI(BaseTransactionAPI):
-    def _decrypt_fields(self, contract_type, contract, transact_idx, raw_transaction, decryptor):
-        """Decrypt fields specific to purchase transactions."""
-        try:
-            parsed_transaction = self._parse_transaction(contract_type, contract, transact_idx, raw_transaction)
-            parsed_transaction["extended_data"] = decryptor.decrypt(raw_transaction[0])
-            parsed_transaction["transact_data"] = decryptor.decrypt(raw_transaction[3])
-            return parsed_transaction
-        except Exception as e:
-            raise RuntimeError(f"Decryption failed for purchase transaction {transact_idx}: {e}") from e
+    TRANSACT_DATA_IDX = 3
 
     def _parse_transaction(self, contract_type, contract, transact_idx, raw_transaction):
         """Parse a raw transaction from the blockchain into a dictionary."""
@@ -279,15 +322,7 @@ class SaleTransactionAPI(BaseTransactionAPI):
 
 ### **Subclass for Advance Contracts**
 class AdvanceTransactionAPI(BaseTransactionAPI):
-    def _decrypt_fields(self, contract_type, contract, transact_idx, raw_transaction, decryptor):
-        """Decrypt fields specific to purchase transactions."""
-        try:
-            parsed_transaction = self._parse_transaction(contract_type, contract, transact_idx, raw_transaction)
-            parsed_transaction["extended_data"] = decryptor.decrypt(raw_transaction[0])
-            parsed_transaction["transact_data"] = decryptor.decrypt(raw_transaction[5])
-            return parsed_transaction
-        except Exception as e:
-            raise RuntimeError(f"Decryption failed for purchase transaction {transact_idx}: {e}") from e
+    TRANSACT_DATA_IDX = 5
 
     def _parse_transaction(self, contract_type, contract, transact_idx, raw_transaction):
         """Parse a raw transaction from the blockchain into a dictionary."""
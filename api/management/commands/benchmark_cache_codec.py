@@ -0,0 +1,114 @@
+import pickle
+import time
+from cryptography.fernet import Fernet
+
+from django.core.management.base import BaseCommand
+
+from api.interfaces.encryption_api import Encryptor
+from api.managers.cache_manager import BlockTagged, CacheCodec
+
+class Command(BaseCommand):
+    help = 'Benchmark pickle vs the cache codec (size, encode and decode time) on synthetic transaction and settlement lists'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[100, 1000, 10000],
+            help='Fixture sizes to benchmark (default is 100 1000 10000)'
+        )
+        parser.add_argument(
+            '--repeat',
+            type=int,
+            default=5,
+            help='Timing runs per codec; the best run is reported (default is 5)'
+        )
+
+    def handle(self, *args, **options):
+        # A throwaway key keeps the benchmark independent of the secrets store
+        encryptor = Encryptor(Fernet.generate_key())
+
+        codecs = {
+            'pickle': (lambda value: pickle.dumps(value, pickle.HIGHEST_PROTOCOL), pickle.loads),
+            'msgpack': self.codec_functions(CacheCodec(compressor=None)),
+            'msgpack+zlib': self.codec_functions(CacheCodec(compressor='zlib')),
+            'msgpack+zstd': self.codec_functions(CacheCodec(compressor='zstd')),
+        }
+
+        for name, build_fixture in (('transactions', self.build_transactions), ('settlements', self.build_settlements)):
+            for rows in options['rows']:
+                fixture = BlockTagged(build_fixture(encryptor, rows), 1000000)
+                self.stdout.write(f'{rows} {name}')
+
+                baseline_size = None
+                for codec_name, (encode, decode) in codecs.items():
+                    data = encode(fixture)
+                    if decode(data) != fixture:
+                        self.stdout.write(self.style.ERROR(f'  {codec_name:<14} round trip mismatch'))
+                        continue
+
+                    baseline_size = baseline_size or len(data)
+                    encode_time = self.best_time(lambda: encode(fixture), options['repeat'])
+                    decode_time = self.best_time(lambda: decode(data), options['repeat'])
+                    self.stdout.write(self.style.SUCCESS(
+                        f'  {codec_name:<14} {len(data):>11,} bytes ({len(data) / baseline_size:6.1%})  '
+                        f'encode {encode_time * 1000:8.2f}ms  decode {decode_time * 1000:8.2f}ms'
+                    ))
+
+    def codec_functions(self, codec):
+        return codec.encode, codec.decode
+
+    def build_transactions(self, encryptor, rows):
+        """Rows shaped like getTransactions output, with encrypted extended_data and transact_data."""
+        return [
+            (
+                encryptor.encrypt({"ref_no": idx, "notes": "benchmark row"}),
+                1700000000 + idx * 3600,
+                (idx % 500) * 100 + 2500,
+                125,
+                (idx % 500) * 80,
+                encryptor.encrypt({"meter_qty": idx % 1000, "price": "3.25"}),
+                1700000000 + idx * 3600 + 86400 if idx % 3 else 0,
+                (idx % 500) * 80 if idx % 3 else 0,
+                f"0x{idx:064x}" if idx % 3 else "",
+            )
+            for idx in range(rows)
+        ]
+
+    def build_settlements(self, encryptor, rows):
+        """Rows shaped like getSettlements output."""
+        return [
+            (
+                encryptor.encrypt({"period": idx}),
+                1700000000 + idx * 86400 * 30,
+                1700000000 + (idx - 1) * 86400 * 30,
+                1700000000 + idx * 86400 * 30 - 1,
+                idx % 50,
+                (idx % 500) * 100,
+                (idx % 500) * 110,
+                0,
+                (idx % 500) * 120,
+                0,
+                "",
+                0,
+                "",
+                0,
+                0,
+                0,
+                0,
+                0,
+                0,
+                "",
+            )
+            for idx in range(rows)
+        ]
+
+    def best_time(self, function, repeat):
+        best = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            function()
+            elapsed = time.perf_counter() - start
+            best = elapsed if best is None else min(best, elapsed)
+        return best
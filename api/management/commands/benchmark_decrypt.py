@@ -0,0 +1,56 @@
+import time
+from cryptography.fernet import Fernet
+
+from django.core.management.base import BaseCommand
+
+from api.interfaces.encryption_api import Encryptor, Decryptor
+
+class Command(BaseCommand):
+    help = 'Benchmark serial vs thread-pool bulk decryption on synthetic transaction fixtures'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--rows',
+            type=int,
+            nargs='+',
+            default=[10000, 100000],
+            help='Fixture sizes to benchmark (default is 10000 100000)'
+        )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            nargs='+',
+            default=[2, 4, 8],
+            help='Worker counts to compare against the serial path (default is 2 4 8)'
+        )
+
+    def handle(self, *args, **options):
+        # A throwaway key keeps the benchmark independent of the secrets store
+        key = Fernet.generate_key()
+        encryptor = Encryptor(key)
+        decryptor = Decryptor(key)
+
+        for rows in options['rows']:
+            tokens = self.build_fixture(encryptor, rows)
+            self.stdout.write(f'{rows} rows ({len(tokens)} encrypted fields)')
+
+            serial_time = self.time_decrypt(decryptor, tokens, workers=1)
+            self.stdout.write(f'  serial:      {serial_time:8.3f}s')
+
+            for workers in options['workers']:
+                parallel_time = self.time_decrypt(decryptor, tokens, workers=workers)
+                speedup = serial_time / parallel_time if parallel_time else 0
+                self.stdout.write(self.style.SUCCESS(
+                    f'  {workers:2d} workers:  {parallel_time:8.3f}s  ({speedup:.2f}x)'
+                ))
+
+    def build_fixture(self, encryptor, rows):
+        """Encrypt extended_data and transact_data for each row, as stored on chain."""
+        extended_data = [{"ref_no": idx, "notes": "benchmark row"} for idx in range(rows)]
+        transact_data = [{"meter_qty": idx % 1000, "price": "3.25"} for idx in range(rows)]
+        return encryptor.encrypt_many(extended_data) + encryptor.encrypt_many(transact_data)
+
+    def time_decrypt(self, decryptor, tokens, workers):
+        start = time.perf_counter()
+        decryptor.decrypt_many(tokens, workers=workers, parallel_threshold=0)
+        return time.perf_counter() - start
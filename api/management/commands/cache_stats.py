@@ -0,0 +1,48 @@
+import json
+
+from django.core.management.base import BaseCommand
+
+from api.utilities.bootstrap import get_app_context
+
+class Command(BaseCommand):
+    help = 'Show cache hit/miss/error counts, bytes written and shared-cache latency per key family, summed over all workers'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--json',
+            action='store_true',
+            help='Print the raw metrics, including latency buckets, as JSON'
+        )
+
+    def handle(self, *args, **options):
+        metrics = get_app_context().cache_manager.get_metrics()
+
+        if options['json']:
+            self.stdout.write(json.dumps(metrics, indent=2))
+            return
+
+        self.stdout.write(f'{metrics["processes"]} reporting processes')
+        self.stdout.write(
+            f'{"family":<20} {"local":>9} {"hit":>9} {"miss":>9} {"ratio":>7} {"error":>6} '
+            f'{"stale":>6} {"wait":>6} {"written":>10} {"p50 ms":>7} {"p95 ms":>7} {"p99 ms":>7}'
+        )
+
+        for family, stats in metrics["families"].items():
+            latency = stats["latency_ms"]
+            ratio = f'{stats["hit_ratio"]:.1%}' if stats["hit_ratio"] is not None else '-'
+            self.stdout.write(
+                f'{family:<20} {stats["local_hit"]:>9} {stats["hit"]:>9} {stats["miss"]:>9} {ratio:>7} {stats["error"]:>6} '
+                f'{stats["stale"]:>6} {stats["wait"]:>6} {self.format_bytes(stats["bytes_written"]):>10} '
+                f'{self.format_latency(latency["p50"]):>7} {self.format_latency(latency["p95"]):>7} {self.format_latency(latency["p99"]):>7}'
+            )
+
+    def format_bytes(self, size):
+        for unit in ('B', 'KB', 'MB'):
+            if size < 1024:
+                return f'{size:.0f}{unit}'
+            size /= 1024
+        return f'{size:.1f}GB'
+
+    def format_latency(self, bound):
+        # Percentiles are bucket upper bounds; None means above the largest bucket
+        return f'<={bound}' if bound is not None else '-'
@@ -6,7 +6,7 @@ from decimal import Decimal
 
 from django.core.management.base import BaseCommand
 
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 from api.operations import CsrfOperations, ContractOperations, TransactionOperations
 
@@ -14,7 +14,7 @@ class Command(BaseCommand):
     help = 'Listen to contract events and update them in the database'
 
     def handle(self, *args, **kwargs):
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
         headers = {
@@ -6,7 +6,7 @@ from django.core.management.base import BaseCommand
 from django.conf import settings
 from django.utils import timezone
 
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.models import SmartContract
 
 class Command(BaseCommand):
@@ -22,7 +22,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         contract_type = kwargs['contract_type']
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
         # Initialize managers
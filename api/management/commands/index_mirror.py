@@ -0,0 +1,49 @@
+import json
+import logging
+import time
+
+from django.core.management.base import BaseCommand
+
+from api.utilities.bootstrap import get_app_context
+from api.utilities.mirror_indexer import MirrorIndexer
+from api.utilities.logging import log_error
+
+class Command(BaseCommand):
+    help = 'Keep the SQL mirror of contract, party, transaction, settlement and artifact state in sync with the chain'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--contract-types',
+            nargs='+',
+            help='Contract types to index (default is all)'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=MirrorIndexer.DEFAULT_CHUNK_SIZE,
+            help=f'Contracts re-read per JSON-RPC batch (default is {MirrorIndexer.DEFAULT_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--once',
+            action='store_true',
+            help='Run a single pass, print the mirror lag and exit'
+        )
+
+    def handle(self, *args, **options):
+        context = get_app_context()
+        logger = logging.getLogger(__name__)
+        indexer = MirrorIndexer(context, chunk_size=options['chunk_size'], report=self.stdout.write)
+
+        if options['once']:
+            indexer.index(options['contract_types'])
+            self.stdout.write(json.dumps(context.mirror_manager.get_lag(), indent=2))
+            return
+
+        while True:
+            try:
+                indexer.index(options['contract_types'])
+            except Exception as e:
+                # The cursor only moves after a span is stored, so the next pass picks up where this one failed
+                log_error(logger, f"Mirror indexing failed: {str(e)}")
+
+            time.sleep(context.config_manager.get_listen_sleep_time())
@@ -8,14 +8,14 @@ from web3 import Web3
 from django.core.management.base import BaseCommand
 
 from api.models.event_model import Event
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
 class Command(BaseCommand):
     help = 'Listen to contract events and update them in the database'
 
     def handle(self, *args, **kwargs):
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
         # Web3 instances for both networks
@@ -123,7 +123,12 @@ class Command(BaseCommand):
 
     def process_fizit_events(self, event_filter, contract_type):
         """Process events for a specific contract type on the Fizit network."""
-        for event in event_filter.get_new_entries():
+        events = event_filter.get_new_entries()
+
+        # Writes from other processes or tools only reach this cache through the event log
+        self.invalidate_events(events, contract_type)
+
+        for event in events:
             try:
                 log_info(self.logger, f"Fizit event found for {contract_type}: {event}")
 
@@ -163,4 +168,21 @@ class Command(BaseCommand):
                     log_error(self.logger, f"No matching Event found for Fizit tx_hash={tx_hash}")
 
             except Exception as e:
-                log_error(self.logger, f"Error processing Fizit event for {contract_type}: {str(e)}")
\ No newline at end of file
+                log_error(self.logger, f"Error processing Fizit event for {contract_type}: {str(e)}")
+
+    def invalidate_events(self, events, contract_type):
+        """Invalidate the cache for a poll's events, each distinct (contract, event type) once."""
+        decoded_events = []
+        for event in events:
+            try:
+                contract_idx = int(event['topics'][1].hex(), 16)
+                event_type, details = decode(['string', 'string'], bytes(event['data']))
+                decoded_events.append((contract_idx, event_type, details))
+            except Exception as e:
+                log_error(self.logger, f"Error decoding Fizit event for {contract_type}: {str(e)}")
+
+        try:
+            block = max((event['blockNumber'] for event in events), default=None)
+            self.context.cache_manager.invalidate_events(contract_type, decoded_events, block=block)
+        except Exception as e:
+            log_error(self.logger, f"Error invalidating cache for Fizit events of {contract_type}: {str(e)}")
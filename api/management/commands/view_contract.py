@@ -3,7 +3,7 @@ import requests
 
 from django.core.management.base import BaseCommand
 
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import  log_error, log_info, log_warning
 
 class Command(BaseCommand):
@@ -18,7 +18,7 @@ class Command(BaseCommand):
         contract_idx = kwargs['contract_idx']
         contract_type = kwargs['contract_type']
 
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
         self.headers = {
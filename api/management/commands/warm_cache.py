@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+from api.utilities.bootstrap import get_app_context
+from api.utilities.cache_warmer import CacheWarmer
+
+class Command(BaseCommand):
+    help = 'Populate the contract, party, transaction and settlement caches for every contract; resumes an interrupted run'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--contract-types',
+            nargs='+',
+            help='Contract types to warm (default is all)'
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            default=CacheWarmer.DEFAULT_CONCURRENCY,
+            help=f'Chunks warmed in parallel (default is {CacheWarmer.DEFAULT_CONCURRENCY})'
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=CacheWarmer.DEFAULT_CHUNK_SIZE,
+            help=f'Contracts per cache round trip and RPC batch (default is {CacheWarmer.DEFAULT_CHUNK_SIZE})'
+        )
+        parser.add_argument(
+            '--restart',
+            action='store_true',
+            help='Ignore the checkpoint of an interrupted run and warm everything'
+        )
+
+    def handle(self, *args, **options):
+        warmer = CacheWarmer(
+            get_app_context(),
+            concurrency=options['concurrency'],
+            chunk_size=options['chunk_size'],
+            report=self.stdout.write
+        )
+
+        summary = warmer.warm(options['contract_types'], resume=not options['restart'])
+
+        for contract_type, result in summary.items():
+            style = self.style.SUCCESS if not result['failed'] else self.style.WARNING
+            self.stdout.write(style(
+                f'{contract_type}: {result["contracts"]} contracts, {result["filled"]} entries filled, '
+                f'{result["failed"]} failed in {result["seconds"]:.1f}s'
+            ))
+
+        if any(result['failed'] for result in summary.values()):
+            self.stdout.write(self.style.WARNING('Some entries failed; rerun to retry the unfinished chunks'))
@@ -8,3 +8,4 @@
 #from .secrets_manager import SecretsManager
 #from .serializer_manager import SerializerManager
 #from .web3_manager import Web3Manager
+#from .job_manager import JobManager
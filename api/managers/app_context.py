@@ -1,12 +1,79 @@
+import threading
+
 class AppContext:
-    def __init__(
-        self,
-        config_manager,
-        domain_manager,
-        cache_manager,
-        secrets_manager,
-    ):
-        self.config_manager = config_manager
-        self.domain_manager = domain_manager
-        self.cache_manager = cache_manager
-        self.secrets_manager = secrets_manager
\ No newline at end of file
+    """Container for the application managers; each manager is built on first use."""
+
+    def __init__(self, factories):
+        self._factories = factories
+        self._managers = {}
+        self._lock = threading.RLock()
+
+    def _get_manager(self, name):
+        manager = self._managers.get(name)
+        if manager is not None:
+            return manager
+
+        # RLock so a factory can resolve the managers it depends on
+        with self._lock:
+            manager = self._managers.get(name)
+            if manager is None:
+                manager = self._factories[name](self)
+                self._managers[name] = manager
+            return manager
+
+    def reset(self, *names):
+        """Drop built managers (all when no names are given) so they are rebuilt on next use."""
+        with self._lock:
+            if not names:
+                self._managers.clear()
+                return
+            for name in names:
+                self._managers.pop(name, None)
+
+    @property
+    def config_manager(self):
+        return self._get_manager("config_manager")
+
+    @property
+    def domain_manager(self):
+        return self._get_manager("domain_manager")
+
+    @property
+    def cache_manager(self):
+        return self._get_manager("cache_manager")
+
+    @property
+    def secrets_manager(self):
+        return self._get_manager("secrets_manager")
+
+    @property
+    def web3_manager(self):
+        return self._get_manager("web3_manager")
+
+    @property
+    def api_manager(self):
+        return self._get_manager("api_manager")
+
+    @property
+    def adapter_manager(self):
+        return self._get_manager("adapter_manager")
+
+    @property
+    def library_manager(self):
+        return self._get_manager("library_manager")
+
+    @property
+    def serializer_manager(self):
+        return self._get_manager("serializer_manager")
+
+    @property
+    def form_manager(self):
+        return self._get_manager("form_manager")
+
+    @property
+    def job_manager(self):
+        return self._get_manager("job_manager")
+
+    @property
+    def mirror_manager(self):
+        return self._get_manager("mirror_manager")
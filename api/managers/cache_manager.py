@@ -1,51 +1,1230 @@
 import logging
+import os
+import pickle
+import socket
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from collections.abc import Mapping
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, NamedTuple, Optional
 from django.core.cache import cache
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
 from api.utilities.logging import log_info, log_warning, log_error
 
+class BlockTagged(NamedTuple):
+    """A cached chain read together with the block it was read at."""
+    value: Any
+    block: int
+
+class LocalPolicy(NamedTuple):
+    """How long a key family may be served from process memory; a ttl of None pins the entries."""
+    ttl: Optional[float]
+
+_MISSING = object()
+
+class LocalCache:
+    """Thread-safe, size-bounded LRU/TTL tier held in process memory in front of the shared cache.
+
+    Every delete or in-place overwrite of a key bumps its family's generation counter in the shared cache;
+    filling a miss does not, as no other process can hold a copy of a missing key. Each process reads the
+    counters at most once per GENERATION_CHECK_INTERVAL and drops the local entries of any family whose
+    counter moved, so a change made in one worker is seen by the others within that interval.
+    Values are served as-is, without a copy; callers must not mutate them.
+    """
+
+    MAX_ENTRIES = 2048
+    GENERATION_CHECK_INTERVAL = 1.0
+    GENERATION_KEY_PREFIX = "cache_generation_"
+
+    def __init__(self, policies: Dict[str, LocalPolicy], max_entries: int = MAX_ENTRIES):
+        self.logger = logging.getLogger(__name__)
+        self.policies = policies
+        self.max_entries = max_entries
+        # Longest prefix first, so contract_abi_x is not taken for the contract family
+        self._families = sorted(policies, key=len, reverse=True)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()     # key -> (family, stored, expires_at)
+        self._pinned: Dict[str, tuple] = {}                          # key -> (family, stored)
+        self._generations: Dict[str, int] = {}
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+
+    def family_of(self, key: str) -> Optional[str]:
+        for family in self._families:
+            if key == family or key.startswith(f"{family}_"):
+                return family
+        return None
+
+    def get(self, key: str) -> Any:
+        """Return the stored value, or _MISSING when the key is not held locally."""
+        family = self.family_of(key)
+        if family is None:
+            return _MISSING
+
+        self._check_generations()
+
+        with self._lock:
+            pinned = self._pinned.get(key)
+            if pinned is not None:
+                return pinned[1]
+
+            entry = self._entries.get(key)
+            if entry is None:
+                return _MISSING
+
+            if time.monotonic() >= entry[2]:
+                del self._entries[key]
+                return _MISSING
+
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: str, stored: Any, timeout: Optional[float] = None) -> None:
+        """Hold a value locally; timeout is the shared cache timeout, which caps the family TTL."""
+        family = self.family_of(key)
+        if family is None or stored is None:
+            return
+
+        ttl = self.policies[family].ttl
+        if timeout is not None:
+            ttl = timeout if ttl is None else min(ttl, timeout)
+
+        with self._lock:
+            if ttl is None:
+                self._pinned[key] = (family, stored)
+                return
+
+            self._entries[key] = (family, stored, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._pinned.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._pinned.clear()
+
+    def bump_generation(self, key: str) -> None:
+        """Tell the other processes that key changed; they drop their local copies of its family."""
+        self.bump_generations([key])
+
+    def bump_generations(self, keys) -> None:
+        """Bump the generation of every family among keys, once per family."""
+        for family in {self.family_of(key) for key in keys} - {None}:
+            self._bump_family(family)
+
+    def _bump_family(self, family: str) -> None:
+        generation_key = f"{self.GENERATION_KEY_PREFIX}{family}"
+        try:
+            generation = cache.incr(generation_key)
+        except ValueError:
+            # First write of the family; another process may create the counter at the same time
+            if not cache.add(generation_key, 1, timeout=None):
+                cache.incr(generation_key)
+            generation = None
+
+        with self._lock:
+            # Our own bump does not make this process's other entries stale, unless someone else bumped too
+            if generation is not None and self._generations.get(family) == generation - 1:
+                self._generations[family] = generation
+
+    def _check_generations(self) -> None:
+        now = time.monotonic()
+        if now - self._checked_at < self.GENERATION_CHECK_INTERVAL:
+            return
+        self._checked_at = now
+
+        generation_keys = {f"{self.GENERATION_KEY_PREFIX}{family}": family for family in self.policies}
+        try:
+            generations = cache.get_many(list(generation_keys))
+        except Exception as e:
+            # Keep serving local entries within their TTL until the shared cache is back
+            log_warning(self.logger, f"Cache generation check failed: {e}")
+            return
+
+        with self._lock:
+            for generation_key, family in generation_keys.items():
+                generation = generations.get(generation_key, 0)
+                if self._generations.get(family, generation) != generation:
+                    self._drop_family(family)
+                self._generations[family] = generation
+
+    def _drop_family(self, family: str) -> None:
+        for entries in (self._entries, self._pinned):
+            for key in [key for key, entry in entries.items() if entry[0] == family]:
+                del entries[key]
+
+class CacheCodec:
+    """Encodes cache values to compact bytes: a format version byte, a flags byte and the payload.
+
+    Values are packed with msgpack (tuples and BlockTagged keep their types through ext types) and
+    compressed with zstd, or zlib where zstandard is not installed, once they reach compress_threshold
+    bytes. Values msgpack cannot represent (Decimal, ints beyond 64 bits, ...) fall back to pickle. The flags
+    record the choices made, so every value decodes whatever the reader's own settings are.
+    """
+
+    FORMAT_VERSION = 1
+
+    SERIALIZER_PICKLE = 0
+    SERIALIZER_MSGPACK = 1
+    COMPRESSION_NONE = 0
+    COMPRESSION_ZLIB = 1
+    COMPRESSION_ZSTD = 2
+
+    EXT_BLOCK_TAGGED = 1
+    EXT_TUPLE = 2
+
+    DEFAULT_COMPRESS_THRESHOLD = 1024
+    ZLIB_LEVEL = 6
+    ZSTD_LEVEL = 3
+
+    def __init__(self, serializer: str = "msgpack", compressor: str = "zstd", compress_threshold: int = DEFAULT_COMPRESS_THRESHOLD):
+        self.serializer = self.SERIALIZER_MSGPACK if serializer == "msgpack" and msgpack is not None else self.SERIALIZER_PICKLE
+        if compressor == "zstd" and zstandard is not None:
+            self.compression = self.COMPRESSION_ZSTD
+        elif compressor in ("zstd", "zlib"):
+            self.compression = self.COMPRESSION_ZLIB
+        else:
+            self.compression = self.COMPRESSION_NONE
+        self.compress_threshold = compress_threshold
+        self._local = threading.local()  # zstd contexts are not thread-safe
+
+    def encode(self, value: Any) -> bytes:
+        serializer, payload = self._serialize(value)
+
+        compression = self.COMPRESSION_NONE
+        if self.compression != self.COMPRESSION_NONE and len(payload) >= self.compress_threshold:
+            compressed = self._compress(payload)
+            if len(compressed) < len(payload):
+                compression, payload = self.compression, compressed
+
+        return bytes((self.FORMAT_VERSION, serializer | compression << 4)) + payload
+
+    def decode(self, data: bytes) -> Any:
+        if data[0] != self.FORMAT_VERSION:
+            raise ValueError(f"Unknown cache value format {data[0]}")
+
+        serializer, compression = data[1] & 0x0F, data[1] >> 4
+        payload = self._decompress(compression, data[2:])
+
+        if serializer == self.SERIALIZER_MSGPACK:
+            return msgpack.unpackb(payload, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+        return pickle.loads(payload)
+
+    def _serialize(self, value):
+        if self.serializer == self.SERIALIZER_MSGPACK:
+            try:
+                return self.SERIALIZER_MSGPACK, self._packb(value)
+            except (TypeError, ValueError, OverflowError):
+                pass
+        return self.SERIALIZER_PICKLE, pickle.dumps(value, pickle.HIGHEST_PROTOCOL)
+
+    def _packb(self, value):
+        # strict_types hands tuples to _default, so they come back as tuples rather than lists
+        return msgpack.packb(value, default=self._default, use_bin_type=True, strict_types=True)
+
+    def _default(self, obj):
+        if isinstance(obj, BlockTagged):
+            return msgpack.ExtType(self.EXT_BLOCK_TAGGED, self._packb([obj.value, obj.block]))
+        if isinstance(obj, tuple):
+            return msgpack.ExtType(self.EXT_TUPLE, self._packb(list(obj)))
+        if isinstance(obj, Mapping):
+            return dict(obj)
+        if isinstance(obj, list):
+            return list(obj)
+        raise TypeError(f"Cannot pack {type(obj).__name__}")
+
+    def _ext_hook(self, code, data):
+        value = msgpack.unpackb(data, ext_hook=self._ext_hook, raw=False, strict_map_key=False)
+        if code == self.EXT_BLOCK_TAGGED:
+            return BlockTagged(*value)
+        if code == self.EXT_TUPLE:
+            return tuple(value)
+        return msgpack.ExtType(code, data)
+
+    def _compress(self, payload):
+        if self.compression == self.COMPRESSION_ZSTD:
+            compressor = getattr(self._local, "compressor", None)
+            if compressor is None:
+                compressor = self._local.compressor = zstandard.ZstdCompressor(level=self.ZSTD_LEVEL)
+            return compressor.compress(payload)
+        return zlib.compress(payload, self.ZLIB_LEVEL)
+
+    def _decompress(self, compression, payload):
+        if compression == self.COMPRESSION_ZSTD:
+            if zstandard is None:
+                raise ValueError("Cache value is zstd compressed but zstandard is not installed")
+            decompressor = getattr(self._local, "decompressor", None)
+            if decompressor is None:
+                decompressor = self._local.decompressor = zstandard.ZstdDecompressor()
+            return decompressor.decompress(payload)
+        if compression == self.COMPRESSION_ZLIB:
+            return zlib.decompress(payload)
+        return payload
+
+class CacheMetrics:
+    """Thread-safe in-process cache counters and latency histograms, per key family.
+
+    Each process publishes a snapshot to the shared cache at most every PUBLISH_INTERVAL seconds, so the
+    admin endpoint and the cache_stats command can report on every worker, not just their own.
+    """
+
+    COUNTERS = ("local_hit", "hit", "miss", "error", "set", "delete", "stale", "wait", "bytes_written")
+    LATENCY_BUCKETS_MS = (0.1, 0.5, 1, 2, 5, 10, 25, 50, 100, 250, 1000)
+    PUBLISH_INTERVAL = 10
+    SNAPSHOT_TTL = 300
+    SNAPSHOT_KEY_PREFIX = "cache_metrics_"
+    SNAPSHOT_INDEX_KEY = "cache_metrics_index"
+
+    def __init__(self):
+        self.logger = logging.getLogger(__name__)
+        self._counters: Dict[str, Dict[str, int]] = {}
+        self._latency: Dict[str, list] = {}
+        self._lock = threading.Lock()
+        self._started_at = time.time()
+        self._published_at = 0.0
+
+    def incr(self, family: str, counter: str, amount: int = 1) -> None:
+        with self._lock:
+            counters = self._counters.get(family)
+            if counters is None:
+                counters = self._counters[family] = dict.fromkeys(self.COUNTERS, 0)
+            counters[counter] += amount
+
+    def observe_latency(self, family: str, seconds: float) -> None:
+        """Record one shared-cache round trip; the last bucket counts everything above the largest bound."""
+        elapsed_ms = seconds * 1000
+        bucket = next((idx for idx, bound in enumerate(self.LATENCY_BUCKETS_MS) if elapsed_ms <= bound), len(self.LATENCY_BUCKETS_MS))
+
+        with self._lock:
+            latency = self._latency.get(family)
+            if latency is None:
+                latency = self._latency[family] = [0] * (len(self.LATENCY_BUCKETS_MS) + 1) + [0.0]
+            latency[bucket] += 1
+            latency[-1] += elapsed_ms
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            families = {
+                family: {"counters": dict(self._counters.get(family, dict.fromkeys(self.COUNTERS, 0))),
+                         "latency": list(self._latency.get(family, [0] * (len(self.LATENCY_BUCKETS_MS) + 1) + [0.0]))}
+                for family in set(self._counters) | set(self._latency)
+            }
+
+        return {"process": self.process_id(), "since": self._started_at, "families": families}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._latency.clear()
+            self._started_at = time.time()
+
+    @staticmethod
+    def process_id() -> str:
+        # Read on every call so workers forked after import report under their own pid
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    def maybe_publish(self) -> None:
+        now = time.monotonic()
+        if now - self._published_at < self.PUBLISH_INTERVAL:
+            return
+        self._published_at = now
+        self.publish()
+
+    def publish(self) -> None:
+        """Store this process's snapshot in the shared cache and list it in the index of live processes."""
+        try:
+            snapshot = self.snapshot()
+            snapshot_key = f"{self.SNAPSHOT_KEY_PREFIX}{snapshot['process']}"
+            cache.set(snapshot_key, snapshot, self.SNAPSHOT_TTL)
+
+            # Read-modify-write; an entry lost to a concurrent update comes back on that process's next publish
+            index = cache.get(self.SNAPSHOT_INDEX_KEY) or {}
+            now = time.time()
+            index = {key: seen for key, seen in index.items() if now - seen < self.SNAPSHOT_TTL}
+            index[snapshot_key] = now
+            cache.set(self.SNAPSHOT_INDEX_KEY, index, None)
+        except Exception as e:
+            log_warning(self.logger, f"Failed to publish cache metrics: {e}")
+
+    def collect(self) -> dict:
+        """Aggregate the published snapshots of every live process, this one included if it used the cache."""
+        if self._counters or self._latency:
+            self.publish()
+        index = cache.get(self.SNAPSHOT_INDEX_KEY) or {}
+        snapshots = [snapshot for snapshot in cache.get_many(list(index)).values() if snapshot]
+        return self.aggregate(snapshots)
+
+    @classmethod
+    def aggregate(cls, snapshots) -> dict:
+        """Sum snapshots per family and derive the hit ratio and latency percentiles."""
+        families = {}
+
+        for snapshot in snapshots:
+            for family, data in snapshot["families"].items():
+                merged = families.setdefault(family, {
+                    "counters": dict.fromkeys(cls.COUNTERS, 0),
+                    "latency": [0] * (len(cls.LATENCY_BUCKETS_MS) + 1) + [0.0],
+                })
+                for counter, value in data["counters"].items():
+                    merged["counters"][counter] = merged["counters"].get(counter, 0) + value
+                merged["latency"] = [total + value for total, value in zip(merged["latency"], data["latency"])]
+
+        report = {}
+        for family, data in sorted(families.items()):
+            counters = data["counters"]
+            buckets = data["latency"][:-1]
+            round_trips = sum(buckets)
+            lookups = counters["local_hit"] + counters["hit"] + counters["miss"]
+
+            report[family] = {
+                **counters,
+                "hit_ratio": round((counters["local_hit"] + counters["hit"]) / lookups, 4) if lookups else None,
+                "latency_ms": {
+                    "count": round_trips,
+                    "mean": round(data["latency"][-1] / round_trips, 3) if round_trips else None,
+                    "p50": cls._percentile(buckets, 0.50),
+                    "p95": cls._percentile(buckets, 0.95),
+                    "p99": cls._percentile(buckets, 0.99),
+                    "buckets": dict(zip([str(bound) for bound in cls.LATENCY_BUCKETS_MS] + ["+Inf"], buckets)),
+                },
+            }
+
+        return {"processes": len(snapshots), "families": report}
+
+    @classmethod
+    def _percentile(cls, buckets, fraction):
+        """Upper bound of the bucket holding the given fraction of round trips (None above the largest bound)."""
+        total = sum(buckets)
+        if not total:
+            return None
+
+        running = 0
+        for idx, count in enumerate(buckets):
+            running += count
+            if running >= total * fraction:
+                return cls.LATENCY_BUCKETS_MS[idx] if idx < len(cls.LATENCY_BUCKETS_MS) else None
+
 class CacheManager:
+
+    # Per-contract key families, mapped to the key generator that builds them
+    KEY_FAMILIES = {
+        "contract_count": "get_contract_count_cache_key",
+        "contract_list": "get_contract_list_cache_key",
+        "contract": "get_contract_cache_key",
+        "party": "get_party_cache_key",
+        "transaction": "get_transaction_cache_key",
+        "settlement": "get_settlement_cache_key",
+        "artifact": "get_artifact_cache_key",
+    }
+
+    # Key families affected by each ContractEvent type; unknown types invalidate every family of the contract.
+    # The contract list is never deleted by an event, only patched (see invalidate_event)
+    EVENT_KEY_FAMILIES = {
+        "ContractAdded": ("contract_count",),
+        "ContractUpdated": ("contract",),
+        "ContractDeleted": ("contract",),
+        "ContractActivated": ("contract",),
+        "PartyAdded": ("party",),
+        "PartyDeleted": ("party",),
+        "PartiesDeleted": ("party",),
+        "ArtifactAdded": ("artifact",),
+        "ArtifactDeleted": ("artifact",),
+        "ArtifactsDeleted": ("artifact",),
+        "SettlementAdded": ("settlement",),
+        "SettlementsDeleted": ("settlement",),
+        "TransactionAdded": ("transaction", "settlement"),
+        "TransactionsDeleted": ("transaction", "settlement"),
+        "TransactionError": (),
+        "PayAdvance": ("transaction", "settlement"),
+        "PostSettlement": ("transaction", "settlement"),
+        "ResidualPaid": ("settlement",),
+    }
+    DEFAULT_EVENT_KEY_FAMILIES = ("contract", "party", "transaction", "settlement", "artifact")
+
+    # In-process tier policies, keyed by cache key prefix. ABIs and config change only on deploy or an
+    # explicit reset, so they are pinned; chain data is held briefly. Other keys always go to the shared cache
+    CONTRACT_DATA_LOCAL_TTL = 10
+    LOCAL_POLICIES = {
+        "contract_abi": LocalPolicy(ttl=None),
+        "config": LocalPolicy(ttl=None),
+        "library": LocalPolicy(ttl=None),
+        "contract_generation": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "count": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "contract_summaries": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "contract": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "party": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "transaction": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "settlement": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "artifact": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+        "party_code_index": LocalPolicy(ttl=CONTRACT_DATA_LOCAL_TTL),
+    }
+
+    # Shared by every instance in the process, like the secret store
+    _local_cache = LocalCache(LOCAL_POLICIES)
+
+    # Chain-backed families whose misses are computed once (see get_or_compute). Deleting one of their keys
+    # keeps the old value under stale_{key} for STALE_GRACE_TTL seconds, so waiting workers have something to serve
+    SINGLE_FLIGHT_FAMILIES = ("count", "contract_summaries", "contract", "party", "transaction", "settlement", "artifact")
+    STALE_KEY_PREFIX = "stale_"
+    STALE_GRACE_TTL = 30
+    LOCK_KEY_PREFIX = "lock_"
+    SINGLE_FLIGHT_LOCK_TTL = 30
+    SINGLE_FLIGHT_WAIT = 15
+    SINGLE_FLIGHT_POLL_INTERVAL = 0.05
+
+    # Per-contract families whose keys embed the contract's generation (see invalidate_contract). Bumping the
+    # generation orphans the old entries, which expire after VERSIONED_KEY_TTL instead of living forever
+    VERSIONED_FAMILIES = ("contract", "party", "transaction", "settlement", "artifact")
+    VERSIONED_KEY_TTL = 24 * 60 * 60
+
+    # Values are stored as CacheCodec bytes; swap the codec here to change the format for every writer
+    codec = CacheCodec()
+
+    # Key prefixes metrics are reported under, beyond those of the local tier; anything else is "other"
+    METRIC_FAMILIES = ("account", "recipient", "secret", "stats")
+
+    # Shared by every instance in the process
+    _metrics = CacheMetrics()
+
+    # In-process computations by key, shared by every instance in the process
+    _inflight = {}
+    _inflight_lock = threading.Lock()
+
+    # Contract list fields each event is known to set without further data from the writer
+    EVENT_SUMMARY_FIELDS = {
+        "ContractDeleted": {"is_active": False},
+        "ContractActivated": {"is_active": True},
+    }
+    SUMMARY_FIELDS = ("contract_name", "is_active", "transact_logic")
+
+    # Events that change which party codes a contract lists (see apply_party_event)
+    PARTY_EVENTS = ("PartyAdded", "PartyDeleted", "PartiesDeleted")
+
     def __init__(self):
         self.logger = logging.getLogger(__name__)
 
     # --- Cache Getters/Setters/Deleters ---
     
     def get(self, key, extra=None):
+        return self.get_with_block(key, extra=extra)[0]
+
+    def get_fresh(self, key, min_block=None, extra=None):
+        """get(), except that with min_block a value read before it, or not tagged with a block, is a miss."""
+        value, block = self.get_with_block(key, extra=extra)
+        if value is None or self._is_fresh(block, min_block):
+            return value
+
+        # The local tier may trail the shared cache; check there before treating the key as missing
+        self._local_cache.discard(key)
+        value, block = self.get_with_block(key, extra=extra)
+        return value if self._is_fresh(block, min_block) else None
+
+    @staticmethod
+    def _is_fresh(block, min_block):
+        # A consistency token must never be answered with data from before the block it names
+        return min_block is None or (block is not None and block >= min_block)
+
+    def get_with_block(self, key, extra=None):
+        """Return (value, block) where block is the block the value was read at, or None if it was not tagged."""
+        family = self.metric_family(key)
+
         try:
-            value = cache.get(key)
+            value = self._local_cache.get(key)
 
-            if value is not None:
-                log_info(self.logger, f"Cache HIT: {key}", extra=extra)
+            if value is not _MISSING:
+                self._metrics.incr(family, "local_hit")
             else:
-                log_warning(self.logger, f"Cache MISS: {key}", extra=extra)
+                started = time.perf_counter()
+                value = self._decode(cache.get(key))
+                self._metrics.observe_latency(family, time.perf_counter() - started)
 
-            return value
+                if value is not None:
+                    self._metrics.incr(family, "hit")
+                    self._local_cache.put(key, value)
+                else:
+                    self._metrics.incr(family, "miss")
+
+            if isinstance(value, BlockTagged):
+                return value.value, value.block
+
+            return value, None
 
         except Exception as e:
             # Only if cache backend fails (e.g., Redis is down)
+            self._metrics.incr(family, "error")
             log_error(self.logger, f"Cache ERROR retrieving key '{key}': {str(e)}")
+            return None, None
+
+        finally:
+            self._metrics.maybe_publish()
+
+    def metric_family(self, key):
+        """Key family a key's metrics are counted under."""
+        family = self._local_cache.family_of(key)
+        if family is not None:
+            return family
+        return next((family for family in self.METRIC_FAMILIES if key == family or key.startswith(f"{family}_")), "other")
+
+    def get_metrics(self):
+        """Cache metrics aggregated over every process that published them recently."""
+        return self._metrics.collect()
+
+    def reset_metrics(self):
+        self._metrics.reset()
+
+    def _record_write(self, key, encoded):
+        family = self.metric_family(key)
+        self._metrics.incr(family, "set")
+        self._metrics.incr(family, "bytes_written", len(encoded))
+
+    def _encode(self, stored):
+        return self.codec.encode(stored)
+
+    def _decode(self, raw):
+        """Decode a stored value; values written before the codec was introduced are returned as they are."""
+        if raw is None or not isinstance(raw, (bytes, bytearray)):
+            return raw
+
+        try:
+            return self.codec.decode(raw)
+        except Exception as e:
+            log_warning(self.logger, f"Cache value could not be decoded, treating it as a miss: {e}")
             return None
 
-    def set(self, key, value, timeout= None, extra=None):
+    def set(self, key, value, timeout= None, extra=None, block=None, overwrite=False):
+        """Cache a value; pass the block a chain read was pinned to so readers can tell how fresh it is.
+
+        Filling a miss leaves other processes' local copies alone. Pass overwrite when replacing a value they
+        may hold, so they drop it.
+        """
         try:
-            cache.set(key, value, timeout)
-            log_info(self.logger, f"Cache SET: {key} (timeout={timeout})", extra=extra)
+            timeout = self._resolve_timeout(key, timeout)
+            stored = BlockTagged(value, block) if block is not None else value
+            encoded = self._encode(stored)
+            cache.set(key, encoded, timeout)
+            if overwrite:
+                self._local_cache.bump_generation(key)
+            self._local_cache.put(key, stored, timeout)
+            self._record_write(key, encoded)
+            log_info(self.logger, f"Cache SET: {key} (timeout={timeout}, block={block})", extra=extra)
         except Exception as e:
+            self._metrics.incr(self.metric_family(key), "error")
             log_error(self.logger, f"Failed to set cache for key '{key}': {str(e)}", extra=extra)
 
+    def get_or_compute(self, key, compute, timeout=None, min_block=None, extra=None):
+        """Return the cached value of key, computing it once however many callers miss it at the same time.
+
+        compute() returns (value, block) and its result is cached like set(key, value, timeout, block=block).
+        Within a process, concurrent misses wait for the first caller's future. Across processes a lock in the
+        shared cache elects one caller to compute. The others serve the stale copy the last delete left behind,
+        if it was read at min_block or later, or else wait for the computed value. Waiters of either kind that
+        are still waiting after SINGLE_FLIGHT_WAIT serve the stale copy or compute the value themselves. With
+        min_block, any value read before it counts as a miss, whether cached, stale or handed over by another caller.
+        """
+        value = self.get_fresh(key, min_block, extra=extra)
+        if value is not None:
+            return value
+
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            is_leader = future is None
+            if is_leader:
+                future = Future()
+                self._inflight[key] = future
+
+        if not is_leader:
+            self._metrics.incr(self.metric_family(key), "wait")
+            try:
+                value, block = future.result(timeout=self.SINGLE_FLIGHT_WAIT)
+            except FutureTimeoutError:
+                # The leader is too slow; like a cross-process waiter, serve the stale copy or compute it here
+                stale = self._get_stale(key, min_block)
+                if stale is not _MISSING:
+                    self._metrics.incr(self.metric_family(key), "stale")
+                    return stale[0]
+                log_warning(self.logger, f"Cache WAIT for '{key}' gave up, computing it here", extra=extra)
+                return self._compute_and_set(key, compute, timeout, min_block, extra)[0]
+
+            if self._is_fresh(block, min_block):
+                return value
+            return self._compute_and_set(key, compute, timeout, min_block, extra)[0]
+
+        try:
+            value, block = self._compute_single_flight(key, compute, timeout, min_block, extra)
+            future.set_result((value, block))
+            return value
+        except Exception as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._inflight_lock:
+                self._inflight.pop(key, None)
+
+    def _compute_single_flight(self, key, compute, timeout, min_block, extra):
+        lock_key = f"{self.LOCK_KEY_PREFIX}{key}"
+
+        if self._acquire_lock(lock_key):
+            try:
+                return self._compute_and_set(key, compute, timeout, min_block, extra)
+            finally:
+                self._release_lock(lock_key)
+
+        stale = self._get_stale(key, min_block)
+        if stale is not _MISSING:
+            self._metrics.incr(self.metric_family(key), "stale")
+            return stale
+
+        self._metrics.incr(self.metric_family(key), "wait")
+        deadline = time.monotonic() + self.SINGLE_FLIGHT_WAIT
+        while time.monotonic() < deadline:
+            time.sleep(self.SINGLE_FLIGHT_POLL_INTERVAL)
+            try:
+                current = cache.get_many([key, lock_key])
+            except Exception as e:
+                log_warning(self.logger, f"Cache ERROR waiting for '{key}': {str(e)}", extra=extra)
+                break
+
+            stored = self._decode(current.get(key))
+            block = stored.block if isinstance(stored, BlockTagged) else None
+            if stored is not None and self._is_fresh(block, min_block):
+                self._local_cache.put(key, stored, timeout)
+                return (stored.value if isinstance(stored, BlockTagged) else stored), block
+
+            if lock_key not in current:
+                break
+
+        # The elected caller failed or is too slow; compute without the lock rather than fail the request
+        log_warning(self.logger, f"Cache WAIT for '{key}' gave up, computing it here", extra=extra)
+        return self._compute_and_set(key, compute, timeout, min_block, extra)
+
+    def _compute_and_set(self, key, compute, timeout, min_block, extra):
+        """Compute and cache a value; returns (value, block)."""
+        value, block = compute()
+
+        # Unpinned reads in a request carrying a token ran after the chain reached min_block
+        block = block if block is not None else min_block
+        self.set(key, value, timeout=timeout, extra=extra, block=block)
+        return value, block
+
+    def _acquire_lock(self, lock_key):
+        try:
+            return cache.add(lock_key, 1, self.SINGLE_FLIGHT_LOCK_TTL)
+        except Exception as e:
+            # Without a shared cache there is nothing to coordinate on; go ahead and compute
+            log_error(self.logger, f"Failed to acquire cache lock '{lock_key}': {str(e)}")
+            return True
+
+    def _release_lock(self, lock_key):
+        try:
+            cache.delete(lock_key)
+        except Exception as e:
+            log_error(self.logger, f"Failed to release cache lock '{lock_key}': {str(e)}")
+
+    def _get_stale(self, key, min_block):
+        """(value, block) of the stale copy of key, if it was read at min_block or later."""
+        try:
+            stored = self._decode(cache.get(f"{self.STALE_KEY_PREFIX}{key}"))
+        except Exception:
+            return _MISSING
+
+        if stored is None:
+            return _MISSING
+
+        value, block = (stored.value, stored.block) if isinstance(stored, BlockTagged) else (stored, None)
+        return (value, block) if self._is_fresh(block, min_block) else _MISSING
+
+    def _keep_stale(self, keys):
+        """Copy the single-flight keys among keys to their stale_ keys before they are deleted."""
+        keys = [key for key in keys if self._local_cache.family_of(key) in self.SINGLE_FLIGHT_FAMILIES]
+        if not keys:
+            return
+
+        current = cache.get_many(keys)
+        if current:
+            cache.set_many({f"{self.STALE_KEY_PREFIX}{key}": stored for key, stored in current.items()}, self.STALE_GRACE_TTL)
+
+    def get_many(self, keys, extra=None):
+        """Return {key: value} for the keys that are cached, in one shared-cache round trip for the local misses."""
+        try:
+            values = {}
+            remote_keys = []
+
+            for key in keys:
+                stored = self._local_cache.get(key)
+                if stored is _MISSING:
+                    remote_keys.append(key)
+                else:
+                    values[key] = stored
+
+            for key in values:
+                self._metrics.incr(self.metric_family(key), "local_hit")
+
+            if remote_keys:
+                started = time.perf_counter()
+                remote_values = cache.get_many(remote_keys)
+                elapsed = time.perf_counter() - started
+
+                for family in {self.metric_family(key) for key in remote_keys}:
+                    self._metrics.observe_latency(family, elapsed)
+
+                for key in remote_keys:
+                    stored = self._decode(remote_values.get(key))
+                    if stored is not None:
+                        values[key] = stored
+                        self._local_cache.put(key, stored)
+                    self._metrics.incr(self.metric_family(key), "hit" if stored is not None else "miss")
+
+            self._metrics.maybe_publish()
+            return {key: stored.value if isinstance(stored, BlockTagged) else stored for key, stored in values.items()}
+
+        except Exception as e:
+            for family in {self.metric_family(key) for key in keys}:
+                self._metrics.incr(family, "error")
+            log_error(self.logger, f"Cache ERROR retrieving {len(keys)} keys: {str(e)}", extra=extra)
+            return {}
+
+    def set_many(self, values, timeout=None, extra=None, block=None, overwrite=False):
+        """Cache several values in one round trip; block and overwrite apply to them all, as in set."""
+        if not values:
+            return
+
+        try:
+            stored = {key: BlockTagged(value, block) if block is not None else value for key, value in values.items()}
+
+            by_timeout = {}
+            for key, value in stored.items():
+                by_timeout.setdefault(self._resolve_timeout(key, timeout), {})[key] = value
+
+            for key_timeout, timeout_values in by_timeout.items():
+                encoded = {key: self._encode(value) for key, value in timeout_values.items()}
+                cache.set_many(encoded, key_timeout)
+                for key, value in timeout_values.items():
+                    self._local_cache.put(key, value, key_timeout)
+                    self._record_write(key, encoded[key])
+
+            if overwrite:
+                self._local_cache.bump_generations(stored)
+            log_info(self.logger, f"Cache SET_MANY: {len(stored)} keys (timeout={timeout}, block={block})", extra=extra)
+        except Exception as e:
+            for family in {self.metric_family(key) for key in values}:
+                self._metrics.incr(family, "error")
+            log_error(self.logger, f"Failed to set cache for {len(values)} keys: {str(e)}", extra=extra)
+
+    def delete_many(self, keys, extra=None):
+        if not keys:
+            return
+
+        try:
+            self._keep_stale(keys)
+            cache.delete_many(keys)
+            for key in keys:
+                self._metrics.incr(self.metric_family(key), "delete")
+                self._local_cache.discard(key)
+            self._local_cache.bump_generations(keys)
+            log_info(self.logger, f"Cache DELETE_MANY: {', '.join(keys)}", extra=extra)
+        except Exception as e:
+            for family in {self.metric_family(key) for key in keys}:
+                self._metrics.incr(family, "error")
+            log_error(self.logger, f"Failed to delete cache for keys {keys}: {str(e)}", extra=extra)
+
     def delete(self, key, extra=None):
         try:
+            self._keep_stale([key])
             cache.delete(key)
+            self._metrics.incr(self.metric_family(key), "delete")
+            self._local_cache.discard(key)
+            self._local_cache.bump_generation(key)
             log_info(self.logger, f"Cache DELETE: {key}", extra=extra)
         except Exception as e:
+            self._metrics.incr(self.metric_family(key), "error")
             log_error(self.logger, f"Failed to delete cache for key '{key}': {str(e)}", extra=extra)
 
+    def _resolve_timeout(self, key, timeout):
+        """Versioned keys are never cached forever, so entries orphaned by a generation bump age out."""
+        if timeout is None and self._local_cache.family_of(key) in self.VERSIONED_FAMILIES:
+            return self.VERSIONED_KEY_TTL
+        return timeout
+
+    def get_contract_generation(self, contract_type, contract_idx):
+        """Current generation of a contract's cache group; 0 until the group is first invalidated."""
+        key = self.get_contract_generation_cache_key(contract_type, contract_idx)
+        generation = self._local_cache.get(key)
+
+        if generation is _MISSING:
+            try:
+                generation = cache.get(key) or 0
+            except Exception as e:
+                log_error(self.logger, f"Cache ERROR retrieving key '{key}': {str(e)}")
+                return 0
+            self._local_cache.put(key, generation)
+
+        return generation
+
+    def prime_contract_generations(self, contracts):
+        """Load the generations of many (contract_type, contract_idx) pairs in one round trip before building their keys."""
+        keys = [self.get_contract_generation_cache_key(contract_type, contract_idx) for contract_type, contract_idx in contracts]
+        keys = [key for key in keys if self._local_cache.get(key) is _MISSING]
+        if not keys:
+            return
+
+        try:
+            generations = cache.get_many(keys)
+        except Exception as e:
+            log_error(self.logger, f"Cache ERROR retrieving {len(keys)} contract generations: {str(e)}")
+            return
+
+        for key in keys:
+            self._local_cache.put(key, generations.get(key) or 0)
+
+    def invalidate_contract(self, contract_type, contract_idx, extra=None, block=None):
+        """Invalidate every cached value of one contract at once by moving it to a new generation.
+
+        Readers switch to the new keys as soon as they see the new generation; the old entries are never read
+        again and expire on their own. The contract's entry of the contract list is marked stale as well, as
+        of block when a write's receipt is known.
+        """
+        key = self.get_contract_generation_cache_key(contract_type, contract_idx)
+
+        try:
+            try:
+                generation = cache.incr(key)
+            except ValueError:
+                generation = 1 if cache.add(key, 1, timeout=None) else cache.incr(key)
+
+            self._local_cache.discard(key)
+            self._local_cache.bump_generation(key)
+            log_info(self.logger, f"Cache INVALIDATE: {contract_type}:{contract_idx} is now generation {generation}", extra=extra)
+        except Exception as e:
+            log_error(self.logger, f"Failed to invalidate cache of {contract_type}:{contract_idx}: {str(e)}", extra=extra)
+
+        self.patch_contract_summary(contract_type, contract_idx, block=block)
+
     def clear_all(self):
         try:
             cache.clear()
+            self._local_cache.clear()
             log_warning(self.logger, "Cache cleared (ALL KEYS)")
         except Exception as e:
             log_error(self.logger, f"Failed to clear all caches: {str(e)}")
 
+    def get_event_cache_keys(self, contract_type, contract_idx, event_type=None):
+        """Return the cache keys a ContractEvent of event_type on contract_idx makes stale."""
+        families = self.EVENT_KEY_FAMILIES.get(event_type, self.DEFAULT_EVENT_KEY_FAMILIES)
+        keys = []
+
+        for family in families:
+            key_builder = getattr(self, self.KEY_FAMILIES[family])
+            if family in ("contract_count", "contract_list"):
+                keys.append(key_builder(contract_type))
+            else:
+                keys.append(key_builder(contract_type, contract_idx))
+
+        return keys
+
+    def invalidate_event(self, contract_type, contract_idx, event_type=None, event_data=None, details=None, block=None):
+        """Delete exactly the keys made stale by a ContractEvent and patch the contract list entry it touches.
+
+        ContractAdded advances the count and list instead. For other events event_data holds the changed
+        summary fields ({"contract_name", "is_active", "transact_logic"}) when the writer knows them, and
+        details is the event's details string from the log. block is the block the event was mined in; the
+        patched count and list count as read at that block, so a consistency token for it does not rebuild them.
+        """
+        if event_type == "ContractAdded":
+            self.apply_contract_added(contract_type, contract_idx, summary=event_data, block=block)
+            return
+
+        # Events we cannot narrow down may have added parties as well
+        if event_type in self.PARTY_EVENTS or (event_type is not None and event_type not in self.EVENT_KEY_FAMILIES):
+            self.apply_party_event(contract_type, contract_idx, event_type, details)
+
+        # Events we cannot narrow down invalidate the contract's whole cache group at once
+        if event_type not in self.EVENT_KEY_FAMILIES:
+            self.invalidate_contract(contract_type, contract_idx, extra={"event_type": event_type}, block=block)
+            return
+
+        self.delete_many(self.get_event_cache_keys(contract_type, contract_idx, event_type), extra={"event_type": event_type})
+
+        if "contract" not in self.EVENT_KEY_FAMILIES[event_type]:
+            return
+
+        self.patch_contract_summary(contract_type, contract_idx, event_data or self.EVENT_SUMMARY_FIELDS.get(event_type), block=block)
+
+    def invalidate_events(self, contract_type, events, event_data=None, block=None):
+        """Apply a batch of (contract_idx, event_type, details) ContractEvents, each distinct event once.
+
+        A chunk of rows emits one event per row; they all invalidate the same keys. Party events stay apart
+        by details, which name the party code the index needs. block is the latest block the events were mined in.
+        """
+        distinct = {}
+        for contract_idx, event_type, details in events:
+            distinct.setdefault((contract_idx, event_type, details if event_type in self.PARTY_EVENTS else None), details)
+
+        for (contract_idx, event_type, _), details in distinct.items():
+            self.invalidate_event(contract_type, contract_idx, event_type, (event_data or {}).get(event_type), details, block)
+
+    def patch_contract_summary(self, contract_type, contract_idx, fields=None, block=None):
+        """Update one entry of the cached contract list in place.
+
+        Without fields the entry is marked stale (None) and list_contracts re-reads just that contract.
+        Safe to apply more than once, so the writer and the event listener can both apply the same event.
+        block, the block of the write, raises the list's block tag.
+        """
+        list_key = self.get_contract_list_cache_key(contract_type)
+        lock_key = self._contract_list_lock_key(contract_type)
+
+        if not self._wait_for_lock(lock_key):
+            # Writing without the lock could undo a concurrent update; let the next list call rebuild instead
+            self.delete(list_key)
+            return
+
+        try:
+            summaries, list_block = self._get_shared_with_block(list_key)
+
+            if summaries is None or contract_idx >= len(summaries):
+                return
+
+            summaries = list(summaries)
+            entry = summaries[contract_idx]
+
+            if fields is None or entry is None:
+                summaries[contract_idx] = None
+            else:
+                current = dict(zip(self.SUMMARY_FIELDS, entry[1:]))
+                current.update({field: value for field, value in fields.items() if field in current})
+                summaries[contract_idx] = (contract_idx, *(current[field] for field in self.SUMMARY_FIELDS))
+
+            self.set(list_key, summaries, timeout=None, block=self._latest_block(list_block, block), overwrite=True)
+        finally:
+            self._release_lock(lock_key)
+
+    def fill_stale_summaries(self, contract_type, refreshed):
+        """Put re-read {contract_idx: summary} entries into the cached list where they are still marked stale."""
+        list_key = self.get_contract_list_cache_key(contract_type)
+        lock_key = self._contract_list_lock_key(contract_type)
+
+        if not self._wait_for_lock(lock_key):
+            self.delete(list_key)
+            return
+
+        try:
+            summaries, block = self._get_shared_with_block(list_key)
+            if summaries is None:
+                return
+
+            summaries = list(summaries)
+            for contract_idx, summary in refreshed.items():
+                if contract_idx < len(summaries) and summaries[contract_idx] is None:
+                    summaries[contract_idx] = summary
+
+            self.set(list_key, summaries, timeout=None, block=block, overwrite=True)
+        finally:
+            self._release_lock(lock_key)
+
+    def reset_contract_list(self, contract_type):
+        """Drop the cached contract list so the next list call rebuilds it from chain."""
+        self.delete(self.get_contract_list_cache_key(contract_type))
+
+    def apply_contract_added(self, contract_type, contract_idx, summary=None, block=None):
+        """Advance the cached contract count, and the contract list when the summary is known, past a new contract.
+
+        Idempotent, so the writer and the event listener can both apply the same event. A cached value that
+        is missing earlier contracts, or a list the summary is not known for, is deleted instead. The advanced
+        values are tagged with block, the block the contract was added in, when that is newer than their own.
+        """
+        count_key = self.get_contract_count_cache_key(contract_type)
+        list_key = self.get_contract_list_cache_key(contract_type)
+        lock_key = self._contract_list_lock_key(contract_type)
+
+        if not self._wait_for_lock(lock_key):
+            self.delete_many([count_key, list_key])
+            return
+
+        try:
+            count, count_block = self._get_shared_with_block(count_key)
+
+            if count == contract_idx:
+                self.set(count_key, contract_idx + 1, timeout=None, block=self._latest_block(count_block, block), overwrite=True)
+            elif count is not None and count < contract_idx:
+                self.delete(count_key)
+
+            summaries, list_block = self._get_shared_with_block(list_key)
+
+            if summaries is None or len(summaries) > contract_idx:
+                return
+
+            if len(summaries) == contract_idx and summary is not None:
+                self.set(list_key, list(summaries) + [(contract_idx, *summary)], timeout=None, block=self._latest_block(list_block, block), overwrite=True)
+            else:
+                self.delete(list_key)
+        finally:
+            self._release_lock(lock_key)
+
+    @staticmethod
+    def _latest_block(*blocks):
+        blocks = [block for block in blocks if block is not None]
+        return max(blocks) if blocks else None
+
+    def _get_shared_with_block(self, key):
+        # Read-modify-write must start from the shared copy; the local tier may hold an older one
+        self._local_cache.discard(key)
+        return self.get_with_block(key)
+
+    def _contract_list_lock_key(self, contract_type):
+        # Not the single-flight lock of the list key, which a full rebuild holds for its whole page-through
+        return f"{self.LOCK_KEY_PREFIX}patch_{self.get_contract_list_cache_key(contract_type)}"
+
+    def get_party_code_index(self, party_code):
+        """(contract_type, contract_idx) of every contract listing party_code, or None until the index is (re)built."""
+        codes_key = self.get_party_code_index_codes_cache_key()
+        code_key = self.get_party_code_index_cache_key(party_code)
+        cached = self.get_many([codes_key, code_key])
+
+        if codes_key not in cached:
+            return None
+
+        # Entries of codes the current build did not see may outlive an evicted index; they do not count
+        if party_code.lower() not in cached[codes_key]:
+            return []
+
+        # A listed code whose entry was evicted is a miss, not a party without contracts
+        return list(cached[code_key]) if code_key in cached else None
+
+    def get_party_code_index_version(self):
+        """Counter bumped by every party event; a build only stores its index if it has not moved meanwhile."""
+        try:
+            return cache.get(self.get_party_code_index_version_cache_key()) or 0
+        except Exception as e:
+            log_error(self.logger, f"Failed to read party code index version: {str(e)}")
+            return None
+
+    def store_party_code_index(self, index, version):
+        """Store a freshly built {party_code: {(contract_type, contract_idx)}} index.
+
+        Skipped, and False returned, when a party event landed after the build read version; the build's
+        data may predate that event, so the next lookup builds again.
+        """
+        lock_key = f"{self.LOCK_KEY_PREFIX}{self.get_party_code_index_codes_cache_key()}"
+        if version is None or not self._wait_for_lock(lock_key):
+            return False
+
+        try:
+            if self.get_party_code_index_version() != version:
+                return False
+
+            values = {self.get_party_code_index_cache_key(code): sorted(pairs) for code, pairs in index.items()}
+            values[self.get_party_code_index_codes_cache_key()] = sorted(index)
+            self.set_many(values, timeout=None)
+            return True
+        finally:
+            self._release_lock(lock_key)
+
+    def apply_party_event(self, contract_type, contract_idx, event_type, details=None):
+        """Keep the party code index in step with an event on a contract's parties. Safe to apply more than once.
+
+        PartyAdded carries the party code, so the contract joins that code's entry; PartiesDeleted removes the
+        contract from every entry. PartyDeleted only names a party index, so its entry is left in place; lookups
+        re-check matches against the current parties. Unknown events may have added parties, so for those the
+        index is dropped and rebuilt on next use. Without an event type nothing was logged and nothing changes.
+        """
+        if event_type is None or event_type == "PartyDeleted":
+            return
+
+        lock_key = f"{self.LOCK_KEY_PREFIX}{self.get_party_code_index_codes_cache_key()}"
+        codes_key = self.get_party_code_index_codes_cache_key()
+        contract_key = (contract_type, contract_idx)
+
+        if not self._wait_for_lock(lock_key):
+            self.drop_party_code_index()
+            return
+
+        try:
+            self._bump_party_code_index_version()
+            codes = self.get(codes_key)
+
+            if codes is None:
+                return
+
+            if event_type == "PartyAdded" and details:
+                party_code = details.lower()
+                code_key = self.get_party_code_index_cache_key(party_code)
+                contract_keys = self.get(code_key) if party_code in codes else []
+
+                if contract_keys is None:
+                    self._drop_party_code_index(codes)
+                elif contract_key not in contract_keys:
+                    self.set(code_key, sorted([*contract_keys, contract_key]), timeout=None, overwrite=True)
+                    if party_code not in codes:
+                        self.set(codes_key, sorted([*codes, party_code]), timeout=None, overwrite=True)
+
+            elif event_type == "PartiesDeleted":
+                code_keys = [self.get_party_code_index_cache_key(party_code) for party_code in codes]
+                entries = self.get_many(code_keys)
+
+                if len(entries) < len(code_keys):
+                    self._drop_party_code_index(codes)
+                else:
+                    self.set_many({
+                        code_key: [key for key in contract_keys if key != contract_key]
+                        for code_key, contract_keys in entries.items() if contract_key in contract_keys
+                    }, timeout=None, overwrite=True)
+
+            else:
+                self._drop_party_code_index(codes)
+
+        except Exception as e:
+            log_error(self.logger, f"Failed to apply {event_type} on {contract_type}:{contract_idx} to the party code index: {str(e)}")
+            self._drop_party_code_index()
+        finally:
+            self._release_lock(lock_key)
+
+    def drop_party_code_index(self):
+        """Forget the party code index; the next lookup rebuilds it."""
+        self._bump_party_code_index_version()
+        self._drop_party_code_index()
+
+    def _drop_party_code_index(self, codes=None):
+        codes_key = self.get_party_code_index_codes_cache_key()
+        codes = codes if codes is not None else (self.get(codes_key) or [])
+        self.delete_many([codes_key, *(self.get_party_code_index_cache_key(party_code) for party_code in codes)])
+
+    def _bump_party_code_index_version(self):
+        key = self.get_party_code_index_version_cache_key()
+        try:
+            try:
+                cache.incr(key)
+            except ValueError:
+                if not cache.add(key, 1, timeout=None):
+                    cache.incr(key)
+        except Exception as e:
+            log_error(self.logger, f"Failed to bump party code index version: {str(e)}")
+
+    def _wait_for_lock(self, lock_key):
+        """Acquire a cache lock, waiting up to SINGLE_FLIGHT_WAIT for its holder; False if it never frees up."""
+        deadline = time.monotonic() + self.SINGLE_FLIGHT_WAIT
+        while not self._acquire_lock(lock_key):
+            if time.monotonic() >= deadline:
+                log_warning(self.logger, f"Timed out waiting for cache lock '{lock_key}'")
+                return False
+            time.sleep(self.SINGLE_FLIGHT_POLL_INTERVAL)
+        return True
+
     # --- Cache Key Generators (unchanged) ---
 
     @staticmethod
@@ -77,28 +1256,41 @@ class CacheManager:
         return f"contract_abi_{contract_type}"
 
     @staticmethod
-    def get_contract_cache_key(contract_type, contract_idx):
-        return f"contract_{contract_type}_{contract_idx}"
+    def get_contract_generation_cache_key(contract_type, contract_idx):
+        return f"contract_generation_{contract_type}_{contract_idx}"
+
+    # Per-contract keys embed the contract's generation
+
+    def get_contract_cache_key(self, contract_type, contract_idx):
+        return f"contract_{contract_type}_{contract_idx}_g{self.get_contract_generation(contract_type, contract_idx)}"
 
     @staticmethod
     def get_contract_list_cache_key(contract_type):
-        return f"contract_list_{contract_type}"
+        return f"contract_summaries_{contract_type}"
 
-    @staticmethod
-    def get_transaction_cache_key(contract_type, contract_idx):
-        return f"transaction_{contract_type}_{contract_idx}"
+    def get_transaction_cache_key(self, contract_type, contract_idx):
+        return f"transaction_{contract_type}_{contract_idx}_g{self.get_contract_generation(contract_type, contract_idx)}"
+
+    def get_settlement_cache_key(self, contract_type, contract_idx):
+        return f"settlement_{contract_type}_{contract_idx}_g{self.get_contract_generation(contract_type, contract_idx)}"
+
+    def get_party_cache_key(self, contract_type, contract_idx):
+        return f"party_{contract_type}_{contract_idx}_g{self.get_contract_generation(contract_type, contract_idx)}"
+
+    def get_artifact_cache_key(self, contract_type, contract_idx):
+        return f"artifact_{contract_type}_{contract_idx}_g{self.get_contract_generation(contract_type, contract_idx)}"
 
     @staticmethod
-    def get_settlement_cache_key(contract_type, contract_idx):
-        return f"settlement_{contract_type}_{contract_idx}"
+    def get_party_code_index_cache_key(party_code):
+        return f"party_code_index_{party_code.lower()}"
 
     @staticmethod
-    def get_party_cache_key(contract_type, contract_idx):
-        return f"party_{contract_type}_{contract_idx}"
+    def get_party_code_index_codes_cache_key():
+        return "party_code_index_codes"
 
     @staticmethod
-    def get_artifact_cache_key(contract_type, contract_idx):
-        return f"artifact_{contract_type}_{contract_idx}"
+    def get_party_code_index_version_cache_key():
+        return "party_code_index_version"
 
     @staticmethod
     def get_stats_cache_key():
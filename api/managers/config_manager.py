@@ -224,4 +224,38 @@ class ConfigManager:
         return self._get_config_value("stats_sleep_time", 300)
 
     def get_network_sleep_time(self):
-        return self._get_config_value("network_sleep_time", 1)
\ No newline at end of file
+        return self._get_config_value("network_sleep_time", 1)
+
+    def get_secret_ttl(self):
+        return self._get_config_value("secret_ttl", 300)
+
+    def get_secret_refresh_margin(self):
+        return self._get_config_value("secret_refresh_margin", 60)
+
+    def get_decrypt_workers(self):
+        return self._get_config_value("decrypt_workers", 4)
+
+    def get_decrypt_parallel_threshold(self):
+        return self._get_config_value("decrypt_parallel_threshold", 1000)
+
+    def get_job_workers(self):
+        return self._get_config_value("job_workers", 4)
+
+    def get_batch_max_rows(self):
+        return self._get_config_value("batch_max_rows", 100)
+
+    def get_max_page_size(self):
+        return self._get_config_value("max_page_size", 500)
+
+    def get_contract_summary_page_size(self):
+        return self._get_config_value("contract_summary_page_size", 500)
+
+    def get_rpc_batch_size(self):
+        return self._get_config_value("rpc_batch_size", 100)
+
+    def get_read_modes(self):
+        # Per-endpoint read source, e.g. {"transaction": "mirror"}; endpoints not listed read from chain
+        return self._get_config_value("read_modes", {})
+
+    def get_mirror_block_span(self):
+        return self._get_config_value("mirror_block_span", 2000)
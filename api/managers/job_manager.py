@@ -0,0 +1,162 @@
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.db import close_old_connections
+from django.utils import timezone
+from web3 import Web3
+from web3.exceptions import TransactionNotFound
+
+from api.models.event_model import Event
+from api.models.job_model import Job
+from api.utilities.logging import log_error, log_info, log_warning
+
+class JobManager:
+    """Runs chain writes asynchronously: broadcast on the request thread, confirm on a background pool.
+
+    Confirmation lives in the memory of the process that broadcast, so a job whose worker recycled before its
+    receipts arrived stays pending. Such a job is re-checked by tx hash when it is next read, once it has been
+    pending longer than a confirming worker would have waited (see get_job).
+    """
+
+    # Beyond the receipt wait of the confirming worker, after which a pending job has lost its confirmer
+    ORPHAN_GRACE = 60
+
+    # One confirmation pool per process, shared by every context
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(self, context):
+        self.context = context
+        self.logger = logging.getLogger(__name__)
+
+    def _get_executor(self):
+        if JobManager._executor is None:
+            with JobManager._executor_lock:
+                if JobManager._executor is None:
+                    JobManager._executor = ThreadPoolExecutor(
+                        max_workers=self.context.config_manager.get_job_workers(),
+                        thread_name_prefix="job"
+                    )
+        return JobManager._executor
+
+    def submit(self, operation, transactions, wallet_addr, contract_type, contract_idx, on_confirmed=None, event_data=None):
+        """Broadcast transactions and return the job without waiting for receipts.
+
+        Once every receipt is in, the job's Event rows are updated, the caches named by each receipt's
+        ContractEvent logs are invalidated and on_confirmed(receipts) (if given) is called when all transactions
+        succeeded. contract_idx may be None for addContract; the job then takes it from the ContractAdded log.
+        """
+        network = self.context.domain_manager.get_contract_network()
+        tx_hashes = self.context.web3_manager.broadcast_signed_transactions(
+            transactions, wallet_addr, contract_type, contract_idx, network
+        )
+
+        if "MfaRequired" in tx_hashes:
+            raise RuntimeError(f"Signer requires MFA for {operation}; it cannot be submitted asynchronously")
+
+        job = Job.objects.create(
+            operation=operation,
+            contract_type=contract_type,
+            contract_idx=contract_idx,
+            network=network,
+            tx_hashes=[Web3.to_hex(tx_hash) for tx_hash in tx_hashes],
+        )
+
+        log_info(self.logger, f"Submitted job {job.job_id} for {operation} on {contract_type}:{contract_idx}")
+        self._get_executor().submit(self._confirm, job.job_id, wallet_addr, on_confirmed, event_data)
+
+        return {"job_id": str(job.job_id), "status": job.status, "tx_hashes": job.tx_hashes}
+
+    def get_job(self, job_id):
+        job = Job.objects.filter(job_id=job_id).first()
+
+        orphaned_before = timezone.now() - timedelta(seconds=self.context.web3_manager.RECEIPT_TIMEOUT + self.ORPHAN_GRACE)
+        if job is not None and job.status == "pending" and job.created_dt < orphaned_before:
+            self._recheck(job)
+
+        return job
+
+    def _confirm(self, job_id, wallet_addr, on_confirmed, event_data=None):
+        job = None
+
+        try:
+            job = Job.objects.get(job_id=job_id)
+
+            try:
+                receipts = self.context.web3_manager.wait_for_receipts(job.tx_hashes, job.network)
+            except Exception:
+                # A dropped or underpriced transaction leaves the local nonce ahead of the chain
+                self.context.web3_manager.resync_nonce(wallet_addr, job.network)
+                raise
+
+            self._apply_receipts(job, receipts, on_confirmed, event_data)
+
+        except Exception as e:
+            log_error(self.logger, f"Error confirming job {job_id}: {e}")
+            if job is not None:
+                job.status = "failed"
+                job.error = str(e)[:255]
+
+        finally:
+            if job is not None:
+                job.completed_dt = timezone.now()
+                job.save()
+            close_old_connections()
+
+    def _recheck(self, job):
+        """Settle a pending job that lost its confirming worker, once all its receipts are in.
+
+        A transaction the node no longer knows was dropped, which fails the job; one still in the pool keeps it
+        pending. The submitter's on_confirmed callback died with the worker and is not run.
+        """
+        web3_instance = self.context.web3_manager.get_web3_instance(job.network)
+        receipts = []
+
+        try:
+            for tx_hash in job.tx_hashes:
+                try:
+                    receipts.append(web3_instance.eth.get_transaction_receipt(tx_hash))
+                except TransactionNotFound:
+                    web3_instance.eth.get_transaction(tx_hash)
+                    return
+
+            self._apply_receipts(job, receipts, None)
+
+        except TransactionNotFound:
+            job.status = "failed"
+            job.error = "Transaction dropped before it was mined"
+            log_warning(self.logger, f"Job {job.job_id} failed: {job.error}")
+
+        except Exception as e:
+            log_error(self.logger, f"Error re-checking job {job.job_id}: {e}")
+            return
+
+        job.completed_dt = timezone.now()
+        job.save()
+
+    def _apply_receipts(self, job, receipts, on_confirmed, event_data=None):
+        """Record the receipts of a job on its Event rows and the job itself, and invalidate the caches they touched."""
+        failed_count = 0
+        for tx_hash, receipt in zip(job.tx_hashes, receipts):
+            event_status = "complete" if receipt["status"] == 1 else "failed"
+            failed_count += event_status == "failed"
+
+            if job.contract_idx is None and event_status == "complete":
+                job.contract_idx = self.context.web3_manager.get_added_contract_idx(receipt)
+
+            Event.objects.filter(tx_hash=tx_hash).update(
+                status=event_status, gas_used=receipt.get("gasUsed"), contract_idx=job.contract_idx
+            )
+            self.context.web3_manager.invalidate_from_receipt(receipt, job.contract_type, job.contract_idx, event_data)
+
+        if failed_count:
+            job.status = "failed"
+            job.error = f"{failed_count} of {len(job.tx_hashes)} transactions reverted"
+            log_warning(self.logger, f"Job {job.job_id} failed: {job.error}")
+        else:
+            job.status = "complete"
+            if on_confirmed:
+                on_confirmed(receipts)
+            log_info(self.logger, f"Job {job.job_id} complete")
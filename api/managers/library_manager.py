@@ -60,7 +60,7 @@ class LibraryManager():
         })
 
         # Update Redis cache
-        self.cache_manager.set(self.cache_key, library_cache, timeout=None)
+        self.cache_manager.set(self.cache_key, library_cache, timeout=None, overwrite=True)
         self._save_library(library_cache)
 
     def get_templates_by_contract_type(self, contract_type):
@@ -0,0 +1,196 @@
+import logging
+from datetime import datetime, timezone
+
+from django.db import transaction
+
+from api.models import (
+    ArtifactSnapshot, ContractSnapshot, MirrorCursor, PartySnapshot, SettlementSnapshot, TransactionSnapshot
+)
+
+class MirrorManager:
+    """SQL read model of on-chain contract state, kept in sync by the mirror indexer (manage.py index_mirror).
+
+    Each read endpoint serves from chain (through the cache) or from the mirror, as set by the read_modes
+    config. The read_* methods return None, so the caller falls back to chain, when the endpoint is in chain
+    mode, the contract type is not backfilled yet, or the mirror has not indexed the block a request must see.
+    Values come back in the shape the chain getters return them, so callers parse them the same way.
+    """
+
+    CHAIN = "chain"
+    MIRROR = "mirror"
+
+    # Per-contract families and the getter the indexer re-reads each one with
+    FAMILY_GETTERS = {
+        "contract": "getContract",
+        "party": "getParties",
+        "transaction": "getTransactions",
+        "settlement": "getSettlements",
+        "artifact": "getArtifacts",
+    }
+
+    # Item families, one row per list entry: model, index field, and the extra columns taken from the raw entry
+    ITEM_MODELS = {
+        "party": (PartySnapshot, "party_idx", lambda raw: {"party_code": raw[0].lower(), "party_type": raw[2]}),
+        "transaction": (TransactionSnapshot, "transact_idx", lambda raw: {"transact_dt": _from_timestamp(raw[1])}),
+        "settlement": (SettlementSnapshot, "settle_idx", lambda raw: {"settle_due_dt": _from_timestamp(raw[1])}),
+        "artifact": (ArtifactSnapshot, "artifact_idx", lambda raw: {"doc_title": raw[0]}),
+    }
+
+    def __init__(self, context):
+        self.context = context
+        self.logger = logging.getLogger(__name__)
+
+    def get_mode(self, endpoint):
+        mode = self.context.config_manager.get_read_modes().get(endpoint, self.CHAIN)
+        if mode not in (self.CHAIN, self.MIRROR):
+            raise ValueError(f"Unknown read mode '{mode}' for {endpoint}")
+        return mode
+
+    def get_cursor(self, contract_type):
+        release = self.context.config_manager.get_contract_release(contract_type)
+        return MirrorCursor.objects.filter(contract_type=contract_type, contract_release=release).first()
+
+    def _serving_cursor(self, endpoint, contract_type, min_block):
+        if self.get_mode(endpoint) != self.MIRROR:
+            return None
+
+        cursor = self.get_cursor(contract_type)
+        if cursor is None or (min_block is not None and cursor.last_block < min_block):
+            return None
+        return cursor
+
+    def read_contract_count(self, contract_type, min_block=None):
+        cursor = self._serving_cursor("contract_count", contract_type, min_block)
+        return cursor.contract_count if cursor is not None else None
+
+    def read_contract_summaries(self, contract_type, min_block=None):
+        """(contract_idx, contract_name, is_active, transact_logic) for every contract, like the cached list."""
+        cursor = self._serving_cursor("contract_list", contract_type, min_block)
+        if cursor is None:
+            return None
+
+        return list(
+            ContractSnapshot.objects
+            .filter(contract_type=contract_type, contract_release=cursor.contract_release)
+            .order_by("contract_idx")
+            .values_list("contract_idx", "contract_name", "is_active", "transact_logic")
+        )
+
+    def read_contract(self, contract_type, contract_idx, min_block=None):
+        cursor = self._serving_cursor("contract", contract_type, min_block)
+        if cursor is None:
+            return None
+
+        snapshot = ContractSnapshot.objects.filter(
+            contract_type=contract_type, contract_release=cursor.contract_release, contract_idx=contract_idx
+        ).first()
+        return snapshot.raw if snapshot is not None else None
+
+    def read_items(self, family, contract_type, contract_idx, min_block=None):
+        """Raw parties, transactions, settlements or artifacts of a contract, in chain order."""
+        items = self._item_queryset(family, contract_type, contract_idx, min_block)
+        return list(items.values_list("raw", flat=True)) if items is not None else None
+
+    def read_item_page(self, family, contract_type, contract_idx, offset, limit, min_block=None):
+        """(item count, raw items offset to offset + limit) of a contract, with the slice done in SQL."""
+        items = self._item_queryset(family, contract_type, contract_idx, min_block)
+        if items is None:
+            return None
+        return items.count(), list(items[offset:offset + limit].values_list("raw", flat=True))
+
+    def read_party_contracts(self, party_code, min_block=None):
+        """(contract_type, contract_idx) of every contract listing party_code, from the indexed party_code column.
+
+        None unless the party endpoint reads from the mirror and every contract type is mirrored.
+        """
+        cursors = [self._serving_cursor("party", contract_type, min_block) for contract_type in self.context.domain_manager.get_contract_types()]
+        if None in cursors:
+            return None
+
+        contract_keys = set()
+        for cursor in cursors:
+            contract_keys.update(
+                PartySnapshot.objects
+                .filter(contract_type=cursor.contract_type, contract_release=cursor.contract_release, party_code=party_code.lower())
+                .values_list("contract_type", "contract_idx")
+            )
+        return sorted(contract_keys)
+
+    def _item_queryset(self, family, contract_type, contract_idx, min_block):
+        cursor = self._serving_cursor(family, contract_type, min_block)
+        keys = {"contract_type": contract_type, "contract_release": cursor.contract_release, "contract_idx": contract_idx} if cursor else None
+
+        # Items of a contract the mirror has never seen would look like an empty list; let chain answer instead
+        if keys is None or not ContractSnapshot.objects.filter(**keys).exists():
+            return None
+
+        model, idx_field, _ = self.ITEM_MODELS[family]
+        return model.objects.filter(**keys).order_by(idx_field)
+
+    def store_snapshots(self, contract_type, contract_release, contract_idx, block_number, values):
+        """Replace a contract's snapshots with values read at block_number.
+
+        values maps families to raw getter results; "contract" is (raw_contract, summary), where summary is the
+        contract's getContractSummaries entry.
+        """
+        keys = {"contract_type": contract_type, "contract_release": contract_release, "contract_idx": contract_idx}
+
+        with transaction.atomic():
+            if "contract" in values:
+                raw_contract, (contract_name, is_active, transact_logic) = values["contract"]
+                ContractSnapshot.objects.update_or_create(**keys, defaults={
+                    "raw": raw_contract,
+                    "contract_name": contract_name,
+                    "is_active": is_active,
+                    "transact_logic": transact_logic,
+                    "block_number": block_number,
+                })
+            else:
+                ContractSnapshot.objects.filter(**keys).update(block_number=block_number)
+
+            for family, (model, idx_field, columns) in self.ITEM_MODELS.items():
+                if family not in values:
+                    continue
+
+                model.objects.filter(**keys).delete()
+                model.objects.bulk_create([
+                    model(**keys, **{idx_field: item_idx}, **columns(raw), raw=raw, block_number=block_number)
+                    for item_idx, raw in enumerate(values[family])
+                ])
+
+    def save_cursor(self, contract_type, contract_release, network, contract_count, last_block):
+        MirrorCursor.objects.update_or_create(
+            contract_type=contract_type,
+            contract_release=contract_release,
+            defaults={"network": network, "contract_count": contract_count, "last_block": last_block},
+        )
+
+    def get_lag(self):
+        """How far each mirrored contract type trails the chain, in blocks and in seconds since its last index pass."""
+        lag = {}
+        head_blocks = {}
+        now = datetime.now(timezone.utc)
+
+        for contract_type in self.context.domain_manager.get_contract_types():
+            cursor = self.get_cursor(contract_type)
+            if cursor is None:
+                lag[contract_type] = {"mirrored": False}
+                continue
+
+            if cursor.network not in head_blocks:
+                head_blocks[cursor.network] = self.context.web3_manager.get_block_number(cursor.network)
+
+            lag[contract_type] = {
+                "mirrored": True,
+                "contract_release": cursor.contract_release,
+                "contract_count": cursor.contract_count,
+                "last_block": cursor.last_block,
+                "head_block": head_blocks[cursor.network],
+                "lag_blocks": max(head_blocks[cursor.network] - cursor.last_block, 0),
+                "lag_seconds": round((now - cursor.updated_dt).total_seconds(), 1),
+            }
+
+        return lag
+
+def _from_timestamp(timestamp):
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc)
@@ -1,21 +1,125 @@
 import boto3
+import hashlib
 import json
 import os
 import logging
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set
 from botocore.exceptions import ClientError
-from datetime import datetime
 
 from api.managers.cache_manager import CacheManager
 from api.utilities.logging import log_error, log_info, log_warning
 
+@dataclass
+class CachedSecret:
+    value: Any
+    refresh_at: float       # monotonic time after which a background refresh is started
+    expires_at: float       # monotonic time after which the value is served as stale
+
+class SecretStore:
+    """Thread-safe in-memory secret cache with background refresh and stale-while-revalidate."""
+
+    DEFAULT_TTL = 300
+    DEFAULT_REFRESH_MARGIN = 60
+    RETRY_INTERVAL = 30
+
+    def __init__(self, ttl: float = DEFAULT_TTL, refresh_margin: float = DEFAULT_REFRESH_MARGIN):
+        self.logger = logging.getLogger(__name__)
+        self._entries: Dict[str, CachedSecret] = {}
+        self._refreshing: Set[str] = set()
+        self._lock = threading.Lock()
+        self.configure(ttl, refresh_margin)
+
+    def configure(self, ttl: float, refresh_margin: float) -> None:
+        self.ttl = ttl
+        self.refresh_margin = min(refresh_margin, ttl)
+
+    def get(self, name: str, loader: Callable[[], Any], seed: Optional[Callable[[], Any]] = None) -> Any:
+        """Return the cached value. Only a cold start calls the loader on the caller's thread."""
+        entry = self._entries.get(name)
+
+        if entry is None:
+            return self._load_initial(name, loader, seed)
+
+        if time.monotonic() >= entry.refresh_at:
+            self._refresh_in_background(name, loader)
+
+        return entry.value
+
+    def invalidate(self, name: Optional[str] = None) -> None:
+        with self._lock:
+            if name is None:
+                self._entries.clear()
+            else:
+                self._entries.pop(name, None)
+
+    def _load_initial(self, name: str, loader: Callable[[], Any], seed: Optional[Callable[[], Any]]) -> Any:
+        with self._lock:
+            entry = self._entries.get(name)
+            if entry is not None:
+                return entry.value
+
+            value = seed() if seed else None
+            if not value:
+                value = loader()
+
+            self._entries[name] = self._build_entry(value)
+            return value
+
+    def _refresh_in_background(self, name: str, loader: Callable[[], Any]) -> None:
+        with self._lock:
+            if name in self._refreshing:
+                return
+            self._refreshing.add(name)
+
+        threading.Thread(target=self._refresh, args=(name, loader), daemon=True).start()
+
+    def _refresh(self, name: str, loader: Callable[[], Any]) -> None:
+        try:
+            value = loader()
+            with self._lock:
+                self._entries[name] = self._build_entry(value)
+            log_info(self.logger, f"Refreshed secret {name}")
+
+        except Exception as e:
+            # Keep serving the last known value and retry later
+            stale = False
+            with self._lock:
+                entry = self._entries.get(name)
+                if entry is not None:
+                    entry.refresh_at = time.monotonic() + self.RETRY_INTERVAL
+                    stale = time.monotonic() >= entry.expires_at
+            log_warning(self.logger, f"Failed to refresh secret {name}, serving {'stale' if stale else 'cached'} value: {e}")
+
+        finally:
+            with self._lock:
+                self._refreshing.discard(name)
+
+    def _build_entry(self, value: Any) -> CachedSecret:
+        now = time.monotonic()
+        return CachedSecret(value=value, refresh_at=now + self.ttl - self.refresh_margin, expires_at=now + self.ttl)
+
 class SecretsManager:
 
-    def __init__(self, region_name="us-east-1"):
+    # Shared by every instance in the process so ad-hoc SecretsManager() calls hit memory, not AWS
+    _secret_store = SecretStore()
+
+    # {sha256(api_key): (party_code, is_master)} plus the key objects it was built from
+    _api_key_index = {}
+    _api_key_index_sources = (None, None)
+    _api_key_index_lock = threading.Lock()
+
+    def __init__(self, region_name="us-east-1", ttl=None, refresh_margin=None):
         self.region_name = region_name
         self.cache_manager = CacheManager()
         self.cache_key = self.cache_manager.get_secret_cache_key()
         self.logger = logging.getLogger(__name__)
-        self.client = boto3.client(service_name="secretsmanager", region_name=self.region_name)
+        self._client = None
+
+        if ttl is not None:
+            self._secret_store.configure(ttl, refresh_margin if refresh_margin is not None else SecretStore.DEFAULT_REFRESH_MARGIN)
 
         fizit_env = os.getenv("FIZIT_ENV")
         if not fizit_env or fizit_env not in {"dev", "test", "main"}:
@@ -27,13 +131,19 @@ class SecretsManager:
             "main": "mainnet"
         }[fizit_env]
 
-    def _load_secrets(self, extra=None):
-        secrets = self.cache_manager.get(self.cache_key, extra={"key" : extra})
-
-        if secrets:
-            return secrets
+    @property
+    def client(self):
+        """Secrets Manager client, created on first AWS call."""
+        if self._client is None:
+            self._client = boto3.client(service_name="secretsmanager", region_name=self.region_name)
+        return self._client
 
-        return self._reload_secrets_from_aws()
+    def _load_secrets(self, extra=None):
+        return self._secret_store.get(
+            self.cache_key,
+            self._reload_secrets_from_aws,
+            seed=lambda: self.cache_manager.get(self.cache_key, extra={"key" : extra})
+        )
 
     def _reload_secrets_from_aws(self):
         secrets = {}
@@ -84,23 +194,57 @@ class SecretsManager:
 
         return partner_keys
 
-    def _is_cache_valid(self):
-        """(Internal) Check if the cached secrets are still valid."""
-        if not self._secrets_cache or not self._cache_timestamp:
-            return False
-        return datetime.now() - self._cache_timestamp <= self._cache_duration
+    def _get_cached_secret(self, secret_name, key=None):
+        """(Internal) Fetch a single secret through the in-memory store."""
+        return self._secret_store.get(secret_name, lambda: self._fetch_secret(secret_name, key=key))
+
+    def _get_api_key_index(self):
+        """(Internal) Return the hashed key index, rebuilding it whenever the master or partner keys change."""
+        master_key = self.get_master_key()
+        partner_keys = self.get_all_partner_keys()
+        cls = SecretsManager
+
+        indexed_master_key, indexed_partner_keys = cls._api_key_index_sources
+        if indexed_master_key == master_key and indexed_partner_keys is partner_keys:
+            return cls._api_key_index
+
+        with cls._api_key_index_lock:
+            index = {
+                self.hash_api_key(api_key): (party_code, False)
+                for party_code, api_key in partner_keys.items() if api_key
+            }
+            if master_key:
+                index[self.hash_api_key(master_key)] = (None, True)
+
+            cls._api_key_index = index
+            cls._api_key_index_sources = (master_key, partner_keys)
+            log_info(self.logger, f"Rebuilt API key index with {len(index)} keys")
+
+        return index
 
     def reset_secret_cache(self):
         """Clear secrets cache and reload from AWS."""
         self.cache_manager.delete(self.cache_key)
-        return self._reload_secrets_from_aws()
+        self._secret_store.invalidate()
+        return self._load_secrets()
 
     # --- Public API Methods ---
 
+    @staticmethod
+    def hash_api_key(api_key):
+        return hashlib.sha256(api_key.encode()).hexdigest()
+
+    def resolve_api_key(self, api_key):
+        """Return (party_code, is_master) for a valid API key, or None.
+
+        Lookups compare SHA-256 digests rather than raw keys, so timing reveals nothing about the key.
+        """
+        if not api_key:
+            return None
+        return self._get_api_key_index().get(self.hash_api_key(api_key))
+
     def get_master_key(self):
-        secret_name = f"{self.secret_prefix}/master-key"
-        log_info(self.logger, f"Fetching master key: {secret_name}")
-        return self._fetch_secret(secret_name, key="api_key")
+        return self._get_cached_secret(f"{self.secret_prefix}/master-key", key="api_key")
 
     def get_aes_key(self):
         """Retrieve the AES contract encryption key."""
@@ -128,4 +272,4 @@ class SecretsManager:
 
     def get_openai_key(self):
         """Retrieve OpenAI API key (same for all environments)."""
-        return self._fetch_secret("openai", key="api_key")
\ No newline at end of file
+        return self._get_cached_secret("openai", key="api_key")
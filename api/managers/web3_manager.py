@@ -1,21 +1,297 @@
+import contextvars
 import logging
 import os
 import json
+import threading
+import time
 import requests
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-from eth_utils import keccak, to_checksum_address
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector, keccak, to_checksum_address
 from web3 import Web3, HTTPProvider
+from web3.datastructures import AttributeDict
 from web3.middleware.proof_of_authority import ExtraDataToPOAMiddleware
 
 from api.models.event_model import Event
 from api.utilities.logging import log_error, log_info, log_warning
 
+class NonceAllocator:
+    """Hands out sequential nonces per (wallet, network) without a round trip per transaction."""
+
+    def __init__(self):
+        self._next_nonces = {}
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _get_lock(self, key):
+        with self._locks_lock:
+            return self._locks.setdefault(key, threading.Lock())
+
+    def allocate(self, key, fetch_pending_nonce):
+        """Return the next nonce for key, seeding from the node's pending count on first use or after a resync."""
+        with self._get_lock(key):
+            nonce = self._next_nonces.get(key)
+            if nonce is None:
+                nonce = fetch_pending_nonce()
+            self._next_nonces[key] = nonce + 1
+            return nonce
+
+    def resync(self, key):
+        """Forget the local nonce so the next allocation re-reads the pending count."""
+        with self._get_lock(key):
+            self._next_nonces.pop(key, None)
+
+class ChainScope:
+    """Chain state of one request: the blocks its reads are pinned to, the minimum blocks its consistency
+    token demands and the highest blocks its writes landed in, each keyed by network.
+
+    floor_blocks keeps the oldest block any data served to the request may come from: the higher of the
+    token and its own writes.
+    """
+
+    def __init__(self, pin_reads=True, min_blocks=None):
+        self.pin_reads = pin_reads
+        self.read_blocks = {}
+        self.min_blocks = dict(min_blocks or {})
+        self.written_blocks = {}
+        self.floor_blocks = dict(self.min_blocks)
+
+_chain_scope = contextvars.ContextVar("chain_scope", default=None)
+
+class BlockWatcher:
+    """Tracks the highest block seen per network and wakes waiting threads as soon as a newer one is observed.
+
+    Blocks are observed from receipts and reads; while anyone is waiting, a single poller per network
+    feeds it as well.
+    """
+
+    POLL_INTERVAL = 0.25
+
+    def __init__(self):
+        self._latest = {}
+        self._waiters = {}
+        self._pollers = set()
+        self._condition = threading.Condition()
+        self.logger = logging.getLogger(__name__)
+
+    def observe(self, network, block_number):
+        with self._condition:
+            if block_number > self._latest.get(network, -1):
+                self._latest[network] = block_number
+                self._condition.notify_all()
+
+    def wait_for(self, network, min_block, fetch_block_number, timeout):
+        """Block until network reaches min_block and return the block seen, or raise TimeoutError."""
+        deadline = time.monotonic() + timeout
+
+        with self._condition:
+            self._waiters[network] = self._waiters.get(network, 0) + 1
+            try:
+                if network not in self._pollers:
+                    self._pollers.add(network)
+                    threading.Thread(target=self._poll, args=(network, fetch_block_number), daemon=True).start()
+
+                while self._latest.get(network, -1) < min_block:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise TimeoutError(f"{network} did not reach block {min_block} within {timeout}s")
+                    self._condition.wait(remaining)
+
+                return self._latest[network]
+
+            finally:
+                self._waiters[network] -= 1
+
+    def _poll(self, network, fetch_block_number):
+        while True:
+            with self._condition:
+                if not self._waiters.get(network):
+                    self._pollers.discard(network)
+                    return
+
+            try:
+                self.observe(network, fetch_block_number())
+            except Exception as e:
+                log_warning(self.logger, f"Failed to poll block number for {network}: {e}")
+
+            time.sleep(self.POLL_INTERVAL)
+
+def _abi_type(param):
+    """Canonical ABI type of a parameter, expanding tuples into their component types."""
+    param_type = param["type"]
+    if param_type.startswith("tuple"):
+        return f"({','.join(_abi_type(component) for component in param['components'])}){param_type[len('tuple'):]}"
+    return param_type
+
+def _normalize_output(param, value):
+    """Shape a decoded value the way ContractFunction.call() returns it (lists for arrays, checksummed addresses)."""
+    param_type = param["type"]
+    if param_type.endswith("]"):
+        element = dict(param, type=param_type[:param_type.rindex("[")])
+        return [_normalize_output(element, item) for item in value]
+    if param_type == "tuple":
+        return tuple(_normalize_output(component, item) for component, item in zip(param["components"], value))
+    if param_type == "address":
+        return to_checksum_address(value)
+    return value
+
+def _block_param(block_identifier):
+    return hex(block_identifier) if isinstance(block_identifier, int) else block_identifier
+
+class BatchRequestError(Exception):
+    """One request in a JSON-RPC batch failed; the other requests in the batch are unaffected."""
+
+    def __init__(self, method, error):
+        self.method = method
+        self.code = error.get("code")
+        self.data = error.get("data")
+        super().__init__(f"{method} failed ({self.code}): {error.get('message')}")
+
+class BatchResult:
+    """Placeholder for one request in an RPCBatch, filled in when the batch executes."""
+
+    def __init__(self, method, params, decode_result):
+        self.method = method
+        self.params = params
+        self._decode_result = decode_result
+        self.value = None
+        self.error = None
+        self.done = False
+
+    def get(self):
+        """Return the decoded result, raising this request's own error if it failed."""
+        if not self.done:
+            raise RuntimeError(f"{self.method} has not been executed")
+        if self.error is not None:
+            raise self.error
+        return self.value
+
+class RPCBatch:
+    """Collects eth_call, eth_getBlockByNumber and eth_getTransactionReceipt requests and sends them as
+    JSON-RPC batches over HTTP.
+
+    Used as a context manager the batch executes on exit. Results come back in the order the requests were
+    added and each one carries its own value or BatchRequestError. Blocks and receipts are returned as
+    AttributeDicts with quantities decoded to int; hashes, data and logs stay as hex strings.
+    """
+
+    QUANTITY_FIELDS = {
+        "number", "timestamp", "gasLimit", "gasUsed", "baseFeePerGas", "difficulty", "size",
+        "blockNumber", "cumulativeGasUsed", "effectiveGasPrice", "status", "transactionIndex", "type",
+    }
+
+    def __init__(self, rpc_url, max_size, timeout):
+        self.rpc_url = rpc_url
+        self.max_size = max_size
+        self.timeout = timeout
+        self.results = []
+        self.executed = False
+        self.logger = logging.getLogger(__name__)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None and not self.executed:
+            self.execute()
+        return False
+
+    def call(self, contract_function, block_identifier="latest"):
+        """Queue an eth_call for a bound contract function, e.g. web3_contract.functions.getContract(idx)."""
+        fn_abi = contract_function.abi
+        input_types = [_abi_type(param) for param in fn_abi.get("inputs", [])]
+        outputs = fn_abi.get("outputs", [])
+
+        selector = function_signature_to_4byte_selector(f"{fn_abi['name']}({','.join(input_types)})")
+        data = "0x" + (selector + encode(input_types, list(contract_function.args))).hex()
+
+        def decode_result(result):
+            decoded = decode([_abi_type(param) for param in outputs], bytes.fromhex(result[2:]))
+            normalized = [_normalize_output(param, value) for param, value in zip(outputs, decoded)]
+            return normalized[0] if len(normalized) == 1 else normalized
+
+        return self._add("eth_call", [{"to": contract_function.address, "data": data}, _block_param(block_identifier)], decode_result)
+
+    def get_block(self, block_identifier, full_transactions=False):
+        return self._add("eth_getBlockByNumber", [_block_param(block_identifier), full_transactions], self._format_object)
+
+    def get_transaction_receipt(self, tx_hash):
+        return self._add("eth_getTransactionReceipt", [Web3.to_hex(tx_hash)], self._format_object)
+
+    def execute(self):
+        """Send the queued requests, at most max_size per HTTP request, and return their BatchResults in order."""
+        for start in range(0, len(self.results), self.max_size):
+            chunk = self.results[start:start + self.max_size]
+            payload = [
+                {"jsonrpc": "2.0", "id": request_id, "method": result.method, "params": result.params}
+                for request_id, result in enumerate(chunk)
+            ]
+
+            response = requests.post(self.rpc_url, json=payload, timeout=self.timeout)
+            response.raise_for_status()
+            replies = response.json()
+
+            if not isinstance(replies, list):
+                # Nodes without batch support answer with a single error object
+                raise RuntimeError(f"JSON-RPC batch rejected: {replies}")
+
+            # Replies may arrive in any order
+            replies_by_id = {reply.get("id"): reply for reply in replies}
+            for request_id, result in enumerate(chunk):
+                self._resolve(result, replies_by_id.get(request_id))
+
+        self.executed = True
+        log_info(self.logger, f"Executed JSON-RPC batch of {len(self.results)} requests")
+        return list(self.results)
+
+    def _add(self, method, params, decode_result):
+        if self.executed:
+            raise RuntimeError("Batch has already been executed")
+        result = BatchResult(method, params, decode_result)
+        self.results.append(result)
+        return result
+
+    def _resolve(self, result, reply):
+        result.done = True
+
+        if reply is None:
+            result.error = BatchRequestError(result.method, {"message": "missing from batch response"})
+        elif "error" in reply:
+            result.error = BatchRequestError(result.method, reply["error"])
+        else:
+            try:
+                result.value = result._decode_result(reply.get("result"))
+            except Exception as e:
+                result.error = BatchRequestError(result.method, {"message": str(e)})
+
+    def _format_object(self, result):
+        if result is None:
+            raise LookupError("not found")
+        return AttributeDict({
+            key: int(value, 16) if key in self.QUANTITY_FIELDS and isinstance(value, str) else value
+            for key, value in result.items()
+        })
+
 class Web3Manager():
 
     ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+    RECEIPT_TIMEOUT = 120
+    BATCH_GAS_FRACTION = 0.8        # share of the block gas limit a single batch transaction may use
+    RPC_BATCH_TIMEOUT = 30
+    CONSISTENCY_TIMEOUT = 30        # longest a request waits for the block its consistency token names
+    CONSISTENCY_MARGIN = 5          # blocks a consistency token may run ahead of the head this node reports
+    # Node errors meaning another sender (worker, command) used the nonce first; the send is retried once resynced
+    NONCE_ERRORS = ("nonce too low", "already known", "replacement transaction underpriced")
+    CONTRACT_EVENT_TOPIC = keccak(text="ContractEvent(uint256,string,string)")
     _web3_instances = {}
 
+    # Shared across instances so every sender in the process draws from the same nonce sequence
+    _nonce_allocator = NonceAllocator()
+    _block_watcher = BlockWatcher()
+
     def __init__(self, context):
         self.logger = logging.getLogger(__name__)
         self.context = context
@@ -51,6 +327,92 @@ class Web3Manager():
         log_info(self.logger, f"Web3 connection established for {network}")
         return web3_instance
 
+    @contextmanager
+    def chain_scope(self, pin_reads=True, min_blocks=None):
+        """Run a request in a ChainScope. Nested scopes share the outermost one.
+
+        pin_reads pins every read to one block per network, resolved by the first read that needs it.
+        min_blocks ({network: block}) comes from a consistency token; reads wait until the chain reaches it.
+        """
+        scope = _chain_scope.get()
+        if scope is not None:
+            yield scope
+            return
+
+        scope = ChainScope(pin_reads, min_blocks)
+        token = _chain_scope.set(scope)
+        try:
+            yield scope
+        finally:
+            _chain_scope.reset(token)
+
+    def get_read_block(self, network):
+        """Block number reads are pinned to in the current scope, or None (latest) when reads are not pinned."""
+        scope = _chain_scope.get()
+        if scope is None:
+            return None
+
+        if network in scope.read_blocks:
+            return scope.read_blocks[network]
+
+        min_block = scope.min_blocks.pop(network, None)
+        if not scope.pin_reads and min_block is None:
+            return None
+
+        block_number = self.wait_for_block(network, min_block) if min_block is not None else self.get_block_number(network)
+
+        if not scope.pin_reads:
+            return None
+
+        scope.read_blocks[network] = block_number
+        log_info(self.logger, f"Pinned reads on {network} to block {block_number}")
+        return block_number
+
+    def get_floor_block(self, network):
+        """Oldest block data served in the current scope may have been read at, or None if any block will do."""
+        scope = _chain_scope.get()
+        return scope.floor_blocks.get(network) if scope is not None else None
+
+    def get_block_number(self, network):
+        block_number = self.get_web3_instance(network).eth.block_number
+        self._block_watcher.observe(network, block_number)
+        return block_number
+
+    def wait_for_block(self, network, min_block):
+        """Return the current block number once the chain has reached min_block, without fixed sleeps."""
+        block_number = self.get_block_number(network)
+        if block_number >= min_block:
+            return block_number
+
+        log_info(self.logger, f"Waiting for {network} to reach block {min_block} (at {block_number})")
+        return self._block_watcher.wait_for(
+            network, min_block, lambda: self.get_web3_instance(network).eth.block_number, self.CONSISTENCY_TIMEOUT
+        )
+
+    def _record_written_block(self, network, tx_receipts):
+        """Note the block a request's writes landed in, for the consistency token and for waiting readers."""
+        block_numbers = [tx_receipt["blockNumber"] for tx_receipt in tx_receipts if tx_receipt != 'MfaRequired']
+        if not block_numbers:
+            return
+
+        written_block = max(block_numbers)
+        self._block_watcher.observe(network, written_block)
+
+        scope = _chain_scope.get()
+        if scope is not None:
+            scope.written_blocks[network] = max(scope.written_blocks.get(network, 0), written_block)
+            scope.floor_blocks[network] = max(scope.floor_blocks.get(network, 0), written_block)
+
+    def batch(self, network):
+        """Return an RPCBatch that sends independent reads for a network in one JSON-RPC round trip.
+
+            with web3_manager.batch(network) as batch:
+                contract = batch.call(web3_contract.functions.getContract(contract_idx))
+                block = batch.get_block("latest")
+            contract.get(), block.get()
+        """
+        return RPCBatch(self._get_rpc_url(network), self.context.config_manager.get_rpc_batch_size(), self.RPC_BATCH_TIMEOUT)
+
     def get_web3_contract(self, contract_type, network):
         cache_key = self.context.cache_manager.get_contract_abi_cache_key(contract_type)
         abi = self.context.cache_manager.get(cache_key)
@@ -70,9 +432,18 @@ class Web3Manager():
         return web3_instance.eth.contract(abi=abi, address=contract_address)
 
     def get_nonce(self, wallet_addr, network):
-        """Get the transaction nonce for a wallet."""
+        """Get the pending transaction nonce for a wallet from the node."""
         web3_instance = self.get_web3_instance(network)
-        return web3_instance.eth.get_transaction_count(to_checksum_address(wallet_addr))
+        return web3_instance.eth.get_transaction_count(to_checksum_address(wallet_addr), "pending")
+
+    def allocate_nonce(self, wallet_addr, network):
+        """Allocate the next local nonce for a wallet on a network."""
+        wallet_addr = to_checksum_address(wallet_addr)
+        return self._nonce_allocator.allocate((wallet_addr, network), lambda: self.get_nonce(wallet_addr, network))
+
+    def resync_nonce(self, wallet_addr, network):
+        """Drop the local nonce for a wallet so it is re-read from the node's pending count."""
+        self._nonce_allocator.resync((to_checksum_address(wallet_addr), network))
 
     def get_checksum_address(self, wallet_addr):
         """Convert an address to checksum format."""
@@ -105,7 +476,80 @@ class Web3Manager():
             log_error(self.logger, f"Error loading ABI: {e}")
             raise
 
-    def send_signed_transaction(self, transaction, wallet_addr, contract_type, contract_idx, network):
+    def send_signed_transaction(self, transaction, wallet_addr, contract_type, contract_idx, network, event_data=None):
+        return self.send_signed_transactions([transaction], wallet_addr, contract_type, contract_idx, network, event_data)[0]
+
+    def send_signed_transactions(self, transactions, wallet_addr, contract_type, contract_idx, network, event_data=None):
+        """Broadcast transactions back-to-back with locally allocated nonces, then wait for all receipts concurrently.
+
+        Returns one receipt per transaction in order ('MfaRequired' where the signer requires MFA).
+        contract_idx may be None for addContract; the audit Event rows are then filled in from the receipt.
+        """
+        tx_hashes = self.broadcast_signed_transactions(transactions, wallet_addr, contract_type, contract_idx, network)
+
+        try:
+            tx_receipts = self.wait_for_receipts(tx_hashes, network)
+
+        except Exception as e:
+            self.resync_nonce(wallet_addr, network)
+            log_error(self.logger, f"Error waiting for transaction receipts: {e}")
+            raise
+
+        for tx_receipt in tx_receipts:
+            self.invalidate_from_receipt(tx_receipt, contract_type, contract_idx, event_data)
+
+            if contract_type is not None and contract_idx is None and tx_receipt != 'MfaRequired':
+                self._backfill_event_contract_idx(tx_receipt)
+
+        self._record_written_block(network, tx_receipts)
+        return tx_receipts
+
+    def build_batch_transactions(self, contract_function, contract_idx, rows, wallet_addr, network):
+        """Build array-taking contract calls for rows of arguments, chunked so each transaction fits in a block.
+
+        Rows are split into chunks of at most batch_max_rows; a chunk whose gas estimate exceeds
+        BATCH_GAS_FRACTION of the block gas limit (or cannot be estimated) is halved until it fits.
+        """
+        web3_instance = self.get_web3_instance(network)
+        from_addr = to_checksum_address(wallet_addr)
+        gas_ceiling = int(web3_instance.eth.get_block("latest")["gasLimit"] * self.BATCH_GAS_FRACTION)
+        max_rows = self.context.config_manager.get_batch_max_rows()
+
+        transactions = []
+        for start in range(0, len(rows), max_rows):
+            transactions.extend(self._build_batch_chunk(contract_function, contract_idx, rows[start:start + max_rows], from_addr, gas_ceiling))
+
+        log_info(self.logger, f"Built {len(transactions)} batch transactions for {len(rows)} rows")
+        return transactions
+
+    def _build_batch_chunk(self, contract_function, contract_idx, rows, from_addr, gas_ceiling):
+        columns = [list(column) for column in zip(*rows)]
+        call = contract_function(contract_idx, *columns)
+
+        # build_transaction estimates gas itself unless given it, and the send reuses it, so estimate at most once
+        tx_params = {"from": from_addr}
+
+        if len(rows) > 1:
+            try:
+                tx_params["gas"] = call.estimate_gas({"from": from_addr})
+                fits = tx_params["gas"] <= gas_ceiling
+            except Exception as e:
+                # Batches beyond the block gas limit fail estimation outright
+                log_warning(self.logger, f"Gas estimate failed for a batch of {len(rows)} rows, splitting: {e}")
+                fits = False
+
+            if not fits:
+                middle = len(rows) // 2
+                return (self._build_batch_chunk(contract_function, contract_idx, rows[:middle], from_addr, gas_ceiling) +
+                        self._build_batch_chunk(contract_function, contract_idx, rows[middle:], from_addr, gas_ceiling))
+
+        return [call.build_transaction(tx_params)]
+
+    def broadcast_signed_transactions(self, transactions, wallet_addr, contract_type, contract_idx, network):
+        """Sign and broadcast transactions back-to-back without waiting for receipts.
+
+        Returns one tx hash per transaction in order ('MfaRequired' where the signer requires MFA).
+        """
         web3_instance = self.get_web3_instance(network)
         wallet_addr = to_checksum_address(wallet_addr)
         chain_id = self.context.config_manager.get_chain_id(network)
@@ -115,49 +559,86 @@ class Web3Manager():
             raise ConnectionError("Web3 instance is not connected")
 
         try:
-            nonce = self.get_nonce(wallet_addr, network)
+            return [
+                self._sign_and_broadcast(web3_instance, transaction, wallet_addr, contract_type, contract_idx, network, chain_id)
+                for transaction in transactions
+            ]
 
-            tx = self._build_transaction(
-                from_addr=wallet_addr,
-                to_addr=transaction['to'],
-                value=transaction["value"],
-                data=transaction.get('data','0x'),
-                nonce=nonce,
-                chain_id=chain_id
-            )
-
-            gas_limit, max_fee_per_gas, max_priority_fee_per_gas = self._estimate_gas_fees(web3_instance, tx)
+        except Exception as e:
+            # The node may or may not have accepted the last nonce; re-read the pending count on the next send
+            self.resync_nonce(wallet_addr, network)
+            log_error(self.logger, f"Error sending signed transaction: {e}")
+            raise
 
+    def _sign_and_broadcast(self, web3_instance, transaction, wallet_addr, contract_type, contract_idx, network, chain_id):
+        """Sign and broadcast one transaction without waiting for its receipt. Returns the tx hash or 'MfaRequired'."""
+        tx = self._build_transaction(
+            from_addr=wallet_addr,
+            to_addr=transaction['to'],
+            value=transaction["value"],
+            data=transaction.get('data','0x'),
+            chain_id=chain_id
+        )
+
+        # Gas estimated at build time for this sender (see _build_batch_chunk) is not estimated again
+        built_gas = transaction.get("gas") if transaction.get("from") == wallet_addr else None
+        gas_limit, max_fee_per_gas, max_priority_fee_per_gas = self._estimate_gas_fees(web3_instance, tx, built_gas)
+
+        log_info(self.logger, f"gas_limit: {gas_limit}")
+        log_info(self.logger, f"max_fee_per_gas {max_fee_per_gas}")
+        log_info(self.logger, f"max_priority_fee_per_gas {max_priority_fee_per_gas}")
+
+        # Update tx with gas values
+        tx['gas'] = gas_limit
+        tx['maxFeePerGas'] = max_fee_per_gas
+        tx['maxPriorityFeePerGas'] = max_priority_fee_per_gas
+
+        # Every process keeps its own nonce sequence per wallet, so one may be spent by another sender
+        for attempt in range(2):
+            # Allocate the nonce last so a failed estimate does not leave a gap
+            tx['nonce'] = self.allocate_nonce(wallet_addr, network)
             log_info(self.logger, f"TX to send {tx}")
-            log_info(self.logger, f"gas_limit: {gas_limit}")
-            log_info(self.logger, f"max_fee_per_gas {max_fee_per_gas}")
-            log_info(self.logger, f"max_priority_fee_per_gas {max_priority_fee_per_gas}")
-
-            # Update tx with gas values
-            tx['gas'] = gas_limit
-            tx['maxFeePerGas'] = max_fee_per_gas
-            tx['maxPriorityFeePerGas'] = max_priority_fee_per_gas
 
             signed_tx, error_code = self._sign_transaction({"chain_id": chain_id, "tx": self._hexify_tx(tx)}, wallet_addr)
 
-            if signed_tx:
-                tx_hash, tx_receipt = self._broadcast_transaction(web3_instance, signed_tx)
-                tx_hash_hex = Web3.to_hex(tx_hash)
+            if not signed_tx:
+                if error_code == 'MfaRequired':
+                    # The nonce was not consumed on chain
+                    self.resync_nonce(wallet_addr, network)
+                    return 'MfaRequired'
+                raise RuntimeError(f"Error broadcasting transaction with error code: {error_code}")
 
-                if contract_type is not None and contract_idx is not None:
-                    contract_release = self.context.config_manager.get_contract_release(contract_type)
-                    self._log_event(transaction, tx_hash_hex, wallet_addr, contract_type, contract_idx, contract_release, network)
+            try:
+                tx_hash = web3_instance.eth.send_raw_transaction(web3_instance.to_bytes(hexstr=signed_tx))
+                break
+            except Exception as e:
+                if attempt or not any(error in str(e).lower() for error in self.NONCE_ERRORS):
+                    raise
+                log_warning(self.logger, f"Nonce {tx['nonce']} of {wallet_addr} was already used, resyncing: {e}")
+                self.resync_nonce(wallet_addr, network)
 
-            elif error_code == 'MfaRequired':
-                tx_receipt = 'MfaRequired'
-            else:
-                raise RuntimeError(f"Error broadcasting transaction with error code: {error_code}")
+        if contract_type is not None:
+            contract_release = self.context.config_manager.get_contract_release(contract_type)
+            self._log_event(transaction, Web3.to_hex(tx_hash), wallet_addr, contract_type, contract_idx, contract_release, network)
 
-            return tx_receipt
+        return tx_hash
 
-        except Exception as e:
-            log_error(self.logger, f"Error sending signed transaction: {e}")
-            raise
+    def wait_for_receipts(self, tx_hashes, network):
+        """Wait for every broadcast transaction concurrently, preserving order."""
+        web3_instance = self.get_web3_instance(network)
+        pending = [tx_hash for tx_hash in tx_hashes if tx_hash != 'MfaRequired']
+
+        if len(pending) <= 1:
+            receipts = [self._wait_for_receipt(web3_instance, tx_hash) for tx_hash in pending]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(pending), 16), thread_name_prefix="receipt") as executor:
+                receipts = list(executor.map(lambda tx_hash: self._wait_for_receipt(web3_instance, tx_hash), pending))
+
+        receipts_iter = iter(receipts)
+        return [tx_hash if tx_hash == 'MfaRequired' else next(receipts_iter) for tx_hash in tx_hashes]
+
+    def _wait_for_receipt(self, web3_instance, tx_hash):
+        return web3_instance.eth.wait_for_transaction_receipt(tx_hash, timeout=self.RECEIPT_TIMEOUT)
 
     def send_contract_deployment(self, bytecode, wallet_addr, network):
 
@@ -172,7 +653,7 @@ class Web3Manager():
             raise ConnectionError("Web3 instance is not connected")
 
         try:
-            nonce = web3_instance.eth.get_transaction_count(wallet_addr, "pending")
+            nonce = self.allocate_nonce(wallet_addr, network)
             
             # Set a manually high gas limit
             gas_limit = 10_000_000  # Reasonably high limit for large contracts
@@ -207,25 +688,28 @@ class Web3Manager():
             return tx_receipt
 
         except Exception as e:
+            self.resync_nonce(wallet_addr, network)
             logging.error(f"Error occurred: {str(e)}")
             raise
 
 
-    def _estimate_gas_fees(self, web3_instance, transaction):
+    def _estimate_gas_fees(self, web3_instance, transaction, gas_limit=None):
 
-        """Estimate gas fees for a transaction."""
-        estimated_gas = web3_instance.eth.estimate_gas({
-            "from": transaction["from"],
-            "to": transaction["to"],
-            "from": transaction["from"],
-            "data": transaction.get("data", "0x"),
-            "value": transaction["value"],
-        })
+        """Estimate gas fees for a transaction; a gas_limit estimated when it was built is used as is."""
+        if gas_limit is None:
+            estimated_gas = web3_instance.eth.estimate_gas({
+                "from": transaction["from"],
+                "to": transaction["to"],
+                "from": transaction["from"],
+                "data": transaction.get("data", "0x"),
+                "value": transaction["value"],
+            })
+
+            log_info(self.logger, f"estimated gas: {estimated_gas}")
 
-        log_info(self.logger, f"estimated gas: {estimated_gas}")
+            block_gas_limit = web3_instance.eth.get_block("latest")["gasLimit"]
+            gas_limit = min(estimated_gas, block_gas_limit)
 
-        block_gas_limit = web3_instance.eth.get_block("latest")["gasLimit"]
-        gas_limit = min(estimated_gas, block_gas_limit)
         pool_min_fee_cap = web3_instance.to_wei('25', 'gwei')
         max_priority_fee_per_gas = web3_instance.to_wei('2', 'gwei')
         max_fee_per_gas = pool_min_fee_cap + web3_instance.to_wei('10', 'gwei')
@@ -275,10 +759,74 @@ class Web3Manager():
         """Broadcast the signed transaction to the network."""
 
         tx_hash = web3_instance.eth.send_raw_transaction(web3_instance.to_bytes(hexstr=signed_tx))
-        tx_receipt = web3_instance.eth.wait_for_transaction_receipt(tx_hash, timeout=120)
+        tx_receipt = self._wait_for_receipt(web3_instance, tx_hash)
 
         return tx_hash, tx_receipt
 
+    def get_contract_events(self, tx_receipt):
+        """Decode the ContractEvent logs in a receipt into (contract_idx, event_type, details) tuples."""
+        events = []
+
+        for log in tx_receipt.get("logs", []):
+            event = self._decode_contract_event(log)
+            if event is not None:
+                events.append(event[1:])
+
+        return events
+
+    def get_contract_logs(self, contract_type, network, from_block, to_block):
+        """Decode the ContractEvent logs a contract emitted in [from_block, to_block] into
+        (block_number, contract_idx, event_type, details) tuples, in chain order.
+        """
+        web3_contract = self.get_web3_contract(contract_type, network)
+        logs = self.get_web3_instance(network).eth.get_logs({
+            "fromBlock": from_block,
+            "toBlock": to_block,
+            "address": web3_contract.address,
+            "topics": [Web3.to_hex(self.CONTRACT_EVENT_TOPIC)],
+        })
+
+        events = (self._decode_contract_event(log) for log in logs)
+        return [event for event in events if event is not None]
+
+    def _decode_contract_event(self, log):
+        topics = log.get("topics", [])
+        if len(topics) < 2 or bytes(topics[0]) != self.CONTRACT_EVENT_TOPIC:
+            return None
+
+        event_type, details = decode(["string", "string"], bytes(log["data"]))
+        return log.get("blockNumber"), int.from_bytes(bytes(topics[1]), "big"), event_type, details
+
+    def get_added_contract_idx(self, tx_receipt):
+        """The authoritative index of the contract an addContract receipt created, from its ContractAdded log."""
+        return next(
+            (event_contract_idx for event_contract_idx, event_type, _ in self.get_contract_events(tx_receipt) if event_type == "ContractAdded"),
+            None
+        )
+
+    def _backfill_event_contract_idx(self, tx_receipt):
+        contract_idx = self.get_added_contract_idx(tx_receipt)
+        if contract_idx is not None:
+            Event.objects.filter(tx_hash=Web3.to_hex(tx_receipt["transactionHash"])).update(contract_idx=contract_idx)
+
+    def invalidate_from_receipt(self, tx_receipt, contract_type, contract_idx=None, event_data=None):
+        """Invalidate the cache keys touched by a confirmed write, as reported by its ContractEvent logs.
+
+        event_data ({event_type: data}) lets the writer hand over what it knows about an event, e.g. the
+        summary of an added contract. A successful write that reports no event invalidates every key family
+        of its contract.
+        """
+        if contract_type is None or tx_receipt == 'MfaRequired' or tx_receipt["status"] != 1:
+            return
+
+        events = self.get_contract_events(tx_receipt)
+        block = tx_receipt.get("blockNumber")
+
+        if not events and contract_idx is not None:
+            self.context.cache_manager.invalidate_event(contract_type, contract_idx, block=block)
+
+        self.context.cache_manager.invalidate_events(contract_type, events, event_data, block)
+
     def _log_event(self, transaction, tx_hash, wallet_addr, contract_type, contract_idx, contract_release, network):
         """ Log event associated with a particular contract"""
 
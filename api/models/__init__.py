@@ -1,4 +1,11 @@
 from .event_model import Event
 from .smart_contract_model import SmartContract
 from .contract_auxiliary_model import ContractAuxiliary
-from .contract_approval_model import ContractApproval
\ No newline at end of file
+from .contract_approval_model import ContractApproval
+from .job_model import Job
+from .mirror_cursor_model import MirrorCursor
+from .contract_snapshot_model import ContractSnapshot
+from .party_snapshot_model import PartySnapshot
+from .transaction_snapshot_model import TransactionSnapshot
+from .settlement_snapshot_model import SettlementSnapshot
+from .artifact_snapshot_model import ArtifactSnapshot
\ No newline at end of file
@@ -0,0 +1,18 @@
+from django.db import models
+
+class ArtifactSnapshot(models.Model):
+    contract_type = models.CharField(max_length=25)
+    contract_release = models.IntegerField(default=0)
+    contract_idx = models.IntegerField()
+    artifact_idx = models.IntegerField()
+    doc_title = models.CharField(max_length=255, blank=True, default="")
+    raw = models.JSONField()  # getArtifacts entry; presigned urls are generated when served
+    block_number = models.BigIntegerField()
+
+    def __str__(self):
+        return f'Artifact {self.artifact_idx} of {self.contract_type}:{self.contract_idx} (release {self.contract_release})'
+
+    class Meta:
+        unique_together = ('contract_type', 'contract_release', 'contract_idx', 'artifact_idx')
+        verbose_name = "Artifact Snapshot"
+        verbose_name_plural = "Artifact Snapshots"
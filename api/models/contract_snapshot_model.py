@@ -0,0 +1,21 @@
+from django.db import models
+
+class ContractSnapshot(models.Model):
+    contract_type = models.CharField(max_length=25)
+    contract_release = models.IntegerField(default=0)
+    contract_idx = models.IntegerField()
+    contract_name = models.CharField(max_length=255, blank=True, default="")
+    is_active = models.BooleanField(default=False)
+    transact_logic = models.TextField(blank=True, default="")  # encrypted, as stored on chain
+    raw = models.JSONField()  # getContract result
+    block_number = models.BigIntegerField()
+    synced_dt = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'{self.contract_type}:{self.contract_idx} (release {self.contract_release}) at block {self.block_number}'
+
+    class Meta:
+        unique_together = ('contract_type', 'contract_release', 'contract_idx')
+        indexes = [models.Index(fields=['contract_type', 'contract_release', 'contract_name'])]
+        verbose_name = "Contract Snapshot"
+        verbose_name_plural = "Contract Snapshots"
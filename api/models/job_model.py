@@ -0,0 +1,22 @@
+import uuid
+
+from django.db import models
+
+class Job(models.Model):
+    job_id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    operation = models.CharField(max_length=50)
+    contract_type = models.CharField(max_length=25)
+    contract_idx = models.IntegerField(null=True, blank=True)
+    network = models.CharField(max_length=50, null=True, blank=True)
+    tx_hashes = models.JSONField(default=list)
+    status = models.CharField(max_length=50, default="pending")
+    error = models.CharField(max_length=255, null=True, blank=True)
+    created_dt = models.DateTimeField(auto_now_add=True)
+    completed_dt = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f'Job {self.job_id} {self.operation} for {self.contract_type}:{self.contract_idx} ({self.status})'
+
+    class Meta:
+        verbose_name = "Chain Write Job"
+        verbose_name_plural = "Chain Write Jobs"
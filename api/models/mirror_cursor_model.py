@@ -0,0 +1,18 @@
+from django.db import models
+
+class MirrorCursor(models.Model):
+    contract_type = models.CharField(max_length=25)
+    contract_release = models.IntegerField(default=0)
+    network = models.CharField(max_length=50)
+    contract_count = models.IntegerField(default=0)
+    last_block = models.BigIntegerField()  # every ContractEvent up to this block is reflected in the snapshots
+    backfilled_dt = models.DateTimeField(auto_now_add=True)
+    updated_dt = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f'Mirror of {self.contract_type} (release {self.contract_release}) at block {self.last_block}'
+
+    class Meta:
+        unique_together = ('contract_type', 'contract_release')
+        verbose_name = "Mirror Cursor"
+        verbose_name_plural = "Mirror Cursors"
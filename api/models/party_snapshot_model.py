@@ -0,0 +1,19 @@
+from django.db import models
+
+class PartySnapshot(models.Model):
+    contract_type = models.CharField(max_length=25)
+    contract_release = models.IntegerField(default=0)
+    contract_idx = models.IntegerField()
+    party_idx = models.IntegerField()
+    party_code = models.CharField(max_length=50, db_index=True)  # lower-cased for lookups
+    party_type = models.CharField(max_length=50, blank=True, default="")
+    raw = models.JSONField()  # getParties entry
+    block_number = models.BigIntegerField()
+
+    def __str__(self):
+        return f'{self.party_code} on {self.contract_type}:{self.contract_idx} (release {self.contract_release})'
+
+    class Meta:
+        unique_together = ('contract_type', 'contract_release', 'contract_idx', 'party_idx')
+        verbose_name = "Party Snapshot"
+        verbose_name_plural = "Party Snapshots"
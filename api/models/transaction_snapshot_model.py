@@ -0,0 +1,18 @@
+from django.db import models
+
+class TransactionSnapshot(models.Model):
+    contract_type = models.CharField(max_length=25)
+    contract_release = models.IntegerField(default=0)
+    contract_idx = models.IntegerField()
+    transact_idx = models.IntegerField()
+    transact_dt = models.DateTimeField(db_index=True)
+    raw = models.JSONField()  # getTransactions entry, encrypted fields as stored on chain
+    block_number = models.BigIntegerField()
+
+    def __str__(self):
+        return f'Transaction {self.transact_idx} of {self.contract_type}:{self.contract_idx} (release {self.contract_release})'
+
+    class Meta:
+        unique_together = ('contract_type', 'contract_release', 'contract_idx', 'transact_idx')
+        verbose_name = "Transaction Snapshot"
+        verbose_name_plural = "Transaction Snapshots"
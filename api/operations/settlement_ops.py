@@ -28,9 +28,15 @@ class SettlementOperations:
         response = requests.post(url, json=settlements, headers=headers_with_csrf)
         return self._process_response(response)
 
-    def get_settlements(self, contract_type, contract_idx):
+    def get_settlements(self, contract_type, contract_idx, offset=None, limit=None):
         url = f"{self.base_url}{contract_type}/{contract_idx}/settlements/"
-        response = requests.get(url, headers=self.headers)
+        params = {}
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
+
+        response = requests.get(url, headers=self.headers, params=params)
         return self._process_response(response)
 
     def delete_settlements(self, contract_type, contract_idx):
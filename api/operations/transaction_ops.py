@@ -24,7 +24,7 @@ class TransactionOperations:
 
 
     def post_transactions(self, contract_type, contract_idx, transactions):
-        batch_size = 10
+        batch_size = 100
         url = f"{self.base_url}{contract_type}/{contract_idx}/transactions/"
         headers_with_csrf = self._add_csrf_token()
 
@@ -41,13 +41,17 @@ class TransactionOperations:
 
         return {"count": count}
 
-    def get_transactions(self, contract_type, contract_idx, transact_min_dt=None, transact_max_dt=None):
+    def get_transactions(self, contract_type, contract_idx, transact_min_dt=None, transact_max_dt=None, offset=None, limit=None):
         url = f"{self.base_url}{contract_type}/{contract_idx}/transactions/"
         params = {}
         if transact_min_dt:
             params["transact_min_dt"] = transact_min_dt
         if transact_max_dt:
             params["transact_max_dt"] = transact_max_dt
+        if offset is not None:
+            params["offset"] = offset
+        if limit is not None:
+            params["limit"] = limit
 
         response = requests.get(url, headers=self.headers, params=params)
         return self._process_response(response)
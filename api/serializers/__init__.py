@@ -2,6 +2,7 @@ from .account_serializer import AccountSerializer
 from .artifact_serializer import ArtifactSerializer
 from .deposit_serializer import DepositSerializer
 from .event_serializer import EventSerializer
+from .job_serializer import JobSerializer
 from .party_serializer import PartySerializer
 from .approval_serializer import ApprovalSerializer
 from .recipient_serializer import RecipientSerializer
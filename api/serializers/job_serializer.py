@@ -0,0 +1,8 @@
+from rest_framework import serializers
+
+from api.models.job_model import Job
+
+class JobSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = ['job_id', 'operation', 'contract_type', 'contract_idx', 'network', 'tx_hashes', 'status', 'error', 'created_dt', 'completed_dt']
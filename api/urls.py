@@ -5,7 +5,7 @@ from api.views import (
     PartyViewSet, TransactionViewSet, SettlementViewSet,
     ArtifactViewSet, AdvanceViewSet, ResidualViewSet,
     DistributionViewSet, DepositViewSet, EventViewSet,
-    StatsView, get_csrf_token
+    JobViewSet, StatsView, CacheMetricsView, MirrorLagView, get_csrf_token
 )
 
 urlpatterns = [
@@ -45,6 +45,9 @@ urlpatterns = [
     path('accounts/', AccountViewSet.as_view({'get': 'list'}), name='account-list'),
     path('recipients/', RecipientViewSet.as_view({'get': 'list'}), name='recipient-list'),
     path('events/', EventViewSet.as_view({'get': 'list'}), name='event-list'),
+    path('jobs/<uuid:job_id>/', JobViewSet.as_view({'get': 'retrieve'}), name='job-detail'),
     path('stats/', StatsView.as_view(), name='stats'),
+    path('cache/metrics/', CacheMetricsView.as_view(), name='cache-metrics'),
+    path('mirror/lag/', MirrorLagView.as_view(), name='mirror-lag'),
     path('get-csrf-token/', get_csrf_token, name='get_csrf_token'),
 ]
\ No newline at end of file
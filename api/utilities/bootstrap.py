@@ -1,3 +1,5 @@
+import threading
+
 from api.managers.app_context import AppContext
 from api.managers.cache_manager import CacheManager
 from api.managers.config_manager import ConfigManager
@@ -9,28 +11,46 @@ from api.managers.adapter_manager import AdapterManager
 from api.managers.library_manager import LibraryManager
 from api.managers.serializer_manager import SerializerManager
 from api.managers.form_manager import FormManager
+from api.managers.job_manager import JobManager
+from api.managers.mirror_manager import MirrorManager
+
+# Every factory receives the context so higher-level managers can resolve their dependencies
+MANAGER_FACTORIES = {
+    "cache_manager": lambda context: CacheManager(),
+    "config_manager": lambda context: ConfigManager(),
+    "secrets_manager": lambda context: SecretsManager(
+        ttl=context.config_manager.get_secret_ttl(),
+        refresh_margin=context.config_manager.get_secret_refresh_margin(),
+    ),
+    "domain_manager": lambda context: DomainManager(),
+    "web3_manager": Web3Manager,
+    "api_manager": APIManager,
+    "adapter_manager": AdapterManager,
+    "library_manager": lambda context: LibraryManager(),
+    "serializer_manager": lambda context: SerializerManager(),
+    "form_manager": lambda context: FormManager(),
+    "job_manager": JobManager,
+    "mirror_manager": MirrorManager,
+}
+
+_app_context = None
+_app_context_lock = threading.Lock()
 
 def build_app_context():
-    # Step 1: Create context-independent managers
-    cache = CacheManager()
-    config = ConfigManager()
-    secrets = SecretsManager()
-    domain = DomainManager()
-
-    # Step 2: Build context
-    context = AppContext(
-        cache_manager=cache,
-        config_manager=config,
-        secrets_manager=secrets,
-        domain_manager=domain,
-    )
-
-    # Step 3: Add higher-level managers
-    context.web3_manager = Web3Manager(context)
-    context.api_manager = APIManager(context)
-    context.adapter_manager = AdapterManager(context)
-    context.library_manager = LibraryManager()
-    context.serializer_manager = SerializerManager()
-    context.form_manager  = FormManager()
-
-    return context
\ No newline at end of file
+    """Build a new, independent context. Managers are created lazily on first use."""
+    return AppContext(MANAGER_FACTORIES)
+
+def get_app_context():
+    """Return the process-wide context, building it on first call."""
+    global _app_context
+
+    if _app_context is None:
+        with _app_context_lock:
+            if _app_context is None:
+                _app_context = build_app_context()
+
+    return _app_context
+
+def reset_app_context(*manager_names):
+    """Rebuild managers after a config or secret reload (all managers when no names are given)."""
+    get_app_context().reset(*manager_names)
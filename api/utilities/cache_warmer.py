@@ -0,0 +1,156 @@
+import logging
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from django.core.cache import cache
+
+from api.managers.cache_manager import CacheManager
+from api.utilities.logging import log_error, log_info, log_warning
+
+class CacheWarmer:
+    """Rebuild the chain-backed cache entries of every contract: counts, contract lists, and each contract's
+    contract, party, transaction and settlement entries.
+
+    Contracts are warmed in chunks, one cache round trip and one JSON-RPC batch per chunk, with at most
+    `concurrency` chunks in flight. Finished chunks are checkpointed in the shared cache, so an interrupted
+    run resumes where it stopped. The checkpoint expires no later than the first entries it vouches for.
+    """
+
+    PROGRESS_CACHE_KEY = "warm_cache_progress"
+    # Shortest lifetime of the entries a checkpoint covers; chunks warmed longer ago may be gone
+    PROGRESS_TTL = CacheManager.VERSIONED_KEY_TTL
+    LOCK_CACHE_KEY = "warm_cache_lock"
+    LOCK_TTL = 60 * 60
+    DEFAULT_CONCURRENCY = 4
+    DEFAULT_CHUNK_SIZE = 25
+    FAMILIES = ("contract", "party", "transaction", "settlement")
+
+    def __init__(self, context, concurrency=DEFAULT_CONCURRENCY, chunk_size=DEFAULT_CHUNK_SIZE, report=None):
+        self.context = context
+        self.concurrency = concurrency
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+        self.report = report or (lambda message: log_info(self.logger, message))
+        self._progress_expires_at = None
+
+    def warm(self, contract_types=None, resume=True):
+        """Warm every contract of the given types (all types by default). Returns per-type counts and timings."""
+        started = time.monotonic()
+        progress = self._load_progress() if resume else {}
+        summary = {}
+
+        for contract_type in contract_types or self.context.domain_manager.get_contract_types():
+            summary[contract_type] = self._warm_contract_type(contract_type, progress)
+
+        if all(result["failed"] == 0 for result in summary.values()):
+            cache.delete(self.PROGRESS_CACHE_KEY)
+
+        self.report(f"Cache warm finished in {time.monotonic() - started:.1f}s")
+        return summary
+
+    def warm_once(self, contract_types=None):
+        """Warm unless another process already is; used by the post-start hook so one worker warms for all."""
+        if not cache.add(self.LOCK_CACHE_KEY, self._owner(), self.LOCK_TTL):
+            log_info(self.logger, "Cache warm already running elsewhere, skipping")
+            return None
+
+        try:
+            return self.warm(contract_types)
+        finally:
+            cache.delete(self.LOCK_CACHE_KEY)
+
+    def _warm_contract_type(self, contract_type, progress):
+        started = time.monotonic()
+        contract_api = self.context.api_manager.get_contract_api(contract_type)
+
+        count_response = contract_api.get_contract_count(contract_type)
+        if count_response["status"] != 200:
+            raise RuntimeError(f"Could not retrieve contract count for {contract_type}: {count_response['message']}")
+        contract_count = count_response["data"]["count"]
+
+        # Rebuilds the summaries behind /contracts/ in pages
+        contract_api.prefetch_contract_summaries(contract_type)
+
+        families = tuple(
+            family for family in self.FAMILIES
+            if family != "settlement" or self.context.api_manager.get_settlement_api(contract_type)
+        )
+
+        done = set(progress.get(contract_type, []))
+        chunks = [start for start in range(0, contract_count, self.chunk_size) if start not in done]
+        self.report(f"{contract_type}: {contract_count} contracts, {len(done)} chunks already warm, {len(chunks)} to go")
+
+        filled = failed = 0
+        finished = len(done)
+        total_chunks = finished + len(chunks)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="warm") as executor:
+            futures = {
+                executor.submit(contract_api.prefetch_many, contract_type, range(start, min(start + self.chunk_size, contract_count)), families): start
+                for start in chunks
+            }
+
+            for future in as_completed(futures):
+                start = futures[future]
+                chunk_filled, chunk_failed = future.result()
+                filled += chunk_filled
+                failed += chunk_failed
+                finished += 1
+
+                # Only fully warmed chunks are checkpointed; the rest are retried on the next run
+                if not chunk_failed:
+                    done.add(start)
+                    progress[contract_type] = sorted(done)
+                    self._save_progress(progress)
+
+                self.report(
+                    f"{contract_type}: {finished}/{total_chunks} chunks, {filled} entries filled, {failed} failed, "
+                    f"{time.monotonic() - started:.1f}s"
+                )
+
+        return {"contracts": contract_count, "filled": filled, "failed": failed, "seconds": round(time.monotonic() - started, 3)}
+
+    def _load_progress(self):
+        progress = cache.get(self.PROGRESS_CACHE_KEY)
+
+        # Chunk offsets only line up with a checkpoint written with the same chunk size
+        if not progress or progress.get("chunk_size") != self.chunk_size:
+            return {}
+
+        self._progress_expires_at = progress.get("expires_at")
+        return progress["contract_types"]
+
+    def _save_progress(self, progress):
+        # Anchored to the first checkpoint, so resuming does not extend the life of chunks warmed back then
+        if self._progress_expires_at is None:
+            self._progress_expires_at = time.time() + self.PROGRESS_TTL
+
+        try:
+            cache.set(
+                self.PROGRESS_CACHE_KEY,
+                {"chunk_size": self.chunk_size, "contract_types": progress, "expires_at": self._progress_expires_at},
+                max(int(self._progress_expires_at - time.time()), 1)
+            )
+        except Exception as e:
+            log_warning(self.logger, f"Failed to checkpoint cache warm progress: {e}")
+
+    @staticmethod
+    def _owner():
+        return f"{os.uname().nodename}:{os.getpid()}"
+
+def start_background_warm(context_factory):
+    """Post-start hook: warm the caches on a daemon thread when FIZIT_WARM_CACHE_ON_START is set."""
+    if os.getenv("FIZIT_WARM_CACHE_ON_START", "").lower() not in {"1", "true", "yes"}:
+        return
+
+    logger = logging.getLogger(__name__)
+
+    def run():
+        try:
+            CacheWarmer(context_factory()).warm_once()
+        except Exception as e:
+            log_error(logger, f"Background cache warm failed: {e}")
+
+    threading.Thread(target=run, name="warm-cache", daemon=True).start()
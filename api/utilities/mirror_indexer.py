@@ -0,0 +1,122 @@
+import logging
+import time
+
+from api.managers.cache_manager import CacheManager
+from api.utilities.logging import log_info
+
+class MirrorIndexer:
+    """Keeps the SQL mirror in step with the chain.
+
+    A contract type is first backfilled by reading every contract at one block. After that each pass reads the
+    ContractEvent logs since the cursor, a block span at a time, and re-reads only the families those events
+    touched, pinned to the end of the span, in one JSON-RPC batch. The cursor advances only once a span is
+    stored, so a failed pass is simply repeated.
+    """
+
+    DEFAULT_CHUNK_SIZE = 25
+
+    def __init__(self, context, chunk_size=DEFAULT_CHUNK_SIZE, report=None):
+        self.context = context
+        self.mirror_manager = context.mirror_manager
+        self.chunk_size = chunk_size
+        self.logger = logging.getLogger(__name__)
+        self.report = report or (lambda message: log_info(self.logger, message))
+
+    def index(self, contract_types=None):
+        """One pass over the given contract types (all by default): backfill new ones, catch up the rest."""
+        for contract_type in contract_types or self.context.domain_manager.get_contract_types():
+            if self.mirror_manager.get_cursor(contract_type) is None:
+                self.backfill(contract_type)
+            else:
+                self.catch_up(contract_type)
+
+    def backfill(self, contract_type):
+        started = time.monotonic()
+        network = self.context.domain_manager.get_contract_network()
+        contract_release = self.context.config_manager.get_contract_release(contract_type)
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+
+        block_number = self.context.web3_manager.get_block_number(network)
+        contract_count = web3_contract.functions.getContractCount().call(block_identifier=block_number)
+        families = self._families(contract_type)
+
+        for start in range(0, contract_count, self.chunk_size):
+            contract_idxs = range(start, min(start + self.chunk_size, contract_count))
+            self._sync_contracts(contract_type, contract_release, network, {contract_idx: families for contract_idx in contract_idxs}, block_number)
+            self.report(f"{contract_type}: backfilled {contract_idxs.stop}/{contract_count} contracts, {time.monotonic() - started:.1f}s")
+
+        # The cursor is written last; until then reads of this type keep going to chain
+        self.mirror_manager.save_cursor(contract_type, contract_release, network, contract_count, block_number)
+        self.report(f"{contract_type}: backfill finished at block {block_number} in {time.monotonic() - started:.1f}s")
+
+    def catch_up(self, contract_type):
+        cursor = self.mirror_manager.get_cursor(contract_type)
+        head_block = self.context.web3_manager.get_block_number(cursor.network)
+        block_span = self.context.config_manager.get_mirror_block_span()
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, cursor.network)
+        families = self._families(contract_type)
+
+        from_block = cursor.last_block + 1
+        contract_count = cursor.contract_count
+
+        if from_block > head_block:
+            # Nothing new; still record the pass so lag_seconds reflects a live indexer
+            self.mirror_manager.save_cursor(contract_type, cursor.contract_release, cursor.network, contract_count, cursor.last_block)
+            return
+
+        while from_block <= head_block:
+            to_block = min(from_block + block_span - 1, head_block)
+            events = self.context.web3_manager.get_contract_logs(contract_type, cursor.network, from_block, to_block)
+
+            touched = {}
+            for _, contract_idx, event_type, _ in events:
+                touched.setdefault(contract_idx, set()).update(self._event_families(event_type, families))
+
+            if any(event_type == "ContractAdded" for _, _, event_type, _ in events):
+                contract_count = web3_contract.functions.getContractCount().call(block_identifier=to_block)
+
+            for start in range(0, len(touched), self.chunk_size):
+                chunk = dict(list(touched.items())[start:start + self.chunk_size])
+                self._sync_contracts(contract_type, cursor.contract_release, cursor.network, chunk, to_block)
+
+            self.mirror_manager.save_cursor(contract_type, cursor.contract_release, cursor.network, contract_count, to_block)
+            if events:
+                self.report(f"{contract_type}: indexed {len(events)} events on {len(touched)} contracts up to block {to_block}")
+            from_block = to_block + 1
+
+    def _families(self, contract_type):
+        return tuple(
+            family for family in self.mirror_manager.FAMILY_GETTERS
+            if family != "settlement" or self.context.api_manager.get_settlement_api(contract_type)
+        )
+
+    def _event_families(self, event_type, families):
+        # Same event-to-family map the cache invalidates with; a new contract or an unknown event re-reads everything
+        event_families = CacheManager.EVENT_KEY_FAMILIES.get(event_type)
+        if event_families is None or "contract_count" in event_families:
+            return families
+        return [family for family in event_families if family in families]
+
+    def _sync_contracts(self, contract_type, contract_release, network, contract_families, block_number):
+        """Re-read the given families of each contract at block_number in one JSON-RPC batch and store them."""
+        web3_contract = self.context.web3_manager.get_web3_contract(contract_type, network)
+        pending = {}
+
+        with self.context.web3_manager.batch(network) as batch:
+            for contract_idx, families in contract_families.items():
+                for family in families:
+                    getter = getattr(web3_contract.functions, self.mirror_manager.FAMILY_GETTERS[family])
+                    pending[(contract_idx, family)] = batch.call(getter(contract_idx), block_number)
+
+                if "contract" in families:
+                    pending[(contract_idx, "summary")] = batch.call(
+                        web3_contract.functions.getContractSummaries(contract_idx, contract_idx + 1), block_number
+                    )
+
+        for contract_idx, families in contract_families.items():
+            # BatchResult.get raises the request's error, which fails the pass before the cursor moves
+            values = {family: pending[(contract_idx, family)].get() for family in families}
+            if "contract" in values:
+                values["contract"] = (values["contract"], pending[(contract_idx, "summary")].get()[0])
+
+            self.mirror_manager.store_snapshots(contract_type, contract_release, contract_idx, block_number, values)
@@ -7,8 +7,11 @@ from .account_view import AccountViewSet
 from .deposit_view import DepositViewSet
 from .recipient_view import RecipientViewSet
 from .event_view import EventViewSet
+from .job_view import JobViewSet
 from .advance_view import AdvanceViewSet
 from .residual_view import ResidualViewSet
 from .distribution_view import DistributionViewSet
 from .stats_view import StatsView
+from .cache_metrics_view import CacheMetricsView
+from .mirror_lag_view import MirrorLagView
 from ..utilities.csrf import *
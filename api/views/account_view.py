@@ -10,7 +10,7 @@ from api.serializers.account_serializer import AccountSerializer
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
 class AccountViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
@@ -20,7 +20,7 @@ class AccountViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     def __init__(self, **kwargs):
         """Initialize the view with AccountAPI instance and logger."""
         super().__init__(**kwargs)
-        self.context = build_app_context() 
+        self.context = get_app_context() 
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -9,18 +9,18 @@ from drf_spectacular.utils import extend_schema
 from api.serializers.advance_serializer import AdvanceSerializer
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
-class AdvanceViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class AdvanceViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         """Initialize the view with AdvanceAPI instance and logger."""
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
 ### **Purchase Advances**
@@ -9,19 +9,19 @@ from drf_spectacular.utils import extend_schema
 from api.serializers.artifact_serializer import ArtifactSerializer
 from api.permissions import HasCustomAPIKey
 from api.authentication import AWSSecretsAPIKeyAuthentication
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 from api.utilities.validation import is_valid_list, is_valid_url
 
 
-class ArtifactViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class ArtifactViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -0,0 +1,39 @@
+import logging
+
+from rest_framework.views import APIView
+from rest_framework.response import Response
+from rest_framework import status
+from rest_framework.exceptions import PermissionDenied
+from drf_spectacular.utils import extend_schema
+
+from api.authentication import AWSSecretsAPIKeyAuthentication
+from api.permissions import HasCustomAPIKey
+from api.views.mixins import PermissionMixin
+from api.utilities.bootstrap import get_app_context
+from api.utilities.logging import log_error
+
+class CacheMetricsView(APIView, PermissionMixin):
+    authentication_classes = [AWSSecretsAPIKeyAuthentication]
+    permission_classes = [HasCustomAPIKey]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.context = get_app_context()
+        self.logger = logging.getLogger(__name__)
+
+    @extend_schema(
+        tags=["Admin"],
+        summary="Cache Metrics",
+        description="Cache hits, misses, errors, bytes written and shared-cache latency per key family, summed over every worker that reported in the last five minutes.",
+    )
+    def get(self, request):
+        try:
+            self._validate_master_key(request.auth)
+            return Response(self.context.cache_manager.get_metrics(), status=status.HTTP_200_OK)
+
+        except PermissionDenied as pd:
+            log_error(self.logger, f"Permission denied: {pd}")
+            return Response({"detail": str(pd)}, status=status.HTTP_403_FORBIDDEN)
+        except Exception as e:
+            log_error(self.logger, f"Unexpected error: {str(e)}")
+            return Response({"error": f"Unexpected error {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
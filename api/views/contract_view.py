@@ -4,22 +4,22 @@ from rest_framework.response import Response
 from rest_framework.exceptions import ValidationError, PermissionDenied
 from rest_framework import viewsets, status
 
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers import ListContractSerializer, PurchaseContractSerializer, SaleContractSerializer, AdvanceContractSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_info, log_error, log_warning
 
-class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class ContractViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -87,19 +87,33 @@ class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
         log_info(self.logger, "Fetching contract list filter by party_code.")
 
         try:
-            contract_types = self.context.domain_manager.get_contract_types()
+            party_api = self.context.api_manager.get_party_api()
+
+            # The party code index narrows the work to the matching contracts
+            index_response = party_api.get_party_contracts(party_code)
+            if index_response["status"] != status.HTTP_200_OK:
+                raise RuntimeError(index_response["message"])
+
+            contract_idxs = {}
+            for contract_type, contract_idx in index_response["data"]:
+                contract_idxs.setdefault(contract_type, []).append(contract_idx)
+
             contracts = []
 
-            for contract_type in contract_types:
+            for contract_type in self.context.domain_manager.get_contract_types():
+                if contract_type not in contract_idxs:
+                    continue
+
                 contract_api = self.context.api_manager.get_contract_api(contract_type)
-                contract_response = contract_api.list_contracts(contract_type, request.auth.get("api_key"))
-                
+                contract_response = contract_api.list_contracts(contract_type, request.auth.get("api_key"), contract_idxs[contract_type])
+
                 if contract_response["status"] == status.HTTP_200_OK:
                     contracts.extend(contract_response["data"])
                 else:
                     log_warning(self.logger, f"Skipped {contract_type} due to failed fetch.")
 
-            party_response = self.context.api_manager.get_party_api().get_party_list(contracts, party_code) 
+            # Checking the matches against their current parties keeps a briefly stale index from over-reporting
+            party_response = party_api.get_party_list(contracts, party_code)
             if party_response["status"] != status.HTTP_200_OK:
                 raise RuntimeError
 
@@ -114,7 +128,10 @@ class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Purchase Contracts"],
         request=PurchaseContractSerializer(many=False),
-        responses={status.HTTP_201_CREATED: int},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: int, status.HTTP_202_ACCEPTED: dict},
         summary="Create Purchase Contract",
         description="Create a new purchase contract"
     )
@@ -154,7 +171,10 @@ class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Sale Contracts"],
         request=SaleContractSerializer(many=False),
-        responses={status.HTTP_201_CREATED: int},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: int, status.HTTP_202_ACCEPTED: dict},
         summary="Create Sale Contract",
         description="Create a new sale contract."
     )
@@ -194,7 +214,10 @@ class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Advance Contracts"],
         request=AdvanceContractSerializer(many=False),
-        responses={status.HTTP_201_CREATED: int},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: int, status.HTTP_202_ACCEPTED: dict},
         summary="Create Advance Contract",
         description="Create a new advance contract"
     )
@@ -245,10 +268,10 @@ class ContractViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             log_info(self.logger, "Contract validated")
 
             contract_api = self.context.api_manager.get_contract_api(contract_type)
-            response = contract_api.add_contract(contract_type, validated_data)
+            response = contract_api.add_contract(contract_type, validated_data, async_mode=self._is_async_request(request))
 
-            if response["status"] == status.HTTP_201_CREATED:
-                return Response(response["data"], status=status.HTTP_201_CREATED)
+            if response["status"] in (status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED):
+                return Response(response["data"], status=response["status"])
             else:
                 return Response({"error" : response["message"]}, response["status"])
 
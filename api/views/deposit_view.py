@@ -10,17 +10,17 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers.deposit_serializer import DepositSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_info, log_warning, log_error
 
-class DepositViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class DepositViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
 ### **Purchase Contract Deposits**
@@ -53,7 +53,10 @@ class DepositViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Purchase Contracts"],
         request=DepositSerializer,
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Add Purchase Contract Deposit",
         description="Add a deposit to a purchase contract."
     )
@@ -91,7 +94,10 @@ class DepositViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Sale Contracts"],
         request=DepositSerializer,
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Add Sale Contract Deposit",
         description="Add a deposit to a sale contract."
     )
@@ -129,7 +135,10 @@ class DepositViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Advance Contracts"],
         request=DepositSerializer,
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Add Advance Contract Deposit",
         description="Add a deposit to an advance contract."
     )
@@ -181,10 +190,10 @@ class DepositViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
 
             validated_data = self._validate_request_data(DepositSerializer, request.data)
             deposit_api = self.context.api_manager.get_deposit_api(contract_type)
-            response = deposit_api.add_deposit(contract_type, int(contract_idx), validated_data)
+            response = deposit_api.add_deposit(contract_type, int(contract_idx), validated_data, async_mode=self._is_async_request(request))
 
-            if response["status"] == status.HTTP_201_CREATED:
-                return Response(response["data"], status=status.HTTP_201_CREATED)
+            if response["status"] in (status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED):
+                return Response(response["data"], status=response["status"])
             else:
                 return Response({"error": response["message"]}, status=response["status"])
 
@@ -8,17 +8,17 @@ from drf_spectacular.utils import extend_schema
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers import DistributionSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
-class DistributionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class DistributionViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
 ### **Sale Contract Distributions**
@@ -13,7 +13,7 @@ from api.permissions import HasCustomAPIKey
 from api.serializers.event_serializer import EventSerializer
 from api.models import Event
 from api.views.mixins.validation import ValidationMixin
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_info, log_warning, log_error
 
 class EventViewSet(viewsets.ViewSet, ValidationMixin):
@@ -22,7 +22,7 @@ class EventViewSet(viewsets.ViewSet, ValidationMixin):
 
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -0,0 +1,49 @@
+import logging
+
+from rest_framework.response import Response
+from rest_framework.exceptions import PermissionDenied
+from rest_framework import viewsets, status
+
+from drf_spectacular.utils import extend_schema
+
+from api.authentication import AWSSecretsAPIKeyAuthentication
+from api.permissions import HasCustomAPIKey
+from api.serializers.job_serializer import JobSerializer
+from api.views.mixins import ValidationMixin, PermissionMixin
+from api.utilities.bootstrap import get_app_context
+from api.utilities.logging import log_info, log_warning, log_error
+
+class JobViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+    authentication_classes = [AWSSecretsAPIKeyAuthentication]
+    permission_classes = [HasCustomAPIKey]
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.context = get_app_context()
+        self.logger = logging.getLogger(__name__)
+
+    @extend_schema(
+        tags=["Admin"],
+        summary="Retrieve Job",
+        description="Retrieve the status and transaction hashes of an asynchronous write.",
+        responses={status.HTTP_200_OK: JobSerializer},
+    )
+    def retrieve(self, request, job_id=None):
+        log_info(self.logger, f"Retrieving job {job_id}")
+
+        try:
+            self._validate_master_key(request.auth)
+            job = self.context.job_manager.get_job(job_id)
+
+            if job is None:
+                return Response({"error": f"Job {job_id} not found"}, status=status.HTTP_404_NOT_FOUND)
+
+            serializer = JobSerializer(job)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+
+        except PermissionDenied as pd:
+            log_error(self.logger, f"Permission denied for job {job_id}: {pd}")
+            return Response({"detail": str(pd)}, status=status.HTTP_403_FORBIDDEN)
+        except Exception as e:
+            log_error(self.logger, f"Unexpected error: {str(e)}")
+            return Response({"error": f"Unexpected error {str(e)}"}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
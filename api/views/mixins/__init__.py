@@ -1,2 +1,3 @@
 from .permission import PermissionMixin
-from .validation import ValidationMixin
\ No newline at end of file
+from .validation import ValidationMixin
+from .snapshot import SnapshotMixin
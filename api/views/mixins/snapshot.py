@@ -0,0 +1,68 @@
+import logging
+
+from rest_framework import status
+from rest_framework.exceptions import APIException, ValidationError
+
+from api.utilities.logging import log_warning
+
+CONSISTENCY_HEADER = "X-Fizit-Block"
+
+class ChainBehind(APIException):
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+    default_detail = "The chain has not reached the requested block yet; retry shortly."
+    default_code = "chain_behind"
+
+class SnapshotMixin:
+    """Run every request in a chain scope. Must precede the ViewSet in the bases.
+
+    GET reads are pinned to one block, so the contract, parties, transactions and settlements returned all
+    describe the same chain state. A write answers with the block it landed in as X-Fizit-Block; a request
+    presenting that token reads at or above that block. A token no write could have returned (negative, or
+    further ahead of the head than CONSISTENCY_MARGIN) is a 400, and a chain that does not reach the token
+    within CONSISTENCY_TIMEOUT is a 503.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        network = self.context.domain_manager.get_contract_network()
+        min_blocks = {}
+
+        token = request.headers.get(CONSISTENCY_HEADER)
+        if token:
+            try:
+                min_blocks[network] = int(token)
+            except ValueError:
+                log_warning(logging.getLogger(__name__), f"Ignoring malformed {CONSISTENCY_HEADER} token: {token}")
+
+        self._consistency_block = min_blocks.get(network)
+
+        pin_reads = request.method in ("GET", "HEAD")
+        with self.context.web3_manager.chain_scope(pin_reads=pin_reads, min_blocks=min_blocks) as scope:
+            response = super().dispatch(request, *args, **kwargs)
+
+        written_block = scope.written_blocks.get(network)
+        if written_block is not None:
+            response[CONSISTENCY_HEADER] = str(written_block)
+
+        return response
+
+    def initial(self, request, *args, **kwargs):
+        # After authentication, so only authenticated callers can make a worker wait
+        super().initial(request, *args, **kwargs)
+
+        min_block = self._consistency_block
+        if min_block is None:
+            return
+
+        web3_manager = self.context.web3_manager
+        network = self.context.domain_manager.get_contract_network()
+        head_block = web3_manager.get_block_number(network)
+
+        if min_block < 0 or min_block > head_block + web3_manager.CONSISTENCY_MARGIN:
+            raise ValidationError(f"{CONSISTENCY_HEADER} {min_block} is not a block this chain has reached (head is {head_block})")
+
+        if min_block > head_block:
+            try:
+                web3_manager.wait_for_block(network, min_block)
+            except TimeoutError as e:
+                log_warning(logging.getLogger(__name__), str(e))
+                raise ChainBehind()
@@ -1,10 +1,10 @@
 import re
-import time
 import json
 from decimal import Decimal
 
 from datetime import datetime
 from django.core.exceptions import ValidationError
+from rest_framework import exceptions
 
 from api.utilities.validation import is_valid_json, is_valid_amount, is_valid_percentage
 from api.utilities.logging import log_info, log_error, log_warning
@@ -20,27 +20,52 @@ class ValidationMixin:
         if contract_type not in valid_contract_types:
             raise ValidationError(f"Invalid contract type: {contract_type}. Allowed: {', '.join(valid_contract_types)}")
 
-    def _validate_contract_idx(self, contract_idx, contract_type, contract_api, delay=5, retries=3):
+    def _validate_contract_idx(self, contract_idx, contract_type, contract_api):
         if not isinstance(contract_idx, int) or contract_idx < 0:
             raise ValidationError(f"Invalid contract index: {contract_idx}. Must be a non-negative integer.")
 
-        for attempt in range(retries):
-            response = contract_api.get_contract_count(contract_type)
+        # Contracts are never removed, so an index below any count seen before is still valid
+        if contract_api.is_known_contract_idx(contract_type, contract_idx):
+            return
 
-            if response["status"] != 200:
-                raise ValidationError(f"Failed to retrieve contract count: {response.get('message', 'Unknown error')}")
+        # Callers that just created the contract present X-Fizit-Block, so this read already sees it
+        response = contract_api.get_contract_count(contract_type)
 
-            contract_count = response["data"]["count"]
-            if 0 <= contract_idx < contract_count:
-                return  # Validation successful
+        if response["status"] != 200:
+            raise ValidationError(f"Failed to retrieve contract count: {response.get('message', 'Unknown error')}")
 
+        contract_count = response["data"]["count"]
+        if contract_idx >= contract_count:
             log_warning(self.logger, f"Contract index {contract_idx} is out of range (0 to {contract_count - 1}). ")
-            if attempt == retries - 1:
-                raise ValidationError(f"Validation failed for contract index {contract_type}:{contract_idx}")
+            raise ValidationError(f"Contract index {contract_idx} is out of range. Expected range: 0 to {contract_count - 1}.")
 
-            time.sleep(delay)  # Sleep only when there's an issue
+    def _is_async_request(self, request):
+        """Writes run asynchronously when the caller opts in with ?async=true."""
+        return str(request.query_params.get("async", "")).lower() in {"true", "1", "yes"}
 
-        raise ValidationError(f"Contract index {contract_idx} is out of range. Expected range: 0 to {contract_count - 1}.")
+    def _parse_pagination(self, request, config_manager):
+        """Return (offset, limit) from ?offset=&limit=, or (None, None) when the caller did not ask for a page.
+
+        Raises DRF's ValidationError, which the views answer with a 400.
+        """
+        offset = request.query_params.get("offset")
+        limit = request.query_params.get("limit")
+
+        if offset is None and limit is None:
+            return None, None
+
+        max_page_size = config_manager.get_max_page_size()
+
+        try:
+            offset = int(offset) if offset is not None else 0
+            limit = int(limit) if limit is not None else max_page_size
+        except (TypeError, ValueError):
+            raise exceptions.ValidationError("offset and limit must be integers.")
+
+        if offset < 0 or not 0 < limit <= max_page_size:
+            raise exceptions.ValidationError(f"offset must be non-negative and limit between 1 and {max_page_size}.")
+
+        return offset, limit
 
     def _validate_wallet_address(self, wallet_address):
         if not re.match(r"^0x[a-fA-F0-9]{40}$", wallet_address):
@@ -70,8 +95,8 @@ class ValidationMixin:
             raise ValidationError(f"Invalid {field_name}: {value}. Allowed values: {', '.join(valid_values)}.")
 
     def _validate_api_key(self, api_key, secrets_manager):
-        valid_keys = secrets_manager.get_all_partner_keys()  # Expecting valid_keys to be a dictionary
-        if api_key not in valid_keys.values():
+        resolved = secrets_manager.resolve_api_key(api_key)
+        if resolved is None or resolved[1]:
             raise ValidationError("Invalid API key.")
 
     def _validate_request_data(self, serializer_class, data, many=False):
@@ -11,11 +11,11 @@ from drf_spectacular.utils import OpenApiParameter
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers import PartySerializer, ApprovalSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
-class PartyViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class PartyViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     """
     A ViewSet for managing parties associated with a contract.
     """
@@ -24,7 +24,7 @@ class PartyViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -59,7 +59,10 @@ class PartyViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Contracts"],
         request=PartySerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Contract Parties",
         description="Add a list of parties to an existing contract"
     )
@@ -77,11 +80,11 @@ class PartyViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             self._validate_parties(validated_data, self.context.config_manager)
 
             party_api = self.context.api_manager.get_party_api()
-            response = party_api.add_parties(contract_type, int(contract_idx), validated_data)
+            response = party_api.add_parties(contract_type, int(contract_idx), validated_data, async_mode=self._is_async_request(request))
             log_info(self.logger, f"Successfully added parties to {contract_type}:{contract_idx}")
 
-            if response["status"] == status.HTTP_201_CREATED:
-                return Response(response["data"], status=status.HTTP_201_CREATED)
+            if response["status"] in (status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED):
+                return Response(response["data"], status=response["status"])
             else:
                 return Response({"error" : response["message"]}, response["status"])
 
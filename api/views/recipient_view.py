@@ -11,7 +11,7 @@ from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers.recipient_serializer import RecipientSerializer
 from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info
 
 class RecipientViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
@@ -20,7 +20,7 @@ class RecipientViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
     @extend_schema(
@@ -4,28 +4,32 @@ from rest_framework.response import Response
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework import viewsets, status
 
-from drf_spectacular.utils import extend_schema
+from drf_spectacular.utils import extend_schema, OpenApiParameter
 
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers import AdvanceSettlementSerializer, SaleSettlementSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
-class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class SettlementViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
 ### **Sale Settlements**
 
     @extend_schema(
         tags=["Sale Contracts"],
+        parameters=[
+            OpenApiParameter(name='offset', description='Index of the first settlement to return', required=False, type=int),
+            OpenApiParameter(name='limit', description='Maximum number of settlements to return; the total is returned in X-Total-Count', required=False, type=int),
+        ],
         responses={status.HTTP_200_OK: SaleSettlementSerializer(many=True)},
         summary="List Sale Contract Settlements",
         description="Retrieve a list of settlements associated with a sale contract.",
@@ -36,7 +40,10 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Sale Contracts"],
         request=SaleSettlementSerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Sale Contract Settlements",
         description="Add settlements to a sale contract.",
     )
@@ -56,6 +63,10 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
 
     @extend_schema(
         tags=["Advance Contracts"],
+        parameters=[
+            OpenApiParameter(name='offset', description='Index of the first settlement to return', required=False, type=int),
+            OpenApiParameter(name='limit', description='Maximum number of settlements to return; the total is returned in X-Total-Count', required=False, type=int),
+        ],
         responses={status.HTTP_200_OK: AdvanceSettlementSerializer(many=True)},
         summary="List Advance Settlements",
         description="Retrieve a list of settlements associated with an advance contract.",
@@ -66,7 +77,10 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Advance Contracts"],
         request=AdvanceSettlementSerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Advance Settlements",
         description="Add settlements to an advance contract.",
     )
@@ -96,6 +110,11 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             self._validate_contract_idx(contract_idx, contract_type, contract_api)
 
             api_key = request.auth.get("api_key")
+            offset, limit = self._parse_pagination(request, self.context.config_manager)
+
+            # Warm every cold read below in one JSON-RPC round trip; a page request reads only its own rows
+            families = ("contract", "party") if offset is not None else ("contract", "party", "settlement")
+            contract_api.prefetch(contract_type, int(contract_idx), families)
 
             party_api = self.context.api_manager.get_party_api()
             response = party_api.get_parties(contract_type, int(contract_idx))
@@ -106,10 +125,20 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
                 return Response({"error": response["message"]}, response["status"])
 
             settlement_api = self.context.api_manager.get_settlement_api(contract_type)
+            serializer_class = self.context.serializer_manager.get_settlement_serializer(contract_type)
+
+            if offset is not None:
+                response = settlement_api.get_settlements_page(contract_type, int(contract_idx), offset, limit, api_key, parties)
+
+                if response["status"] == status.HTTP_200_OK:
+                    serializer = serializer_class(response["data"]["results"], many=True)
+                    return Response(serializer.data, status=status.HTTP_200_OK, headers={"X-Total-Count": str(response["data"]["count"])})
+                else:
+                    return Response({"error": response["message"]}, response["status"])
+
             response = settlement_api.get_settlements(contract_type, int(contract_idx), api_key, parties)
 
             if response["status"] == status.HTTP_200_OK:
-                serializer_class = self.context.serializer_manager.get_settlement_serializer(contract_type)
                 serializer = serializer_class(response["data"], many=True)
                 return Response(serializer.data, status=status.HTTP_200_OK)
             else:
@@ -142,12 +171,12 @@ class SettlementViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             self._validate_settlements(validated_data)
 
             settlement_api = self.context.api_manager.get_settlement_api(contract_type)
-            response = settlement_api.add_settlements(contract_type, contract_idx, validated_data)
+            response = settlement_api.add_settlements(contract_type, contract_idx, validated_data, async_mode=self._is_async_request(request))
 
             log_info(self.logger, f"Sending contract_type {contract_type}, contract_idx {contract_idx}, validated_data {validated_data}")
 
-            if response["status"] == status.HTTP_201_CREATED:
-                return Response(response["data"], status=status.HTTP_201_CREATED)
+            if response["status"] in (status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED):
+                return Response(response["data"], status=response["status"])
             else:
                 return Response({"error": response["message"]}, response["status"])
 
@@ -11,18 +11,18 @@ from drf_spectacular.utils import extend_schema, OpenApiParameter
 from api.authentication import AWSSecretsAPIKeyAuthentication
 from api.permissions import HasCustomAPIKey
 from api.serializers import AdvanceTransactionSerializer, SaleTransactionSerializer, PurchaseTransactionSerializer
-from api.views.mixins import ValidationMixin, PermissionMixin
-from api.utilities.bootstrap import build_app_context
+from api.views.mixins import ValidationMixin, PermissionMixin, SnapshotMixin
+from api.utilities.bootstrap import get_app_context
 from api.utilities.logging import log_error, log_info, log_warning
 
 
-class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
+class TransactionViewSet(SnapshotMixin, viewsets.ViewSet, ValidationMixin, PermissionMixin):
     authentication_classes = [AWSSecretsAPIKeyAuthentication]
     permission_classes = [HasCustomAPIKey]
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self.context = build_app_context()
+        self.context = get_app_context()
         self.logger = logging.getLogger(__name__)
 
 
@@ -33,6 +33,8 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
         parameters=[
             OpenApiParameter(name='transact_min_dt', description='Minimum transaction date (ISO 8601)', required=False, type=str),
             OpenApiParameter(name='transact_max_dt', description='Maximum transaction date (ISO 8601)', required=False, type=str),
+            OpenApiParameter(name='offset', description='Index of the first transaction to return', required=False, type=int),
+            OpenApiParameter(name='limit', description='Maximum number of transactions to return; the total is returned in X-Total-Count', required=False, type=int),
         ],
         responses={status.HTTP_200_OK: PurchaseTransactionSerializer(many=True)},
         summary="List Purchase Contract Transactions",
@@ -44,7 +46,10 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Purchase Contracts"],
         request=PurchaseTransactionSerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Purchase Contract Transactions",
         description="Add transactions to a purchase contract.",
     )
@@ -67,6 +72,8 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
         parameters=[
             OpenApiParameter(name='transact_min_dt', description='Minimum transaction date (ISO 8601)', required=False, type=str),
             OpenApiParameter(name='transact_max_dt', description='Maximum transaction date (ISO 8601)', required=False, type=str),
+            OpenApiParameter(name='offset', description='Index of the first transaction to return', required=False, type=int),
+            OpenApiParameter(name='limit', description='Maximum number of transactions to return; the total is returned in X-Total-Count', required=False, type=int),
         ],
         responses={status.HTTP_200_OK: SaleTransactionSerializer(many=True)},
         summary="List Sale Contract Transactions",
@@ -78,7 +85,10 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Sale Contracts"],
         request=SaleTransactionSerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Sale Contract Transactions",
         description="Add transactions to a sale contract.",
     )
@@ -101,6 +111,8 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
         parameters=[
             OpenApiParameter(name='transact_min_dt', description='Minimum transaction date (ISO 8601)', required=False, type=str),
             OpenApiParameter(name='transact_max_dt', description='Maximum transaction date (ISO 8601)', required=False, type=str),
+            OpenApiParameter(name='offset', description='Index of the first transaction to return', required=False, type=int),
+            OpenApiParameter(name='limit', description='Maximum number of transactions to return; the total is returned in X-Total-Count', required=False, type=int),
         ],
         responses={status.HTTP_200_OK: AdvanceTransactionSerializer(many=True)},
         summary="List Advance Contract Transactions",
@@ -112,7 +124,10 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
     @extend_schema(
         tags=["Advance Contracts"],
         request=AdvanceTransactionSerializer(many=True),
-        responses={status.HTTP_201_CREATED: dict},
+        parameters=[
+            OpenApiParameter(name='async', description='Return 202 with a job id once broadcast instead of waiting for confirmation', required=False, type=bool),
+        ],
+        responses={status.HTTP_201_CREATED: dict, status.HTTP_202_ACCEPTED: dict},
         summary="Create Advance Contract Transactions",
         description="Add transactions to an advance contract.",
     )
@@ -140,6 +155,15 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
 
             transact_min_dt = self._parse_optional_date(request.query_params.get('transact_min_dt'))
             transact_max_dt = self._parse_optional_date(request.query_params.get('transact_max_dt'))
+            offset, limit = self._parse_pagination(request, self.context.config_manager)
+
+            # Pages are read by position, so a date window cannot be applied to them
+            if offset is not None and (transact_min_dt or transact_max_dt):
+                raise ValidationError("transact_min_dt and transact_max_dt cannot be combined with offset or limit")
+
+            # Warm every cold read below in one JSON-RPC round trip; a page request reads only its own rows
+            families = ("contract", "party") if offset is not None else ("contract", "party", "transaction")
+            contract_api.prefetch(contract_type, int(contract_idx), families)
 
             party_api = self.context.api_manager.get_party_api()
             response = party_api.get_parties(contract_type, int(contract_idx))
@@ -148,13 +172,25 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             parties = response["data"]
 
             transaction_api = self.context.api_manager.get_transaction_api(contract_type)
+            serializer_class = self.context.serializer_manager.get_transaction_serializer(contract_type)
+
+            if offset is not None:
+                response = transaction_api.get_transactions_page(
+                    contract_type, int(contract_idx), offset, limit, request.auth.get("api_key"), parties
+                )
+
+                if response["status"] == status.HTTP_200_OK:
+                    serializer = serializer_class(response["data"]["results"], many=True)
+                    return Response(serializer.data, status=status.HTTP_200_OK, headers={"X-Total-Count": str(response["data"]["count"])})
+                else:
+                    return Response({"error": response["message"]}, response["status"])
+
             response = transaction_api.get_transactions(
                 contract_type, int(contract_idx), request.auth.get("api_key"), parties,
                 transact_min_dt=transact_min_dt, transact_max_dt=transact_max_dt
             )
 
             if response["status"] == status.HTTP_200_OK:
-                serializer_class = self.context.serializer_manager.get_transaction_serializer(contract_type)
                 serializer = serializer_class(response["data"], many=True)
                 return Response(serializer.data, status=status.HTTP_200_OK)
             else:
@@ -188,11 +224,12 @@ class TransactionViewSet(viewsets.ViewSet, ValidationMixin, PermissionMixin):
             log_info(self.logger, f"Contract_type: {contract_type}, Contract_idx: {contract_idx}")
             log_info(self.logger, f"Transact_logic: {transact_logic}, validated_data: {validated_data}")
             response = transaction_api.add_transactions(
-                contract_type, contract_idx, transact_logic, validated_data
+                contract_type, contract_idx, transact_logic, validated_data,
+                async_mode=self._is_async_request(request)
             )
 
-            if response["status"] == status.HTTP_201_CREATED:
-                return Response(response["data"], status=status.HTTP_201_CREATED)
+            if response["status"] in (status.HTTP_201_CREATED, status.HTTP_202_ACCEPTED):
+                return Response(response["data"], status=response["status"])
             else:
                 return Response({"error": response["message"]}, response["status"])
 
@@ -14,3 +14,9 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'project.settings')
 
 application = get_wsgi_application()
+
+# Only web servers load this module, so management commands never warm; opt-in via FIZIT_WARM_CACHE_ON_START
+from api.utilities.bootstrap import get_app_context
+from api.utilities.cache_warmer import start_background_warm
+
+start_background_warm(get_app_context)
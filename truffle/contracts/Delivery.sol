@@ -84,6 +84,12 @@ contract Delivery {
         string party_type;              // the type of party associated with contract
     }
 
+    struct ContractSummary {
+        string contract_name;           // description for display purposes
+        bool is_active;                 // see Contract.is_active
+        string transact_logic;          // jsonlogic formula, encrypted like the full contract
+    }
+
     event ContractEvent(uint indexed contract_idx, string eventType, string details);
 
     function getContractCount() public view returns (uint) {
@@ -95,6 +101,20 @@ contract Delivery {
         return contracts[contract_idx];
     }
 
+    // summaries for contracts [start, end), end is clamped to the contract count
+    function getContractSummaries(uint start, uint end) public view returns (ContractSummary[] memory) {
+        if (end > contracts.length) {
+            end = contracts.length;
+        }
+        uint size = start < end ? end - start : 0;
+        ContractSummary[] memory summaries = new ContractSummary[](size);
+        for (uint i = 0; i < size; i++) {
+            Contract storage contract_ = contracts[start + i];
+            summaries[i] = ContractSummary(contract_.contract_name, contract_.is_active, contract_.transact_logic);
+        }
+        return summaries;
+    }
+
     function addContract (Contract memory contract_) public {
         contracts.push(contract_);
         emit ContractEvent(contracts.length - 1, "ContractAdded", contract_.contract_name);
@@ -167,6 +187,21 @@ contract Delivery {
         return artifacts[contract_idx];
     }
 
+    function getArtifactCount(uint contract_idx) public view returns (uint) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        return artifacts[contract_idx].length;
+    }
+
+    function getArtifactsRange(uint contract_idx, uint offset, uint limit) public view returns (Artifact[] memory) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        uint size = pageSize(artifacts[contract_idx].length, offset, limit);
+        Artifact[] memory page = new Artifact[](size);
+        for (uint i = 0; i < size; i++) {
+            page[i] = artifacts[contract_idx][offset + i];
+        }
+        return page;
+    }
+
     // Update addArtifact function:
     function addArtifact(uint contract_idx, string memory doc_title, string memory doc_type, uint added_dt,
         string memory s3_bucket, string memory s3_object_key, string memory s3_version_id) public {
@@ -206,8 +241,36 @@ contract Delivery {
         return settlements[contract_idx];
     }
 
+    function getSettlementCount(uint contract_idx) public view returns (uint) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        return settlements[contract_idx].length;
+    }
+
+    function getSettlementsRange(uint contract_idx, uint offset, uint limit) public view returns (Settlement[] memory) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        uint size = pageSize(settlements[contract_idx].length, offset, limit);
+        Settlement[] memory page = new Settlement[](size);
+        for (uint i = 0; i < size; i++) {
+            page[i] = settlements[contract_idx][offset + i];
+        }
+        return page;
+    }
+
     function addSettlement(uint contract_idx, string memory extended_data, uint settle_due_dt, uint transact_min_dt, uint transact_max_dt) public {
         require(contract_idx < contracts.length, "Invalid contract index");
+        _addSettlement(contract_idx, extended_data, settle_due_dt, transact_min_dt, transact_max_dt);
+    }
+
+    // batch entry point, arrays are parallel and one SettlementAdded event is emitted per row
+    function addSettlements(uint contract_idx, string[] memory extended_data, uint[] memory settle_due_dt, uint[] memory transact_min_dt, uint[] memory transact_max_dt) public {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        require(settle_due_dt.length == extended_data.length && transact_min_dt.length == extended_data.length && transact_max_dt.length == extended_data.length, "Array length mismatch");
+        for (uint i = 0; i < extended_data.length; i++) {
+            _addSettlement(contract_idx, extended_data[i], settle_due_dt[i], transact_min_dt[i], transact_max_dt[i]);
+        }
+    }
+
+    function _addSettlement(uint contract_idx, string memory extended_data, uint settle_due_dt, uint transact_min_dt, uint transact_max_dt) internal {
         Settlement memory settlement;
         settlement.settle_due_dt = settle_due_dt;
         settlement.transact_min_dt = transact_min_dt;
@@ -228,6 +291,21 @@ contract Delivery {
         return transactions[contract_idx];
     }
 
+    function getTransactionCount(uint contract_idx) public view returns (uint) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        return transactions[contract_idx].length;
+    }
+
+    function getTransactionsRange(uint contract_idx, uint offset, uint limit) public view returns (Transaction[] memory) {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        uint size = pageSize(transactions[contract_idx].length, offset, limit);
+        Transaction[] memory page = new Transaction[](size);
+        for (uint i = 0; i < size; i++) {
+            page[i] = transactions[contract_idx][offset + i];
+        }
+        return page;
+    }
+
     function deleteTransactions(uint contract_idx) public {
         require(contract_idx < contracts.length, "Invalid contract index");
         delete transactions[contract_idx];
@@ -236,7 +314,19 @@ contract Delivery {
 
     function addTransaction(uint contract_idx, string memory extended_data, uint transact_dt, int transact_amt, string memory transact_data) public {
         require(contract_idx < contracts.length, "Invalid contract index");
+        _addTransaction(contract_idx, extended_data, transact_dt, transact_amt, transact_data);
+    }
+
+    // batch entry point, arrays are parallel and each row emits TransactionAdded or TransactionError
+    function addTransactions(uint contract_idx, string[] memory extended_data, uint[] memory transact_dt, int[] memory transact_amt, string[] memory transact_data) public {
+        require(contract_idx < contracts.length, "Invalid contract index");
+        require(transact_dt.length == extended_data.length && transact_amt.length == extended_data.length && transact_data.length == extended_data.length, "Array length mismatch");
+        for (uint i = 0; i < extended_data.length; i++) {
+            _addTransaction(contract_idx, extended_data[i], transact_dt[i], transact_amt[i], transact_data[i]);
+        }
+    }
 
+    function _addTransaction(uint contract_idx, string memory extended_data, uint transact_dt, int transact_amt, string memory transact_data) internal {
         Transaction memory transact;
         transact.extended_data = extended_data;
         transact.transact_dt = transact_dt;
@@ -350,6 +440,14 @@ contract Delivery {
         artifacts[contract_idx].push(artifact);
     }
 
+    // number of rows a range getter returns, empty when offset is past the end
+    function pageSize(uint length, uint offset, uint limit) internal pure returns (uint) {
+        if (offset >= length) {
+            return 0;
+        }
+        return limit < length - offset ? limit : length - offset;
+    }
+
     function uintToString(uint v) internal pure returns (string memory) {
         if (v == 0) {
             return "0";